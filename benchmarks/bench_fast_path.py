@@ -0,0 +1,120 @@
+"""Compares the model path against the raw JSON fast path for a pod LIST.
+
+Builds a synthetic PodList response body once, then measures how long it takes
+to turn it into what the dashboard renders (PodSummary records) and the peak
+memory used on the way:
+
+  model: ApiClient.deserialize -> V1Pod graph -> PodSummary.from_model
+  fast:  json.loads -> PodSummary.from_dict
+
+Usage: python -m benchmarks.bench_fast_path --pods 10000
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from kubernetes import client
+
+from src.services.summaries import PodSummary
+
+
+class _Response:
+    """Just enough of a urllib3 response for ApiClient.deserialize."""
+    def __init__(self, data):
+        self.data = data
+
+
+def make_pod_list(count, namespaces=50):
+    items = []
+    for i in range(count):
+        ns = f"ns-{i % namespaces}"
+        app = f"app-{i % 200}"
+        items.append({
+            "metadata": {
+                "name": f"{app}-{i:06d}",
+                "namespace": ns,
+                "uid": f"00000000-0000-0000-0000-{i:012d}",
+                "resourceVersion": str(1000 + i),
+                "creationTimestamp": "2024-05-01T12:00:00Z",
+                "labels": {"app": app, "pod-template-hash": "5d8f7c9b6"},
+                "ownerReferences": [{
+                    "apiVersion": "apps/v1", "kind": "ReplicaSet", "name": f"{app}-5d8f7c9b6",
+                    "uid": f"10000000-0000-0000-0000-{i % 200:012d}", "controller": True,
+                }],
+            },
+            "spec": {
+                "nodeName": f"node-{i % 100}",
+                "containers": [{
+                    "name": "main",
+                    "image": f"registry.local/{app}:1.0.{i % 10}",
+                    "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}, "limits": {"cpu": "500m", "memory": "512Mi"}},
+                    "env": [{"name": f"VAR_{k}", "value": str(k)} for k in range(5)],
+                    "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                }],
+            },
+            "status": {
+                "phase": "Running",
+                "podIP": f"10.0.{i // 256 % 256}.{i % 256}",
+                "conditions": [
+                    {"type": t, "status": "True", "lastTransitionTime": "2024-05-01T12:00:05Z"}
+                    for t in ("Initialized", "Ready", "ContainersReady", "PodScheduled")
+                ],
+                "containerStatuses": [{
+                    "name": "main", "ready": True, "restartCount": i % 3,
+                    "image": f"registry.local/{app}:1.0.{i % 10}", "imageID": "sha256:abc",
+                    "state": {"running": {"startedAt": "2024-05-01T12:00:04Z"}},
+                }],
+            },
+        })
+    return json.dumps({"apiVersion": "v1", "kind": "PodList", "metadata": {"resourceVersion": "99"}, "items": items})
+
+
+def model_path(body):
+    pod_list = client.ApiClient().deserialize(_Response(body), "V1PodList")
+    return [PodSummary.from_model(pod) for pod in pod_list.items]
+
+
+def fast_path(body):
+    return [PodSummary.from_dict(item) for item in json.loads(body)["items"]]
+
+
+def measure(func, body, repeat):
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(body)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    gc.collect()
+    tracemalloc.start()
+    result = func(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, len(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pods", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    body = make_pod_list(args.pods)
+    print(f"{args.pods} pods, {len(body) / 1024 / 1024:.1f} MiB response body")
+
+    results = {}
+    for name, func in (("model", model_path), ("fast", fast_path)):
+        elapsed, peak, count = measure(func, body, args.repeat)
+        results[name] = (elapsed, peak)
+        print(f"{name:>6}: {elapsed * 1000:9.1f} ms  peak {peak / 1024 / 1024:8.1f} MiB  ({count} summaries)")
+
+    (model_time, model_peak), (fast_time, fast_peak) = results["model"], results["fast"]
+    print(f"speedup {model_time / fast_time:.1f}x, peak memory {model_peak / fast_peak:.1f}x lower")
+
+
+if __name__ == "__main__":
+    main()
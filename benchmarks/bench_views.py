@@ -0,0 +1,248 @@
+"""Measures how the dashboard, pod list and workload views scale with cluster size.
+
+For each --pods scale a fake API server (benchmarks.fake_apiserver) is started
+in a subprocess with a synthetic cluster of that size, KubeService is attached
+to it, and every view runs headless on a recording page (benchmarks.fake_page):
+
+  dashboard.refresh     DashboardView._refresh for each of its scheduler jobs
+  pod_list.refresh_rows PodList.refresh_rows over every pod of the cluster
+  controllers.refresh   ControllersView("deployments")._refresh, which builds
+                        the deployments grid for one namespace
+
+Each benchmark runs --repeat times; run 0 draws into an empty view, later runs
+redraw over the previous result, which is what a periodic refresh costs. Per
+run the wall time, process CPU time and the Flet updates it sent (controls
+added/changed/removed and bytes, flushed from the frame scheduler at the end of
+the run) are recorded. One more run under tracemalloc
+reports the peak of Python allocations; max RSS is the process high-water mark.
+
+With --replay the views run once against a session recorded with
+KUBESIGHT_RECORD (src/services/traffic.py), replayed as fast as possible.
+
+Results are written as JSON (by default benchmarks/results/views-<commit>.json);
+--compare prints the change against an earlier results file.
+
+Usage: python -m benchmarks.bench_views --pods 1000 10000 50000 [--fast-path] [--compare old.json]
+       python -m benchmarks.bench_views --replay session.jsonl.gz --namespace prod
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from benchmarks.fake_apiserver import attach
+from benchmarks.fake_page import make_page
+from src.services.frame_scheduler import frame_scheduler
+from src.services.kube_service import kube_service
+from src.services.prefetch import prefetcher
+
+
+def start_server(pods, namespaces, port):
+    process = subprocess.Popen(
+        [sys.executable, "-u", "-m", "benchmarks.fake_apiserver", "--pods", str(pods),
+         "--namespaces", str(namespaces), "--port", str(port), "--churn", "0"],
+        stdout=subprocess.PIPE, text=True,
+    )
+    for line in process.stdout:
+        if line.startswith("Serving on "):
+            return process, line.split()[-1]
+    raise RuntimeError(f"fake API server exited with {process.wait()}")
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def max_rss_bytes():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def run_once(func, connection):
+    # Coalesced reads would otherwise be served from the previous run
+    kube_service.coalescer.invalidate()
+    gc.collect()
+    connection.reset()
+    error = None
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        func()
+    except Exception as e:
+        error = str(e)
+    # Views only request their updates, send them within the measured run
+    frame_scheduler.flush()
+    result = {
+        "wall_s": round(time.perf_counter() - wall, 4),
+        "cpu_s": round(time.process_time() - cpu, 4),
+        **connection.snapshot(),
+    }
+    if error:
+        result["error"] = error
+    return result
+
+
+def measure(name, setup, repeat):
+    """Runs setup() -> (func, connection, info) and then func repeat times, plus once traced."""
+    func, connection, info = setup()
+    runs = [run_once(func, connection) for _ in range(repeat)]
+
+    tracemalloc.start()
+    run_once(func, connection)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    warm = runs[1:] or runs
+    return {
+        "benchmark": name,
+        **info,
+        "runs": runs,
+        "best_wall_s": min(r["wall_s"] for r in warm),
+        "best_cpu_s": min(r["cpu_s"] for r in warm),
+        "peak_traced_bytes": peak,
+        "max_rss_bytes": max_rss_bytes(),
+    }
+
+
+def setup_dashboard():
+    from src.views.dashboard.dashboard_view import DashboardView
+
+    page, connection = make_page()
+    view = DashboardView()
+    page.add(view)
+
+    def refresh():
+        errors = []
+        for sources, _, _ in view.JOBS.values():
+            try:
+                view._refresh(sources)
+            except RuntimeError as e:
+                errors.append(str(e))
+        if errors:
+            raise RuntimeError("; ".join(errors))
+    return refresh, connection, {}
+
+
+def setup_pod_list():
+    from src.views.dashboard.pod_list import PodList
+
+    page, connection = make_page()
+    pod_list = PodList()
+    page.add(pod_list)
+    pod_list.pods = kube_service.list_pod_summaries("", namespace="all")
+    return pod_list.refresh_rows, connection, {"rows": len(pod_list.pods)}
+
+
+def setup_controllers():
+    from src.views.controllers_view import ControllersView
+
+    page, connection = make_page()
+    view = ControllersView("deployments")
+    page.add(view)
+    return view._refresh, connection, {"deployments": len(kube_service.list_deployment_summaries())}
+
+
+BENCHMARKS = {
+    "dashboard.refresh": setup_dashboard,
+    "pod_list.refresh_rows": setup_pod_list,
+    "controllers.refresh": setup_controllers,
+}
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {(r["benchmark"], r["pods"]): r for r in json.load(f)["results"]}
+    print(f"\nvs {baseline_path}:")
+    for r in results:
+        old = baseline.get((r["benchmark"], r["pods"]))
+        if not old:
+            continue
+        changes = []
+        for key in ("best_wall_s", "best_cpu_s", "peak_traced_bytes"):
+            if old[key]:
+                changes.append(f"{key} {r[key] / old[key]:.2f}x")
+        old_bytes, new_bytes = old["runs"][-1]["bytes"], r["runs"][-1]["bytes"]
+        changes.append(f"update bytes {old_bytes} -> {new_bytes}")
+        print(f"  {r['benchmark']:<22} {r['pods']:>6} pods: " + ", ".join(changes))
+
+
+def run_all(args, results, **target):
+    for name in args.benchmarks:
+        result = {**target, **measure(name, BENCHMARKS[name], args.repeat)}
+        results.append(result)
+        last = result["runs"][-1]
+        print(f"{name:<22} {target['pods']:>6} pods: {result['best_wall_s'] * 1000:9.1f} ms wall "
+              f"{result['best_cpu_s'] * 1000:9.1f} ms cpu  peak {result['peak_traced_bytes'] / 2**20:7.1f} MiB  "
+              f"redraw +{last['added']} ~{last['changed']} -{last['removed']} controls, "
+              f"{last['bytes'] / 1024:.0f} KiB" + (f"  ERROR {last['error']}" if "error" in last else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pods", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--pods-per-namespace", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--fast-path", action="store_true", help="decode LIST JSON straight into summaries")
+    parser.add_argument("--namespace", default="ns-0000", help="active namespace for the workload views")
+    parser.add_argument("--replay", metavar="RECORDING",
+                        help="run against a recorded session (KUBESIGHT_RECORD) instead of synthetic clusters")
+    parser.add_argument("--port", type=int, default=18001)
+    parser.add_argument("--output", help="results file (default: benchmarks/results/views-<commit>.json)")
+    parser.add_argument("--compare", metavar="RESULTS", help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    kube_service.fast_path = args.fast_path
+    # Refreshes of the workload views would otherwise prefetch in the background while measured
+    prefetcher.enabled = False
+    results = []
+    if args.replay:
+        # The recorded cluster is whatever the session saw; its context is a placeholder
+        attach(kube_service, "http://recording.invalid")
+        kube_service.replay_traffic(args.replay, speed=0)
+        kube_service.set_namespace(args.namespace)
+        pods = len(kube_service.list_pod_summaries("", namespace="all"))
+        run_all(args, results, pods=pods, recording=args.replay)
+
+    for pods in [] if args.replay else args.pods:
+        namespaces = max(1, pods // args.pods_per_namespace)
+        server, url = start_server(pods, namespaces, args.port)
+        try:
+            attach(kube_service, url)
+            # Workload views read the active namespace, which here holds pods_per_namespace pods
+            kube_service.set_namespace(args.namespace)
+            run_all(args, results, pods=pods, namespaces=namespaces)
+        finally:
+            server.terminate()
+            server.wait()
+
+    commit = git_commit()
+    output = args.output or os.path.join("benchmarks", "results", f"views-{commit}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "commit": commit,
+            "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "fast_path": args.fast_path,
+            "repeat": args.repeat,
+            "results": results,
+        }, f, indent=2)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+"""A local stand-in for the Kubernetes API server, serving a SyntheticCluster.
+
+Covers what KubeSight calls: LIST (with limit/continue and equality label
+selectors), GET, WATCH (replayed from resourceVersion, 410 once it has fallen
+out of the event window), pod logs (tail and follow) and metrics.k8s.io for
+pods and nodes, for pods, nodes, namespaces, events, deployments, statefulsets
+and cronjobs. Writes are answered with 405. Responses are gzip-compressed when
+the client asks for it, and connections are kept alive like the real thing.
+
+A background churn thread restarts random pods at a fixed rate so watches and
+refreshes have something to do.
+
+Usage:
+  python -m benchmarks.fake_apiserver --pods 50000 --namespaces 500 --register
+
+--register saves a custom context pointing at the server (see
+KubeService.add_custom_context), so the app can be switched to it. In code,
+FakeApiServer(...).start() followed by server.attach(kube_service), or
+attach(kube_service, url) for a server in another process, does the same
+without touching storage/.
+"""
+import argparse
+import base64
+import collections
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.fake_cluster import API_VERSIONS, CLUSTER_SCOPED, SyntheticCluster
+
+
+GROUP_PREFIXES = {"/api/v1": "v1", "/apis/apps/v1": "apps/v1", "/apis/batch/v1": "batch/v1"}
+METRICS_PREFIX = "/apis/metrics.k8s.io/v1beta1"
+
+
+def _status(code, reason, message):
+    return {"kind": "Status", "apiVersion": "v1", "status": "Failure",
+            "code": code, "reason": reason, "message": message}
+
+
+def _parse_selector(selector):
+    """Equality-based label selector as (key, operator, value) terms; value None means 'exists'."""
+    terms = []
+    for term in filter(None, (t.strip() for t in (selector or "").split(","))):
+        if "!=" in term:
+            key, value = term.split("!=", 1)
+            terms.append((key.strip(), "!=", value.strip()))
+        elif "=" in term:
+            key, value = term.split("=", 1)
+            terms.append((key.strip(), "=", value.lstrip("=").strip()))
+        else:
+            terms.append((term.lstrip("!"), "!" if term.startswith("!") else "exists", None))
+    return terms
+
+
+def _matches(obj, terms):
+    labels = obj["metadata"].get("labels") or {}
+    for key, op, value in terms:
+        if op == "=" and labels.get(key) != value:
+            return False
+        if op == "!=" and labels.get(key) == value:
+            return False
+        if op == "exists" and key not in labels:
+            return False
+        if op == "!" and key in labels:
+            return False
+    return True
+
+
+def attach(service, url, name="fake-cluster"):
+    """Adds an in-memory custom context for a fake server to a KubeService and switches to it."""
+    service.contexts = [ctx for ctx in service.contexts if ctx['name'] != name]
+    service.contexts.append(service.custom_context_entry(
+        {"name": name, "server": url, "token": "fake-token", "insecure": True}
+    ))
+    service.clients.discard(name)
+    service.set_context(name)
+
+
+class FakeApiServer:
+    """Threaded HTTP server around a SyntheticCluster; start() returns once it is listening."""
+
+    def __init__(self, cluster=None, host="127.0.0.1", port=0, churn=10, log_rate=20, event_window=10000):
+        self.cluster = cluster or SyntheticCluster()
+        self.churn = churn  # pod changes per second
+        self.log_rate = log_rate  # followed log lines per second
+        self.requests = collections.Counter()  # (method, kind) -> count, for benchmarks
+        self._events = collections.deque(maxlen=event_window)  # (resource version, kind, type, json)
+        self._changed = threading.Condition()
+        self._running = False
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._running = True
+        threading.Thread(target=self._httpd.serve_forever, name="fake-apiserver", daemon=True).start()
+        if self.churn:
+            threading.Thread(target=self._churn, name="fake-apiserver-churn", daemon=True).start()
+        return self
+
+    def stop(self):
+        self._running = False
+        with self._changed:
+            self._changed.notify_all()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def attach(self, service, name="fake-cluster"):
+        attach(service, self.url, name)
+
+    def _churn(self):
+        interval = 1.0 / self.churn
+        while self._running:
+            time.sleep(interval)
+            with self._changed:
+                kind, event_type, obj = self.cluster.churn()
+                self._events.append((self.cluster.resource_version, kind, event_type,
+                                     self.cluster.stores[kind].encoded[(obj["metadata"]["namespace"], obj["metadata"]["name"])]))
+                self._changed.notify_all()
+
+    def events_since(self, resource_version, timeout):
+        """Waits up to timeout for changes newer than resource_version. None means it is too old."""
+        with self._changed:
+            if self._events and resource_version < self._events[0][0] - 1:
+                return None
+            if not self._events or self._events[-1][0] <= resource_version:
+                self._changed.wait(timeout)
+            newer = []
+            for event in reversed(self._events):
+                if event[0] <= resource_version:
+                    break
+                newer.append(event)
+            newer.reverse()
+            return newer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so pooled clients reuse connections
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def fake(self):
+        return self.server.fake
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            self._route(url.path.rstrip("/"), query)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away mid-stream (closed watch or log follow)
+            self.close_connection = True
+
+    def _write_method_not_allowed(self):
+        # Drain the body so the kept-alive connection stays usable
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self._send_json(405, _status(405, "MethodNotAllowed", "the fake API server is read-only"))
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = _write_method_not_allowed
+
+    def _route(self, path, query):
+        if path == "/version":
+            return self._send_json(200, {"major": "1", "minor": "30", "gitVersion": "v1.30.2-fake"})
+        if path.startswith(METRICS_PREFIX):
+            return self._metrics(path[len(METRICS_PREFIX):].strip("/").split("/"))
+
+        for prefix, api_version in GROUP_PREFIXES.items():
+            if path.startswith(prefix + "/"):
+                parts = path[len(prefix):].strip("/").split("/")
+                break
+        else:
+            return self._not_found(path)
+
+        # /{plural}, /{plural}/{name}, /namespaces/{ns}/{plural}[/{name}[/log]]
+        namespace = None
+        if parts[0] == "namespaces" and len(parts) >= 3:
+            namespace, parts = parts[1], parts[2:]
+        kind = parts[0]
+        if kind not in API_VERSIONS or API_VERSIONS[kind][0] != api_version:
+            return self._not_found(path)
+        # Namespaced kinds can be listed across namespaces, but not read by name
+        if kind in CLUSTER_SCOPED and namespace is not None:
+            return self._not_found(path)
+        if kind not in CLUSTER_SCOPED and namespace is None and len(parts) > 1:
+            return self._not_found(path)
+
+        if len(parts) == 1:
+            watching = query.get("watch") in ("true", "True", "1")
+            self.fake.requests[("watch" if watching else "list", kind)] += 1
+            if watching:
+                return self._watch(kind, namespace, query)
+            return self._list(kind, namespace, query)
+        if len(parts) == 2:
+            self.fake.requests[("get", kind)] += 1
+            return self._get(kind, namespace, parts[1])
+        if len(parts) == 3 and kind == "pods" and parts[2] == "log":
+            self.fake.requests[("log", kind)] += 1
+            return self._log(namespace, parts[1], query)
+        return self._not_found(path)
+
+    def _not_found(self, what):
+        self._send_json(404, _status(404, "NotFound", f"{what} not found"))
+
+    def _get(self, kind, namespace, name):
+        store = self.fake.cluster.stores[kind]
+        key = (namespace or "", name)
+        if key not in store.objects:
+            return self._not_found(f'{kind} "{name}"')
+        self._send_body(200, store.encoded[key].encode())
+
+    def _list(self, kind, namespace, query):
+        store = self.fake.cluster.stores[kind]
+        api_version, kind_name = API_VERSIONS[kind]
+        terms = _parse_selector(query.get("labelSelector"))
+        limit = int(query.get("limit") or 0)
+        resource_version = str(self.fake.cluster.resource_version)
+
+        start, end = store.key_range(namespace)
+        if query.get("continue"):
+            try:
+                token = json.loads(base64.urlsafe_b64decode(query["continue"]))
+                start, resource_version = token["start"], token["rv"]
+            except (ValueError, KeyError):
+                return self._send_json(400, _status(400, "BadRequest", "invalid continue token"))
+
+        items = []
+        index = start
+        while index < end and not (limit and len(items) >= limit):
+            key = store.keys[index]
+            if not terms or _matches(store.objects[key], terms):
+                items.append(store.encoded[key])
+            index += 1
+
+        metadata = {"resourceVersion": resource_version}
+        if index < end:
+            token = json.dumps({"start": index, "rv": resource_version}).encode()
+            metadata["continue"] = base64.urlsafe_b64encode(token).decode()
+            if not terms:
+                metadata["remainingItemCount"] = end - index
+        head = json.dumps({"apiVersion": api_version, "kind": kind_name + "List", "metadata": metadata})
+        # Items are pre-encoded, splice them in instead of encoding the whole list
+        body = head[:-1] + ',"items":[' + ",".join(items) + "]}"
+        self._send_body(200, body.encode())
+
+    def _metrics(self, parts):
+        namespace = None
+        if parts[0] == "namespaces" and len(parts) == 3:
+            namespace, parts = parts[1], parts[2:]
+        cluster = self.fake.cluster
+        if parts == ["pods"]:
+            kind, items = "PodMetricsList", cluster.pod_metrics(namespace)
+        elif parts == ["nodes"] and namespace is None:
+            kind, items = "NodeMetricsList", cluster.node_metrics()
+        else:
+            return self._not_found("/".join(parts))
+        self.fake.requests[("metrics", parts[0])] += 1
+        self._send_json(200, {"kind": kind, "apiVersion": "metrics.k8s.io/v1beta1", "metadata": {}, "items": items})
+
+    def _watch(self, kind, namespace, query):
+        resource_version = int(query.get("resourceVersion") or self.fake.cluster.resource_version)
+        deadline = time.monotonic() + int(query.get("timeoutSeconds") or 300)
+        terms = _parse_selector(query.get("labelSelector"))
+
+        self._start_stream()
+        while self.fake._running and time.monotonic() < deadline:
+            events = self.fake.events_since(resource_version, min(1.0, deadline - time.monotonic()))
+            if events is None:
+                error = _status(410, "Expired", f"too old resource version: {resource_version}")
+                self._write_chunk(json.dumps({"type": "ERROR", "object": error}) + "\n")
+                break
+            lines = []
+            for event_rv, event_kind, event_type, encoded in events:
+                resource_version = event_rv
+                if event_kind != kind:
+                    continue
+                if namespace or terms:
+                    obj = json.loads(encoded)
+                    if namespace and obj["metadata"].get("namespace") != namespace:
+                        continue
+                    if terms and not _matches(obj, terms):
+                        continue
+                lines.append('{"type":"%s","object":%s}\n' % (event_type, encoded))
+            if lines:
+                self._write_chunk("".join(lines))
+        self._end_stream()
+
+    def _log(self, namespace, name, query):
+        cluster = self.fake.cluster
+        if cluster.stores["pods"].get(namespace, name) is None:
+            return self._not_found(f'pods "{name}"')
+        timestamps = query.get("timestamps") in ("true", "True", "1")
+        total = cluster.log_lines
+        tail = int(query["tailLines"]) if query.get("tailLines") else total
+        # The backlog is spread over the last `total` seconds, one line per second
+        now = time.time()
+
+        def line(number, at):
+            text = cluster.log_line(name, number)
+            if timestamps:
+                stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(at)) + f".{int(at % 1 * 1e9):09d}Z"
+                text = f"{stamp} {text}"
+            return text + "\n"
+
+        backlog = [line(n, now - (total - n)) for n in range(max(0, total - tail), total)]
+        if query.get("follow") not in ("true", "True", "1"):
+            return self._send_body(200, "".join(backlog).encode(), content_type="text/plain")
+
+        self._start_stream(content_type="text/plain")
+        self._write_chunk("".join(backlog))
+        number = total
+        while self.fake._running:
+            time.sleep(1.0 / self.fake.log_rate)
+            self._write_chunk(line(number, time.time()))
+            number += 1
+        self._end_stream()
+
+    def _send_json(self, code, obj):
+        self._send_body(code, json.dumps(obj).encode())
+
+    def _send_body(self, code, body, content_type="application/json"):
+        encoding = None
+        if "gzip" in self.headers.get("Accept-Encoding", "") and len(body) > 1024:
+            body, encoding = gzip.compress(body, compresslevel=1), "gzip"
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _start_stream(self, content_type="application/json"):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _write_chunk(self, text):
+        data = text.encode()
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def _end_stream(self):
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pods", type=int, default=1000)
+    parser.add_argument("--namespaces", type=int, default=10)
+    parser.add_argument("--nodes", type=int, default=None)
+    parser.add_argument("--churn", type=float, default=10, help="pod changes per second")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--register", metavar="CONTEXT", nargs="?", const="fake-cluster",
+                        help="save a custom context for this server (default name: fake-cluster)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cluster = SyntheticCluster(pods=args.pods, namespaces=args.namespaces, nodes=args.nodes, seed=args.seed)
+    print(f"Generated {args.pods} pods in {args.namespaces} namespaces on {cluster.node_count} nodes "
+          f"in {time.perf_counter() - start:.1f}s")
+
+    server = FakeApiServer(cluster, host=args.host, port=args.port, churn=args.churn).start()
+    print(f"Serving on {server.url}", flush=True)
+
+    if args.register:
+        from src.services.kube_service import kube_service
+        ok, message = kube_service.add_custom_context(args.register, server.url, "fake-token", insecure=True)
+        print(message if ok else f"Context not registered: {message}")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
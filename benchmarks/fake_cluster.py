@@ -0,0 +1,316 @@
+"""Synthetic cluster contents for the fake API server.
+
+Objects are plain dicts shaped like the API server's JSON, generated
+deterministically from a seed so two runs at the same scale serve the same
+cluster. Pods belong to deployments and statefulsets spread evenly over the
+namespaces and are scheduled round-robin on the nodes; a small, fixed share of
+them is Pending or Failed.
+
+Every object is kept next to its serialized form, so a LIST of 50k pods joins
+strings instead of encoding 50k dicts again.
+"""
+import bisect
+import datetime
+import json
+import random
+
+
+KINDS = ("namespaces", "nodes", "pods", "events", "deployments", "statefulsets", "cronjobs")
+CLUSTER_SCOPED = ("namespaces", "nodes")
+
+API_VERSIONS = {
+    "namespaces": ("v1", "Namespace"),
+    "nodes": ("v1", "Node"),
+    "pods": ("v1", "Pod"),
+    "events": ("v1", "Event"),
+    "deployments": ("apps/v1", "Deployment"),
+    "statefulsets": ("apps/v1", "StatefulSet"),
+    "cronjobs": ("batch/v1", "CronJob"),
+}
+
+
+def _timestamp(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class ObjectStore:
+    """Objects of one kind, sorted by (namespace, name) as a LIST returns them."""
+
+    def __init__(self):
+        self.keys = []
+        self.objects = {}
+        self.encoded = {}
+
+    def put(self, obj):
+        metadata = obj["metadata"]
+        key = (metadata.get("namespace") or "", metadata["name"])
+        if key not in self.objects:
+            bisect.insort(self.keys, key)
+        self.objects[key] = obj
+        self.encoded[key] = json.dumps(obj, separators=(",", ":"))
+        return key
+
+    def get(self, namespace, name):
+        return self.objects.get((namespace or "", name))
+
+    def key_range(self, namespace=None):
+        """Index range of the keys in one namespace, or all of them."""
+        if not namespace:
+            return 0, len(self.keys)
+        return (
+            bisect.bisect_left(self.keys, (namespace, "")),
+            bisect.bisect_left(self.keys, (namespace + "\0", "")),
+        )
+
+    def __len__(self):
+        return len(self.keys)
+
+
+class SyntheticCluster:
+    """A generated cluster: namespaces, nodes, workloads with their pods, cronjobs and events.
+
+    The defaults make a mid-sized cluster; pods=50000, namespaces=500 is the
+    large-fleet case. resource_version is global and bumped on every change,
+    like etcd's revision.
+    """
+
+    def __init__(self, pods=1000, namespaces=10, nodes=None, pods_per_workload=10,
+                 statefulset_share=0.2, events_per_namespace=5, log_lines=1000, seed=1):
+        self.pod_count = pods
+        self.namespace_count = namespaces
+        self.node_count = nodes or max(3, pods // 100)
+        self.pods_per_workload = pods_per_workload
+        self.statefulset_share = statefulset_share
+        self.events_per_namespace = events_per_namespace
+        self.log_lines = log_lines
+        self.random = random.Random(seed)
+        self.created = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=3)
+        self.resource_version = 1
+        self.stores = {kind: ObjectStore() for kind in KINDS}
+        self._generate()
+
+    def next_resource_version(self):
+        self.resource_version += 1
+        return str(self.resource_version)
+
+    def _metadata(self, name, namespace=None, labels=None, age=None):
+        metadata = {
+            "name": name,
+            "uid": f"{self.random.getrandbits(32):08x}-0000-4000-8000-{self.random.getrandbits(48):012x}",
+            "resourceVersion": self.next_resource_version(),
+            "creationTimestamp": _timestamp(self.created + datetime.timedelta(seconds=age or 0)),
+        }
+        if namespace:
+            metadata["namespace"] = namespace
+        if labels:
+            metadata["labels"] = labels
+        return metadata
+
+    def _generate(self):
+        namespaces = [f"ns-{i:04d}" for i in range(self.namespace_count)]
+        for ns in namespaces:
+            self.put("namespaces", {
+                "apiVersion": "v1", "kind": "Namespace",
+                "metadata": self._metadata(ns, labels={"kubernetes.io/metadata.name": ns}),
+                "status": {"phase": "Active"},
+            })
+
+        for i in range(self.node_count):
+            self.put("nodes", self._node(f"node-{i:04d}"))
+
+        workloads = max(1, -(-self.pod_count // self.pods_per_workload))
+        statefulsets = int(workloads * self.statefulset_share)
+        pod_number = 0
+        for w in range(workloads):
+            kind = "statefulsets" if w < statefulsets else "deployments"
+            ns = namespaces[w % len(namespaces)]
+            name = f"{'db' if kind == 'statefulsets' else 'app'}-{w:05d}"
+            replicas = min(self.pods_per_workload, self.pod_count - pod_number)
+            workload = self.put(kind, self._workload(kind, name, ns, replicas))
+            for r in range(replicas):
+                pod_name = f"{name}-{r}" if kind == "statefulsets" else f"{name}-5d8f7c9b6-{r:05d}"
+                self.put("pods", self._pod(pod_name, ns, workload, pod_number))
+                pod_number += 1
+
+        for n, ns in enumerate(namespaces):
+            self.put("cronjobs", self._cronjob(f"cleanup-{n:04d}", ns))
+            for e in range(self.events_per_namespace):
+                self.put("events", self._event(f"event-{n:04d}-{e:03d}", ns, e))
+
+    def put(self, kind, obj):
+        self.stores[kind].put(obj)
+        return obj
+
+    def _node(self, name):
+        return {
+            "apiVersion": "v1", "kind": "Node",
+            "metadata": self._metadata(name, labels={"kubernetes.io/hostname": name, "kubernetes.io/os": "linux"}),
+            "spec": {"podCIDR": "10.244.0.0/24"},
+            "status": {
+                "capacity": {"cpu": "16", "memory": "65842000Ki", "pods": "110"},
+                "allocatable": {"cpu": "15800m", "memory": "64000Mi", "pods": "110"},
+                "conditions": [
+                    {"type": "Ready", "status": "True", "reason": "KubeletReady",
+                     "lastTransitionTime": _timestamp(self.created)},
+                ],
+                "nodeInfo": {
+                    "kubeletVersion": "v1.30.2", "osImage": "Ubuntu 22.04.4 LTS",
+                    "containerRuntimeVersion": "containerd://1.7.18", "architecture": "amd64",
+                    "operatingSystem": "linux", "kernelVersion": "6.5.0", "kubeProxyVersion": "v1.30.2",
+                    "machineID": name, "systemUUID": name, "bootID": name,
+                },
+                "addresses": [{"type": "Hostname", "address": name}],
+            },
+        }
+
+    def _container(self, app):
+        return {
+            "name": "main",
+            "image": f"registry.local/{app}:1.0.{self.random.randrange(10)}",
+            "resources": {
+                "requests": {"cpu": "100m", "memory": "128Mi"},
+                "limits": {"cpu": "500m", "memory": "512Mi"},
+            },
+            "env": [{"name": "LOG_LEVEL", "value": "info"}],
+            "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+        }
+
+    def _workload(self, kind, name, namespace, replicas):
+        api_version, kind_name = API_VERSIONS[kind]
+        labels = {"app": name}
+        spec = {
+            "replicas": replicas,
+            "selector": {"matchLabels": labels},
+            "template": {"metadata": {"labels": labels}, "spec": {"containers": [self._container(name)]}},
+        }
+        if kind == "statefulsets":
+            spec["serviceName"] = name
+        return {
+            "apiVersion": api_version, "kind": kind_name,
+            "metadata": self._metadata(name, namespace, labels, age=self.random.randrange(3600)),
+            "spec": spec,
+            "status": {
+                "replicas": replicas, "readyReplicas": replicas, "availableReplicas": replicas,
+                "updatedReplicas": replicas, "observedGeneration": 1,
+            },
+        }
+
+    def _pod(self, name, namespace, workload, number):
+        app = workload["metadata"]["name"]
+        # 2% Pending, 1% Failed, the rest Running
+        phase = "Pending" if number % 50 == 7 else "Failed" if number % 100 == 13 else "Running"
+        running = phase == "Running"
+        ready = "True" if running else "False"
+        owner_kind = "StatefulSet" if workload["kind"] == "StatefulSet" else "ReplicaSet"
+        owner_name = app if owner_kind == "StatefulSet" else f"{app}-5d8f7c9b6"
+        container = self._container(app)
+        state = (
+            {"running": {"startedAt": _timestamp(self.created)}} if running
+            else {"waiting": {"reason": "ContainerCreating"}} if phase == "Pending"
+            else {"terminated": {"exitCode": 1, "reason": "Error"}}
+        )
+        return {
+            "apiVersion": "v1", "kind": "Pod",
+            "metadata": {
+                **self._metadata(name, namespace, {"app": app, "pod-template-hash": "5d8f7c9b6"},
+                                 age=self.random.randrange(7200)),
+                "ownerReferences": [{
+                    "apiVersion": "apps/v1", "kind": owner_kind, "name": owner_name,
+                    "uid": workload["metadata"]["uid"], "controller": True,
+                }],
+            },
+            "spec": {
+                "nodeName": f"node-{number % self.node_count:04d}" if phase != "Pending" else None,
+                "containers": [container],
+            },
+            "status": {
+                "phase": phase,
+                "podIP": f"10.{number // 65536 % 256}.{number // 256 % 256}.{number % 256}" if running else None,
+                "conditions": [
+                    {"type": t, "status": ready, "lastTransitionTime": _timestamp(self.created)}
+                    for t in ("Ready", "ContainersReady")
+                ],
+                "containerStatuses": [{
+                    "name": "main", "ready": running, "restartCount": self.random.randrange(3),
+                    "image": container["image"], "imageID": "sha256:0123456789abcdef",
+                    "state": state,
+                }],
+            },
+        }
+
+    def _cronjob(self, name, namespace):
+        return {
+            "apiVersion": "batch/v1", "kind": "CronJob",
+            "metadata": self._metadata(name, namespace, {"app": name}),
+            "spec": {
+                "schedule": "*/15 * * * *",
+                "jobTemplate": {"spec": {"template": {"spec": {
+                    "containers": [self._container(name)], "restartPolicy": "OnFailure",
+                }}}},
+            },
+            "status": {"lastScheduleTime": _timestamp(self.created)},
+        }
+
+    def _event(self, name, namespace, number):
+        reason, message, event_type = self.random.choice((
+            ("Scheduled", "Successfully assigned pod to node", "Normal"),
+            ("Pulled", "Container image already present on machine", "Normal"),
+            ("BackOff", "Back-off restarting failed container", "Warning"),
+            ("Unhealthy", "Readiness probe failed: HTTP probe failed with statuscode: 503", "Warning"),
+        ))
+        seen = _timestamp(self.created + datetime.timedelta(minutes=number))
+        return {
+            "apiVersion": "v1", "kind": "Event",
+            "metadata": self._metadata(name, namespace),
+            "involvedObject": {"kind": "Pod", "namespace": namespace, "name": name},
+            "reason": reason, "message": message, "type": event_type, "count": 1,
+            "firstTimestamp": seen, "lastTimestamp": seen,
+            "source": {"component": "kubelet"},
+        }
+
+    def churn(self):
+        """Changes one random pod the way a restart would. Returns (kind, event type, object)."""
+        store = self.stores["pods"]
+        pod = store.objects[store.keys[self.random.randrange(len(store))]]
+        status = pod["status"]["containerStatuses"][0]
+        status["restartCount"] += 1
+        status["state"] = {"running": {"startedAt": _timestamp(datetime.datetime.now(datetime.timezone.utc))}}
+        pod["metadata"]["resourceVersion"] = self.next_resource_version()
+        store.put(pod)
+        return "pods", "MODIFIED", pod
+
+    def pod_metrics(self, namespace=None):
+        """metrics.k8s.io PodMetrics for the running pods, with usage jittering per call."""
+        store = self.stores["pods"]
+        window_end = _timestamp(datetime.datetime.now(datetime.timezone.utc))
+        items = []
+        start, end = store.key_range(namespace)
+        for key in store.keys[start:end]:
+            pod = store.objects[key]
+            if pod["status"]["phase"] != "Running":
+                continue
+            items.append({
+                "metadata": {"name": key[1], "namespace": key[0], "labels": pod["metadata"].get("labels")},
+                "timestamp": window_end, "window": "30s",
+                "containers": [{"name": "main", "usage": {
+                    "cpu": f"{self.random.randrange(1, 400) * 1000}u",
+                    "memory": f"{self.random.randrange(32, 480)}Mi",
+                }}],
+            })
+        return items
+
+    def node_metrics(self):
+        window_end = _timestamp(datetime.datetime.now(datetime.timezone.utc))
+        return [
+            {
+                "metadata": {"name": key[1]},
+                "timestamp": window_end, "window": "30s",
+                "usage": {"cpu": f"{self.random.randrange(500, 14000)}m", "memory": f"{self.random.randrange(4, 60)}Gi"},
+            }
+            for key in self.stores["nodes"].keys
+        ]
+
+    def log_line(self, pod_name, number):
+        status = (200, 200, 200, 201, 404, 500)[number % 6]
+        level = "ERROR" if status == 500 else "INFO"
+        return f"{level} [{pod_name}] GET /api/items/{number % 1000} {status} {number % 97 + 1}ms"
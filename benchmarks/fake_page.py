@@ -0,0 +1,70 @@
+"""A headless Flet page that records what would be sent to the client.
+
+Views are mounted on a real ft.Page, so update() goes through Flet's own diff
+(build_update_commands); only the transport is replaced. RecordingConnection
+counts the update batches, the controls they add, change and remove, and their
+encoded size, which is what a refresh costs on the wire.
+"""
+import asyncio
+import json
+
+import flet as ft
+from flet.core.local_connection import LocalConnection
+from flet.core.protocol import (
+    AddPageControlsPayload,
+    CommandEncoder,
+    PageCommandsBatchResponsePayload,
+    RemoveControlPayload,
+    UpdateControlPropsPayload,
+)
+
+
+class RecordingConnection(LocalConnection):
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def reset(self):
+        self.updates = 0  # page.update() calls that reached the connection
+        self.added = 0  # controls created on the client
+        self.changed = 0  # controls whose properties were sent again
+        self.removed = 0
+        self.bytes = 0  # JSON size of the batches a client would receive
+
+    def snapshot(self):
+        return {
+            "updates": self.updates, "added": self.added, "changed": self.changed,
+            "removed": self.removed, "bytes": self.bytes,
+        }
+
+    def send_command(self, session_id, command):
+        return self.send_commands(session_id, [command])
+
+    def send_commands(self, session_id, commands):
+        results = []
+        messages = []
+        for command in commands:
+            result, message = self._process_command(command)
+            if command.name in ["add", "get"]:
+                results.append(result)
+            if message:
+                messages.append(message)
+        self.updates += 1
+        for message in messages:
+            payload = message.payload
+            if isinstance(payload, AddPageControlsPayload):
+                self.added += len(payload.controls)
+            elif isinstance(payload, UpdateControlPropsPayload):
+                self.changed += len(payload.props)
+            elif isinstance(payload, RemoveControlPayload):
+                self.removed += len(payload.ids)
+        if messages:
+            self.bytes += len(json.dumps(messages, cls=CommandEncoder, separators=(",", ":")))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+
+def make_page():
+    """Returns (page, connection) for a page no client is attached to."""
+    connection = RecordingConnection()
+    page = ft.Page(connection, session_id="bench", loop=asyncio.new_event_loop())
+    return page, connection
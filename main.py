@@ -1,6 +1,19 @@
+import atexit
+import os
+
 import flet as ft
 
 from src.shell.layout import AppLayout
+from src.services.kube_service import kube_service
+from src.services.metrics_store import metrics_sampler
+from src.services.scheduler import scheduler
+
+def on_window_event(e):
+    # Views stop polling while nobody is looking; the metrics sampler keeps going
+    if e.type in (ft.WindowEventType.MINIMIZE, ft.WindowEventType.HIDE, ft.WindowEventType.BLUR):
+        scheduler.set_window_active(False)
+    elif e.type in (ft.WindowEventType.RESTORE, ft.WindowEventType.SHOW, ft.WindowEventType.FOCUS):
+        scheduler.set_window_active(True)
 
 def main(page: ft.Page):
     page.title = "KubeSight"
@@ -8,9 +21,23 @@ def main(page: ft.Page):
     page.theme_mode = ft.ThemeMode.DARK
     
     page.window_icon = "KubeSightLogo.ico"
-    
+    page.window.on_event = on_window_event
+
+    # KUBESIGHT_RECORD=session.jsonl.gz captures the API traffic, KUBESIGHT_REPLAY plays one back
+    if os.environ.get("KUBESIGHT_REPLAY"):
+        kube_service.replay_traffic(os.environ["KUBESIGHT_REPLAY"], float(os.environ.get("KUBESIGHT_REPLAY_SPEED", 1)))
+    elif os.environ.get("KUBESIGHT_RECORD"):
+        kube_service.record_traffic(os.environ["KUBESIGHT_RECORD"])
+
+    scheduler.start()
     layout = AppLayout(page)
     page.add(layout)
 
+    # Views read from the watch-backed caches once they are synced
+    kube_service.start_informers()
+    metrics_sampler.start()
+    # Writes the history buckets still filling when the app exits
+    atexit.register(metrics_sampler.stop)
+
 if __name__ == "__main__":
     ft.app(target=main, assets_dir="assets")
@@ -0,0 +1,86 @@
+import socket
+import threading
+
+from kubernetes import client
+from urllib3.connection import HTTPConnection
+
+from src.services.instrumentation import instrument
+
+
+class ApiClientPool:
+    """One long-lived ApiClient per kube context, built on its own Configuration.
+
+    The global default configuration is never touched, so switching contexts is
+    a dict lookup and every context keeps its warm connections. Each client's
+    urllib3 pools hold up to pool_maxsize connections per host (enough for the
+    parallel refresh jobs, so connections are reused instead of churned) with
+    TCP keep-alive on. With gzip, list responses are requested compressed;
+    watches read the raw stream and ask for an uncompressed client. A transport
+    (TrafficRecorder or TrafficReplayer) wraps every client's pool manager, and
+    with metrics every call is recorded into those ApiMetrics.
+    """
+
+    def __init__(self, kubeconfig, pool_maxsize=32, keepalive=True, gzip=False, metrics=None):
+        self.kubeconfig = kubeconfig  # KubeconfigCache, source of kubeconfig contexts' Configuration
+        self.pool_maxsize = pool_maxsize
+        self.keepalive = keepalive
+        self.gzip = gzip
+        self.metrics = metrics
+        self.transport = None
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get(self, context, compressed=None):
+        """Returns the ApiClient of a context entry (as in KubeService.contexts); None means the default config."""
+        compressed = self.gzip if compressed is None else compressed
+        key = (context['name'] if context else None, compressed)
+        with self._lock:
+            api_client = self._clients.get(key)
+            if api_client is None:
+                api_client = self._clients[key] = self._build(context, compressed)
+            return api_client
+
+    def discard(self, context_name):
+        self.kubeconfig.discard(context_name)
+        with self._lock:
+            for key in [k for k in self._clients if k[0] == context_name]:
+                self._clients.pop(key).close()
+
+    def clear(self):
+        with self._lock:
+            for api_client in self._clients.values():
+                api_client.close()
+            self._clients = {}
+
+    def set_transport(self, transport):
+        """Routes all clients through transport from now on; None goes back to the network."""
+        with self._lock:
+            self.transport = transport
+        self.clear()
+
+    def _build(self, context, compressed):
+        if context and context.get('is_custom'):
+            configuration = client.Configuration()
+            ctx_config = context['config']
+            configuration.host = ctx_config['server']
+            configuration.verify_ssl = not ctx_config.get('insecure', False)
+            configuration.api_key = {"authorization": "Bearer " + ctx_config['token']}
+        elif context:
+            configuration = self.kubeconfig.configuration(context['name'])
+        else:
+            configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = self.pool_maxsize
+
+        api_client = client.ApiClient(configuration)
+        if self.keepalive:
+            # Applies to every connection pool the manager creates from here on
+            api_client.rest_client.pool_manager.connection_pool_kw["socket_options"] = (
+                HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            )
+        if compressed:
+            api_client.set_default_header("Accept-Encoding", "gzip")
+        if self.transport:
+            api_client.rest_client.pool_manager = self.transport.wrap(api_client.rest_client.pool_manager)
+        if self.metrics:
+            instrument(api_client, self.metrics)
+        return api_client
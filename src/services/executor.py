@@ -0,0 +1,45 @@
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import time
+
+# Shared pool for short API calls made on behalf of views. Long-lived work such
+# as watches and log streams keeps its own threads so it cannot starve this pool.
+shared_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="kubesight-io")
+
+# error is None on success, a TimeoutError if the deadline passed first; elapsed is in seconds
+CallResult = namedtuple("CallResult", ["name", "value", "error", "elapsed"])
+
+
+def _timed(func):
+    start = time.monotonic()
+    return func(), time.monotonic() - start
+
+
+def fan_out(calls, deadlines=None, default_deadline=10.0, executor=shared_executor):
+    """Runs named zero-argument calls concurrently and yields a CallResult for each as it finishes.
+
+    deadlines maps a call name to seconds from submission. A call still running
+    at its deadline is reported with a TimeoutError and its result is dropped;
+    the thread is not interrupted, it just finishes unobserved.
+    """
+    start = time.monotonic()
+    deadlines = deadlines or {}
+    futures = {executor.submit(_timed, func): name for name, func in calls.items()}
+    due = {future: start + deadlines.get(name, default_deadline) for future, name in futures.items()}
+
+    pending = set(futures)
+    while pending:
+        timeout = max(0, min(due[f] for f in pending) - time.monotonic())
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                value, elapsed = future.result()
+                yield CallResult(futures[future], value, None, elapsed)
+            except Exception as e:
+                yield CallResult(futures[future], None, e, time.monotonic() - start)
+
+        now = time.monotonic()
+        for future in [f for f in pending if due[f] <= now]:
+            pending.discard(future)
+            future.cancel()
+            yield CallResult(futures[future], None, TimeoutError(f"{futures[future]} exceeded its deadline"), now - start)
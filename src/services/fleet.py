@@ -0,0 +1,92 @@
+from collections import Counter
+import time
+
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from src.services.executor import fan_out
+from src.services.instrumentation import read_json
+from src.services.kube_service import kube_service
+from src.services.pagination import paginate
+from src.services.quantity import to_millicores, to_bytes, usage_arrays
+from src.services.summaries import NodeSummary
+
+
+class ClusterSummary:
+    """Health of one context for the fleet overview; reachable is False if any call failed."""
+    __slots__ = (
+        "context", "reachable", "error", "nodes_ready", "nodes_total", "pod_phases",
+        "cpu_usage", "cpu_capacity", "memory_usage", "memory_capacity", "elapsed",
+    )
+
+    def __init__(self, context, reachable=False, error=None):
+        self.context = context
+        self.reachable = reachable
+        self.error = error
+        self.nodes_ready = 0
+        self.nodes_total = 0
+        self.pod_phases = Counter()
+        self.cpu_usage = 0.0  # millicores
+        self.cpu_capacity = 0.0
+        self.memory_usage = 0.0  # bytes
+        self.memory_capacity = 0.0
+        self.elapsed = None
+
+    @property
+    def cpu_percent(self):
+        return self.cpu_usage / self.cpu_capacity if self.cpu_capacity else 0
+
+    @property
+    def memory_percent(self):
+        return self.memory_usage / self.memory_capacity if self.memory_capacity else 0
+
+
+def collect_cluster(context, request_timeout=10):
+    """Summarizes one context through its own pooled client. Raises on API errors."""
+    start = time.monotonic()
+    api_client = kube_service.clients.get(context)
+    v1 = client.CoreV1Api(api_client)
+    summary = ClusterSummary(context['name'], reachable=True)
+
+    # Raw JSON all the way: only a handful of fields are read from every object
+    nodes = v1.list_node(_preload_content=False, _request_timeout=request_timeout)
+    for node in read_json(nodes).get('items') or []:
+        node = NodeSummary.from_dict(node)
+        summary.nodes_total += 1
+        summary.nodes_ready += node.ready
+        summary.cpu_capacity += to_millicores(node.capacity.get('cpu'))
+        summary.memory_capacity += to_bytes(node.capacity.get('memory'))
+
+    for page in paginate(v1.list_pod_for_all_namespaces, kube_service.list_chunk_size, raw=True,
+                         _request_timeout=request_timeout):
+        summary.pod_phases.update((item.get('status') or {}).get('phase') or "Unknown" for item in page.get('items') or [])
+
+    try:
+        metrics = client.CustomObjectsApi(api_client).list_cluster_custom_object(
+            group="metrics.k8s.io", version="v1beta1", plural="nodes", _request_timeout=request_timeout
+        )
+        _, cpu, memory = usage_arrays({item['metadata']['name']: item for item in metrics.get('items', [])})
+        summary.cpu_usage = sum(cpu)
+        summary.memory_usage = sum(memory)
+    except ApiException as e:
+        # metrics-server is optional, the cluster itself is still reachable
+        print(f"No node metrics for {context['name']}: {e.reason}")
+
+    summary.elapsed = time.monotonic() - start
+    return summary
+
+
+def collect_fleet(contexts, deadline=15, request_timeout=10):
+    """Collects every context concurrently and yields a ClusterSummary per context as it completes.
+
+    A context that fails or misses the deadline is yielded as unreachable without
+    holding up the others.
+    """
+    calls = {ctx['name']: (lambda ctx=ctx: collect_cluster(ctx, request_timeout)) for ctx in contexts}
+    for result in fan_out(calls, default_deadline=deadline):
+        if result.error:
+            summary = ClusterSummary(result.name, error=str(result.error) or type(result.error).__name__)
+            summary.elapsed = result.elapsed
+            yield summary
+        else:
+            yield result.value
@@ -0,0 +1,95 @@
+import threading
+import time
+
+
+class FrameScheduler:
+    """Coalesces control updates from any thread into one page.update(*controls) per frame.
+
+    Widgets call request(self) instead of self.update(). Dirty controls are
+    collected for frame_seconds from the first request of a frame and then
+    sent per page in a single batch, so a refresh that touches five widgets
+    costs one websocket message instead of five. A control whose ancestor is
+    in the same batch is left to the ancestor's diff; controls that were
+    unmounted in the meantime are dropped.
+    """
+
+    def __init__(self, frame_seconds=0.05):
+        self.frame_seconds = frame_seconds
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()  # One frame at a time, flush() callers wait for the frame thread
+        self._dirty = {}  # id -> control, in request order
+        self._frame_start = 0.0  # when the first control of the pending frame was requested
+        self._thread = None
+        self.requests = 0  # request() calls
+        self.sent = 0  # controls passed to page.update
+        self.frames = 0  # page.update batches
+
+    def request(self, *controls):
+        with self._cond:
+            if not self._dirty:
+                self._frame_start = time.monotonic()
+            for control in controls:
+                self._dirty[id(control)] = control
+            self.requests += len(controls)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="frames", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    @property
+    def merged(self):
+        """Requested updates that did not need a page.update of their own."""
+        return self.requests - self.frames
+
+    def stats(self):
+        return {"requests": self.requests, "frames": self.frames, "controls": self.sent, "merged": self.merged}
+
+    def reset_stats(self):
+        with self._cond:
+            self.requests = self.sent = self.frames = 0
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._dirty:
+                    self._cond.wait()
+                delay = self._frame_start + self.frame_seconds - time.monotonic()
+            if delay > 0:
+                # Let the rest of the refresh mark its controls dirty too
+                time.sleep(delay)
+            self.flush()
+
+    def flush(self):
+        """Sends every pending update now; also what the frame thread runs."""
+        with self._flush_lock:
+            with self._cond:
+                dirty = list(self._dirty.values())
+                self._dirty.clear()
+            pages = {}
+            for control in dirty:
+                if control.page is not None:
+                    pages.setdefault(id(control.page), (control.page, []))[1].append(control)
+
+            for page, controls in pages.values():
+                pending = {id(control) for control in controls}
+                batch = [control for control in controls if not self._has_pending_ancestor(control, pending)]
+                try:
+                    page.update(*batch)
+                except Exception as e:
+                    print(f"Error updating controls: {e}")
+                    continue
+                with self._cond:
+                    self.frames += 1
+                    self.sent += len(batch)
+
+    def _has_pending_ancestor(self, control, pending):
+        parent = control.parent
+        while parent is not None:
+            if id(parent) in pending:
+                return True
+            parent = parent.parent
+        return False
+
+
+# Singleton instance
+frame_scheduler = FrameScheduler()
@@ -0,0 +1,184 @@
+import bisect
+import threading
+import time
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+from src.services.pagination import paginate
+
+
+class Informer:
+    """Keeps a local, thread-safe copy of one resource kind in sync with the cluster.
+
+    The store is seeded with a single LIST and then kept current by a WATCH that
+    resumes from the last seen resourceVersion. Listeners are called with
+    (kind, event_type, obj) for every change, and with ("SYNC", None) after a relist.
+    """
+
+    def __init__(self, kind, list_func, watch_timeout=300, page_size=500):
+        self.kind = kind
+        self._list_func = list_func
+        self._watch_timeout = watch_timeout
+        self._page_size = page_size
+
+        self._store = {}
+        self._keys = []  # keys of _store, sorted, so list() never sorts
+        self._lock = threading.RLock()
+        self._listeners = []
+        self._listeners_lock = threading.Lock()
+        self._synced = threading.Event()
+
+        self.resource_version = None
+        self.version = 0  # Bumped on every change, cheap cache key for consumers
+        self._relists = 0
+        self._namespace_versions = {}  # namespace -> changes since the last relist
+        self._running = False
+        self._watch = None
+        self._thread = None
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=f"informer-{self.kind}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Ends the watch; listeners are dropped, so a stopped informer never notifies again."""
+        self._running = False
+        with self._listeners_lock:
+            self._listeners = []
+        if self._watch:
+            self._watch.stop()
+
+    def has_synced(self):
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout=None):
+        return self._synced.wait(timeout)
+
+    def subscribe(self, callback):
+        """Registers a change listener. Returns a function that removes it."""
+        with self._listeners_lock:
+            self._listeners.append(callback)
+
+        def unsubscribe():
+            with self._listeners_lock:
+                if callback in self._listeners:
+                    self._listeners.remove(callback)
+        return unsubscribe
+
+    def list(self, namespace=None):
+        """Returns a snapshot of the stored objects, optionally for one namespace."""
+        with self._lock:
+            # In key order, the same namespace/name order a LIST returns
+            keys = self._keys
+            if namespace and namespace != "all":
+                # One namespace's "namespace/name" keys are a contiguous range; "0" sorts right after "/"
+                keys = keys[bisect.bisect_left(keys, f"{namespace}/"):bisect.bisect_left(keys, f"{namespace}0")]
+            return [self._store[key] for key in keys]
+
+    def namespace_version(self, namespace):
+        """Changes whenever an object of one namespace does; unlike version, not on changes elsewhere."""
+        with self._lock:
+            return self._relists, self._namespace_versions.get(namespace, 0)
+
+    def get(self, name, namespace=None):
+        with self._lock:
+            return self._store.get(self._key(namespace, name))
+
+    def _key(self, namespace, name):
+        return f"{namespace}/{name}" if namespace else name
+
+    def _object_key(self, obj):
+        return self._key(obj.metadata.namespace, obj.metadata.name)
+
+    def _run(self):
+        backoff = 1
+        while self._running:
+            try:
+                if self.resource_version is None:
+                    self._relist()
+                self._watch_once()
+                backoff = 1
+            except ApiException as e:
+                if e.status == 410:
+                    # resourceVersion too old, the only way back is a fresh LIST
+                    self.resource_version = None
+                    continue
+                print(f"Informer {self.kind} watch error: {e}")
+                self._sleep(backoff)
+                backoff = min(backoff * 2, 30)
+            except Exception as e:
+                print(f"Unexpected informer {self.kind} error: {e}")
+                self._sleep(backoff)
+                backoff = min(backoff * 2, 30)
+
+    def _sleep(self, seconds):
+        deadline = time.monotonic() + seconds
+        while self._running and time.monotonic() < deadline:
+            time.sleep(0.1)
+
+    def _relist(self):
+        # Seed in pages so a large cluster never has to be sent in one response
+        store = {}
+        resource_version = None
+        for page in paginate(self._list_func, self._page_size):
+            for obj in page.items:
+                store[self._object_key(obj)] = obj
+            resource_version = page.metadata.resource_version
+        keys = sorted(store)
+        with self._lock:
+            self._store = store
+            self._keys = keys
+            self.resource_version = resource_version
+            self.version += 1
+            self._relists += 1
+            self._namespace_versions = {}
+        self._synced.set()
+        self._notify("SYNC", None)
+
+    def _watch_once(self):
+        self._watch = watch.Watch()
+        stream = self._watch.stream(
+            self._list_func,
+            resource_version=self.resource_version,
+            timeout_seconds=self._watch_timeout,
+            allow_watch_bookmarks=True,
+        )
+        for event in stream:
+            if not self._running:
+                self._watch.stop()
+                break
+            self._apply(event['type'], event['object'])
+
+    def _apply(self, event_type, obj):
+        with self._lock:
+            self.resource_version = obj.metadata.resource_version
+            if event_type == "BOOKMARK":
+                return
+            key = self._object_key(obj)
+            if event_type == "DELETED":
+                if self._store.pop(key, None) is not None:
+                    del self._keys[bisect.bisect_left(self._keys, key)]
+            else:
+                if key not in self._store:
+                    bisect.insort(self._keys, key)
+                self._store[key] = obj
+            self.version += 1
+            namespace = obj.metadata.namespace
+            self._namespace_versions[namespace] = self._namespace_versions.get(namespace, 0) + 1
+        self._notify(event_type, obj)
+
+    def _notify(self, event_type, obj):
+        with self._listeners_lock:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            if not self._running:
+                # Stopped while notifying, the rest belong to whatever replaced it
+                return
+            try:
+                callback(self.kind, event_type, obj)
+            except Exception as e:
+                print(f"Error in informer {self.kind} listener: {e}")
@@ -0,0 +1,293 @@
+import collections
+import json
+import math
+import threading
+import time
+
+from kubernetes.client.rest import ApiException
+
+
+class Histogram:
+    """Log-scale histogram; buckets grow by 2**(1/4), so quantiles are within about 10%."""
+    __slots__ = ("buckets", "count", "total", "min", "max")
+
+    SCALE = 4  # buckets per doubling
+
+    def __init__(self):
+        self.buckets = collections.Counter()  # bucket index -> count, None holds zeros
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        index = math.floor(math.log2(value) * self.SCALE) if value > 0 else None
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        self.buckets.update(other.buckets)
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-quantile, capped at the largest value seen."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = self.buckets.get(None, 0)
+        if seen >= rank:
+            return 0.0
+        for index in sorted(k for k in self.buckets if k is not None):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(2 ** ((index + 1) / self.SCALE), self.max)
+        return self.max
+
+
+class EndpointStats:
+    """Cumulative numbers for one endpoint, e.g. "GET /api/v1/namespaces/{namespace}/pods"."""
+    __slots__ = ("latency", "bytes", "objects", "calls", "errors", "retries", "last_call")
+
+    def __init__(self):
+        self.latency = Histogram()  # seconds in the HTTP request: whole body if preloaded, headers for streams
+        self.bytes = Histogram()
+        self.objects = Histogram()
+        self.calls = 0
+        self.errors = collections.Counter()  # HTTP status or exception name -> count
+        self.retries = 0
+        self.last_call = None
+
+
+class _Call:
+    __slots__ = ("endpoint", "start", "latency", "status", "bytes", "objects", "retries", "error")
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.start = time.time()
+        self.latency = None
+        self.status = None
+        self.bytes = None
+        self.objects = None
+        self.retries = 0
+        self.error = None
+
+
+class ApiMetrics:
+    """Per-endpoint histograms of every KubeService API call, plus a rolling window for live display.
+
+    Calls are recorded by the hooks instrument() puts on each pooled ApiClient.
+    The window is kept as slot_seconds slices, so the live quantiles and rate
+    cost a merge of a few histograms, not a sort of every call.
+    """
+
+    def __init__(self, window=60, slot_seconds=5):
+        self.window = window
+        self.slot_seconds = slot_seconds
+        self._lock = threading.Lock()
+        self._endpoints = collections.defaultdict(EndpointStats)
+        self._slots = collections.deque()  # (slot start, latency Histogram, error count)
+
+    def record(self, call):
+        with self._lock:
+            stats = self._endpoints[call.endpoint]
+            stats.calls += 1
+            stats.last_call = call.start
+            stats.retries += call.retries
+            if call.latency is not None:
+                stats.latency.add(call.latency)
+            if call.bytes is not None:
+                stats.bytes.add(call.bytes)
+            if call.objects is not None:
+                stats.objects.add(call.objects)
+            if call.error:
+                stats.errors[call.error] += 1
+
+            slot = call.start - call.start % self.slot_seconds
+            if not self._slots or self._slots[-1][0] != slot:
+                self._slots.append((slot, Histogram(), [0]))
+            _, latency, errors = self._slots[-1]
+            if call.latency is not None:
+                latency.add(call.latency)
+            errors[0] += bool(call.error)
+            self._expire(call.start)
+
+    def _expire(self, now):
+        while self._slots and self._slots[0][0] <= now - self.window:
+            self._slots.popleft()
+
+    def recent(self):
+        """(latency Histogram, calls per second, errors) over the last window seconds."""
+        merged = Histogram()
+        errors = 0
+        with self._lock:
+            self._expire(time.time())
+            for _, latency, slot_errors in self._slots:
+                merged.merge(latency)
+                errors += slot_errors[0]
+        return merged, merged.count / self.window, errors
+
+    def endpoints(self):
+        """Snapshot of the per-endpoint stats, busiest first."""
+        with self._lock:
+            return sorted(self._endpoints.items(), key=lambda item: -item[1].calls)
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self._slots.clear()
+
+
+_local = threading.local()
+
+
+def _count_objects(result):
+    items = result.get('items') if isinstance(result, dict) else getattr(result, 'items', None)
+    return len(items) if isinstance(items, list) else None
+
+
+def instrument(api_client, metrics):
+    """Records every call made through api_client into metrics.
+
+    call_api knows the endpoint template and the decoded result (object count);
+    the REST layer underneath fills in status, body size and urllib3 retries of
+    the same call through a thread-local. Unread responses (_preload_content=False)
+    are recorded once their body has been consumed or closed.
+    """
+    call_api = api_client.call_api
+    rest_request = api_client.rest_client.request
+
+    def instrumented_call_api(resource_path, method, path_params=None, query_params=None, *args, **kwargs):
+        watch = any(key == "watch" and value for key, value in query_params or [])
+        endpoint = resource_path
+        for key in ("group", "version", "plural"):
+            # Custom object calls share one template; which API they hit is what matters
+            if path_params and key in path_params:
+                endpoint = endpoint.replace("{%s}" % key, str(path_params[key]))
+        call = _local.call = _Call(f"{'WATCH' if watch else method} {endpoint}")
+        try:
+            result = call_api(resource_path, method, path_params, query_params, *args, **kwargs)
+        except ApiException as e:
+            call.error = str(e.status)
+            call.bytes = len(e.body or "")
+            metrics.record(call)
+            raise
+        except Exception as e:
+            call.error = type(e).__name__
+            metrics.record(call)
+            raise
+        finally:
+            _local.call = None
+
+        if kwargs.get('_preload_content', True):
+            call.objects = _count_objects(result)
+            metrics.record(call)
+            return result
+        if isinstance(result, tuple):
+            metrics.record(call)
+            return result
+        return InstrumentedResponse(result, call, metrics)
+
+    def instrumented_request(method, url, *args, **kwargs):
+        call = getattr(_local, "call", None)
+        started = time.perf_counter()
+        try:
+            response = rest_request(method, url, *args, **kwargs)
+        finally:
+            if call is not None:
+                # Deserialization in call_api is not part of it
+                call.latency = time.perf_counter() - started
+        if call is not None:
+            raw = getattr(response, "urllib3_response", response)
+            call.status = response.status
+            retries = getattr(raw, "retries", None)
+            call.retries = len(retries.history) if retries else 0
+            if kwargs.get('_preload_content', True):
+                call.bytes = len(raw.data or b"")
+        return response
+
+    api_client.call_api = instrumented_call_api
+    api_client.rest_client.request = instrumented_request
+    return api_client
+
+
+def read_json(response):
+    """json.loads of an unread (_preload_content=False) response's body; instrumented ones count its items."""
+    if isinstance(response, InstrumentedResponse):
+        return response.json()
+    return json.loads(response.data)
+
+
+class InstrumentedResponse:
+    """Unread urllib3 response passed through; counts body bytes and records the call when done."""
+
+    def __init__(self, response, call, metrics):
+        self._response = response
+        self._call = call
+        self._metrics = metrics
+        self._bytes = 0
+        self._recorded = False
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    @property
+    def data(self):
+        data = self._response.data
+        if not self._recorded:
+            self._bytes += len(data or b"")
+            self._record()
+        return data
+
+    def json(self):
+        """Decodes the body as JSON, counting list items as the call's objects."""
+        data = self._response.data
+        result = json.loads(data)
+        if not self._recorded:
+            self._bytes += len(data or b"")
+            self._call.objects = _count_objects(result)
+            self._record()
+        return result
+
+    def read(self, amt=None, *args, **kwargs):
+        data = self._response.read(amt, *args, **kwargs)
+        self._bytes += len(data)
+        if not data and (amt is None or amt > 0):
+            self._record()
+        return data
+
+    def stream(self, amt=2 ** 16, decode_content=None):
+        try:
+            for chunk in self._response.stream(amt, decode_content=decode_content):
+                self._bytes += len(chunk)
+                yield chunk
+        finally:
+            self._record()
+
+    def close(self):
+        self._response.close()
+        self._record()
+
+    def release_conn(self):
+        self._response.release_conn()
+
+    def _record(self):
+        if not self._recorded:
+            self._recorded = True
+            self._call.bytes = self._bytes
+            self._metrics.record(self._call)
+
+
+# Singleton instance
+api_metrics = ApiMetrics()
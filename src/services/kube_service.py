@@ -1,8 +1,20 @@
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 
+from src.services.api_clients import ApiClientPool
+from src.services.informer import Informer
+from src.services.instrumentation import api_metrics, read_json
+from src.services.kubeconfig_cache import KubeconfigCache
+from src.services.pod_index import PodIndex
+from src.services.pagination import paginate
+from src.services.log_stream import LogStream
+from src.services.singleflight import SingleFlight, coalesced, invalidates
+from src.services.summaries import PodSummary, NodeSummary, WorkloadSummary
+from src.services.traffic import TrafficRecorder, TrafficReplayer
+
 import yaml
 import json
+import functools
 import os
 
 class KubeService:
@@ -11,6 +23,14 @@ class KubeService:
         self.active_context = None
         self.active_namespace = "default"
         self._custom_contexts_file = "storage/custom_contexts.json"
+        self._informers = {}
+        self._listeners = []
+        self._pod_index_cache = {}  # namespace -> (informer version key, PodIndex)
+        self.list_chunk_size = 500  # Page size for limit/continue listing
+        self.fast_path = False  # Opt-in: decode LIST JSON straight into summary records
+        self.coalescer = SingleFlight(ttl=2.0)  # Identical reads share a round trip, results fresh for ttl seconds
+        self.kubeconfig = KubeconfigCache()
+        self.clients = ApiClientPool(self.kubeconfig, pool_maxsize=32, gzip=False, metrics=api_metrics)
         self._load_config()
 
     def _load_config(self):
@@ -18,8 +38,7 @@ class KubeService:
         
         # 1. Load system kube config
         try:
-            config.load_kube_config()
-            system_contexts, active_context = config.list_kube_config_contexts()
+            system_contexts, active_context = self.kubeconfig.list_contexts()
             self.contexts.extend(system_contexts)
             self.active_context = active_context
         except Exception as e:
@@ -37,16 +56,7 @@ class KubeService:
                 custom_contexts = json.load(f)
                 
             for ctx in custom_contexts:
-                # Format to match kubernetes client structure
-                formatted_ctx = {
-                    'name': ctx['name'],
-                    'context': {
-                        'cluster': ctx['name'],
-                        'user': ctx['name']
-                    },
-                    'is_custom': True,
-                    'config': ctx # Store full config for later use
-                }
+                formatted_ctx = self.custom_context_entry(ctx)
                 # Check for duplicates before adding
                 if not any(c['name'] == ctx['name'] for c in self.contexts):
                     self.contexts.append(formatted_ctx)
@@ -54,12 +64,30 @@ class KubeService:
         except Exception as e:
             print(f"Error loading custom contexts: {e}")
 
+    def custom_context_entry(self, ctx):
+        """Formats a saved custom context (name, server, token, insecure) as a contexts entry."""
+        # Format to match kubernetes client structure
+        return {
+            'name': ctx['name'],
+            'context': {
+                'cluster': ctx['name'],
+                'user': ctx['name']
+            },
+            'is_custom': True,
+            'config': ctx # Store full config for later use
+        }
+
     def get_contexts(self):
         """Returns a list of context names."""
         if not self.contexts:
             return []
         return [context['name'] for context in self.contexts]
 
+    @property
+    def api_client(self):
+        """Pooled ApiClient of the active context, every API object is built on it."""
+        return self.clients.get(self.active_context)
+
     def get_active_context_name(self):
         """Returns the name of the current active context."""
         if self.active_context:
@@ -75,25 +103,16 @@ class KubeService:
             if not target_ctx:
                 return False
 
-            if target_ctx.get('is_custom'):
-                # Handle custom context loading
-                ctx_config = target_ctx['config']
-                configuration = client.Configuration()
-                configuration.host = ctx_config['server']
-                configuration.verify_ssl = not ctx_config.get('insecure', False)
-                configuration.api_key = {"authorization": "Bearer " + ctx_config['token']}
-                
-                # Create a client from the configuration
-                api_client = client.ApiClient(configuration)
-                client.Configuration.set_default(configuration)
-                
-                self.active_context = target_ctx
-            else:
-                # Handle standard kubeconfig context
-                config.load_kube_config(context=context_name)
-                self.active_context = target_ctx
+            # Each context keeps its own pooled client, built on first use
+            self.clients.get(target_ctx)
+            self.active_context = target_ctx
             
             self.active_namespace = "default" # Reset namespace on context switch
+            self.coalescer.invalidate()
+            if self._informers:
+                # Caches belong to the old cluster, start over against the new one
+                self.stop_informers()
+                self.start_informers()
             return True
         except Exception as e:
             print(f"Error setting context {context_name}: {e}")
@@ -148,15 +167,123 @@ class KubeService:
                 json.dump(custom_contexts, f, indent=4)
 
             # Reload configs
+            self.clients.discard(name)
             self._load_config()
             return True, "Context deleted successfully"
         except Exception as e:
             return False, f"Error deleting context: {e}"
 
+    def record_traffic(self, path):
+        """Records every request and response, of every context, to path until stop_traffic()."""
+        self._set_transport(TrafficRecorder(path))
+
+    def replay_traffic(self, path, speed=1.0):
+        """Answers requests from a recording instead of the cluster; speed 0 replays without waiting."""
+        self._set_transport(TrafficReplayer(path, speed))
+
+    def stop_traffic(self):
+        self._set_transport(None)
+
+    def _set_transport(self, transport):
+        previous = self.clients.transport
+        self.clients.set_transport(transport)
+        if previous:
+            previous.close()
+        self.coalescer.invalidate()
+        if self._informers:
+            # Watches are long-lived, reopen them through the new transport
+            self.stop_informers()
+            self.start_informers()
+
+    def start_informers(self):
+        """Starts the watch-backed caches that list_* read from once they are synced."""
+        if self._informers:
+            return
+        # The watch decoder reads raw bytes, so watches never ask for gzip
+        api_client = self.clients.get(self.active_context, compressed=False)
+        v1 = client.CoreV1Api(api_client)
+        apps_v1 = client.AppsV1Api(api_client)
+        batch_v1 = client.BatchV1Api(api_client)
+        list_funcs = {
+            "pods": v1.list_pod_for_all_namespaces,
+            "nodes": v1.list_node,
+            "events": v1.list_event_for_all_namespaces,
+            "deployments": apps_v1.list_deployment_for_all_namespaces,
+            "statefulsets": apps_v1.list_stateful_set_for_all_namespaces,
+            "cronjobs": batch_v1.list_cron_job_for_all_namespaces,
+        }
+        for kind, list_func in list_funcs.items():
+            informer = Informer(kind, list_func, page_size=self.list_chunk_size)
+            informer.subscribe(functools.partial(self._dispatch_event, informer))
+            self._informers[kind] = informer
+            informer.start()
+
+    def stop_informers(self):
+        for informer in self._informers.values():
+            informer.stop()
+        self._informers = {}
+        self._pod_index_cache = {}
+
+    def subscribe(self, callback, kinds=None):
+        """Calls callback(kind, event_type, obj) on cache changes. Returns an unsubscribe function.
+
+        Subscriptions live on the service, so they survive informer restarts on context switch.
+        """
+        entry = (callback, set(kinds) if kinds else None)
+        self._listeners.append(entry)
+
+        def unsubscribe():
+            if entry in self._listeners:
+                self._listeners.remove(entry)
+        return unsubscribe
+
+    def _dispatch_event(self, informer, kind, event_type, obj):
+        # An informer of the context switched away from may still be mid-relist
+        if self._informers.get(kind) is not informer:
+            return
+        # Reads coalesced before the change must not answer the refresh it triggers
+        self.coalescer.invalidate(kind)
+        for callback, kinds in list(self._listeners):
+            if kinds is None or kind in kinds:
+                callback(kind, event_type, obj)
+
+    def _synced_informer(self, kind):
+        """Returns the informer for kind if its store can be trusted, otherwise None."""
+        informer = self._informers.get(kind)
+        if informer and informer.has_synced():
+            return informer
+        return None
+
+    def cache_synced(self, kind):
+        """True if list calls for kind are currently served from the informer store."""
+        return self._synced_informer(kind) is not None
+
+    def cached_object(self, kind, name, namespace=None):
+        """The object as the synced informer store has it, or None; never calls the API."""
+        informer = self._synced_informer(kind)
+        if not informer:
+            return None
+        return informer.get(name, namespace if namespace else self.active_namespace)
+
+    def _parse_selector(self, label_selector):
+        """Returns an equality selector as a dict, or None if it needs the API server to evaluate."""
+        if isinstance(label_selector, dict):
+            return label_selector
+        if not label_selector:
+            return {}
+        selector = {}
+        for term in label_selector.split(","):
+            if "!=" in term or "=" not in term:
+                return None
+            key, value = term.split("=", 1)
+            selector[key.strip()] = value.lstrip("=").strip()
+        return selector
+
+    @invalidates("namespaces")
     def create_namespace(self, name):
         """Creates a new namespace."""
         try:
-            v1 = client.CoreV1Api()
+            v1 = client.CoreV1Api(self.api_client)
             namespace = client.V1Namespace(metadata=client.V1ObjectMeta(name=name))
             v1.create_namespace(body=namespace)
             return True
@@ -167,10 +294,11 @@ class KubeService:
             print(f"Unexpected error creating namespace: {e}")
             return False
 
+    @invalidates("namespaces")
     def delete_namespace(self, name):
         """Deletes a namespace."""
         try:
-            v1 = client.CoreV1Api()
+            v1 = client.CoreV1Api(self.api_client)
             v1.delete_namespace(name=name)
             return True
         except ApiException as e:
@@ -180,51 +308,62 @@ class KubeService:
             print(f"Unexpected error deleting namespace: {e}")
             return False
 
+    @coalesced("list", "namespaces")
     def get_namespaces(self):
         """Returns a list of namespace names for the current context."""
         try:
-            v1 = client.CoreV1Api()
+            v1 = client.CoreV1Api(self.api_client)
             namespaces = v1.list_namespace()
             return [ns.metadata.name for ns in namespaces.items]
         except ApiException as e:
             print(f"Error listing namespaces: {e}")
+            self.coalescer.uncached()
             return []
         except Exception as e:
              print(f"Unexpected error listing namespaces: {e}")
+             self.coalescer.uncached()
              return []
 
     def set_namespace(self, namespace):
         """Sets the active namespace."""
         self.active_namespace = namespace
 
+    @coalesced("list", "deployments")
     def list_deployments(self, namespace=None):
         """Returns a list of deployment objects in the specified namespace."""
         target_ns = namespace if namespace else self.active_namespace
+        informer = self._synced_informer("deployments")
+        if informer:
+            return informer.list(target_ns)
         try:
-            apps_v1 = client.AppsV1Api()
+            apps_v1 = client.AppsV1Api(self.api_client)
             deployments = apps_v1.list_namespaced_deployment(target_ns)
             return deployments.items
         except ApiException as e:
             print(f"Error listing deployments: {e}")
+            self.coalescer.uncached()
             return []
         except Exception as e:
             print(f"Unexpected error listing deployments: {e}")
+            self.coalescer.uncached()
             return []
 
+    @invalidates("deployments", "pods")
     def scale_deployment(self, name, replicas, namespace=None):
         target_ns = namespace if namespace else self.active_namespace
         try:
-            apps_v1 = client.AppsV1Api()
+            apps_v1 = client.AppsV1Api(self.api_client)
             body = {'spec': {'replicas': int(replicas)}}
             apps_v1.patch_namespaced_deployment_scale(name, target_ns, body)
             return True, "Scaled successfully"
         except ApiException as e:
             return False, f"Error scaling: {e}"
 
+    @invalidates("deployments", "pods")
     def restart_deployment(self, name, namespace=None):
         target_ns = namespace if namespace else self.active_namespace
         try:
-            apps_v1 = client.AppsV1Api()
+            apps_v1 = client.AppsV1Api(self.api_client)
             import datetime
             now = datetime.datetime.now(datetime.timezone.utc)
             body = {
@@ -243,19 +382,21 @@ class KubeService:
         except ApiException as e:
             return False, f"Error restarting: {e}"
 
+    @invalidates("deployments", "pods")
     def delete_deployment(self, name, namespace=None):
         target_ns = namespace if namespace else self.active_namespace
         try:
-            apps_v1 = client.AppsV1Api()
+            apps_v1 = client.AppsV1Api(self.api_client)
             apps_v1.delete_namespaced_deployment(name, target_ns)
             return True, "Deleted successfully"
         except ApiException as e:
             return False, f"Error deleting: {e}"
 
+    @invalidates("deployments", "pods")
     def create_deployment(self, name, image, replicas, selector_label, env_vars, namespace=None):
         target_ns = namespace if namespace else self.active_namespace
         try:
-            apps_v1 = client.AppsV1Api()
+            apps_v1 = client.AppsV1Api(self.api_client)
             
             # Parse selector label "key=value"
             if "=" in selector_label:
@@ -299,11 +440,12 @@ class KubeService:
         except ApiException as e:
             return False, f"Error creating deployment: {e}"
 
+    @invalidates("deployments", "pods")
     def update_deployment(self, name, image, env_vars, namespace=None):
         """Updates image and environment variables of the first container."""
         target_ns = namespace if namespace else self.active_namespace
         try:
-            apps_v1 = client.AppsV1Api()
+            apps_v1 = client.AppsV1Api(self.api_client)
             
             # Fetch existing to get current spec
             deployment = apps_v1.read_namespaced_deployment(name, target_ns)
@@ -329,65 +471,91 @@ class KubeService:
         except ApiException as e:
             return False, f"Error updating deployment: {e}"
 
+    @coalesced("list", "cronjobs")
     def list_cronjobs(self, namespace=None):
         """Returns a list of cronjob objects in the specified namespace."""
         target_ns = namespace if namespace else self.active_namespace
+        informer = self._synced_informer("cronjobs")
+        if informer:
+            return informer.list(target_ns)
         try:
-            batch_v1 = client.BatchV1Api()
+            batch_v1 = client.BatchV1Api(self.api_client)
             cronjobs = batch_v1.list_namespaced_cron_job(target_ns)
             return cronjobs.items
         except ApiException as e:
             print(f"Error listing cronjobs: {e}")
+            self.coalescer.uncached()
             return []
         except Exception as e:
             print(f"Unexpected error listing cronjobs: {e}")
+            self.coalescer.uncached()
             return []
 
+    @coalesced("list", "statefulsets")
     def list_statefulsets(self, namespace=None):
         """Returns a list of statefulset objects in the specified namespace."""
         target_ns = namespace if namespace else self.active_namespace
+        informer = self._synced_informer("statefulsets")
+        if informer:
+            return informer.list(target_ns)
         try:
-            apps_v1 = client.AppsV1Api()
+            apps_v1 = client.AppsV1Api(self.api_client)
             statefulsets = apps_v1.list_namespaced_stateful_set(target_ns)
             return statefulsets.items
         except ApiException as e:
             print(f"Error listing statefulsets: {e}")
+            self.coalescer.uncached()
             return []
         except Exception as e:
             print(f"Unexpected error listing statefulsets: {e}")
+            self.coalescer.uncached()
             return []
 
+    @coalesced("get", "deployments")
     def get_deployment(self, name, namespace=None):
         target_ns = namespace if namespace else self.active_namespace
         try:
-            apps_v1 = client.AppsV1Api()
+            apps_v1 = client.AppsV1Api(self.api_client)
             return apps_v1.read_namespaced_deployment(name, target_ns)
         except ApiException as e:
             print(f"Error getting deployment: {e}")
+            self.coalescer.uncached()
             return None
 
+    @coalesced("get", "statefulsets")
     def get_statefulset(self, name, namespace=None):
         target_ns = namespace if namespace else self.active_namespace
         try:
-            apps_v1 = client.AppsV1Api()
+            apps_v1 = client.AppsV1Api(self.api_client)
             return apps_v1.read_namespaced_stateful_set(name, target_ns)
         except ApiException as e:
             print(f"Error getting statefulset: {e}")
+            self.coalescer.uncached()
             return None
 
+    @coalesced("get", "cronjobs")
     def get_cronjob(self, name, namespace=None):
         target_ns = namespace if namespace else self.active_namespace
         try:
-            batch_v1 = client.BatchV1Api()
+            batch_v1 = client.BatchV1Api(self.api_client)
             return batch_v1.read_namespaced_cron_job(name, target_ns)
         except ApiException as e:
             print(f"Error getting cronjob: {e}")
+            self.coalescer.uncached()
             return None
 
+    @coalesced("list", "pods")
     def list_pods(self, label_selector, namespace=None):
         target_ns = namespace if namespace else self.active_namespace
+        informer = self._synced_informer("pods")
+        selector = self._parse_selector(label_selector)
+        if informer and selector is not None:
+            return [
+                pod for pod in informer.list(target_ns)
+                if all((pod.metadata.labels or {}).get(k) == v for k, v in selector.items())
+            ]
         try:
-            v1 = client.CoreV1Api()
+            v1 = client.CoreV1Api(self.api_client)
             # Convert dict selector to string if needed
             if isinstance(label_selector, dict):
                 selector_str = ",".join([f"{k}={v}" for k, v in label_selector.items()])
@@ -401,12 +569,141 @@ class KubeService:
             return pods.items
         except ApiException as e:
             print(f"Error listing pods: {e}")
+            self.coalescer.uncached()
+            return []
+
+    def iter_pods(self, label_selector, namespace=None, chunk_size=None):
+        """Yields pods in chunks using limit/continue, so callers can render the first page early.
+
+        An ApiException partway through (e.g. an expired continue token) is raised,
+        so a listing that was cut short is never mistaken for a finished one.
+        """
+        target_ns = namespace if namespace else self.active_namespace
+        informer = self._synced_informer("pods")
+        if informer and self._parse_selector(label_selector) is not None:
+            # Already local, nothing to gain from paging
+            yield self.list_pods(label_selector, namespace)
+            return
+
+        selector_str = self._selector_string(label_selector)
+        v1 = client.CoreV1Api(self.api_client)
+        limit = chunk_size or self.list_chunk_size
+        if target_ns == "all":
+            pages = paginate(v1.list_pod_for_all_namespaces, limit, label_selector=selector_str)
+        else:
+            pages = paginate(v1.list_namespaced_pod, limit, namespace=target_ns, label_selector=selector_str)
+        for page in pages:
+            yield page.items
+
+    def get_pod_index(self, namespace=None):
+        """Returns a PodIndex over one pod snapshot of a namespace ("all" for every one).
+
+        Backed by the pod informer when synced, built from the namespace's pods only
+        and rebuilt only when one of them changes. Otherwise costs a single pod LIST
+        for the namespace.
+        """
+        target_ns = namespace if namespace else self.active_namespace
+        informer = self._synced_informer("pods")
+        if informer:
+            if target_ns == "all":
+                version = informer.version
+            else:
+                version = informer.namespace_version(target_ns)
+            cache_key = (id(informer), version)
+            cached_key, cached_index = self._pod_index_cache.get(target_ns, (None, None))
+            if cached_key == cache_key:
+                return cached_index
+            index = PodIndex([PodSummary.from_model(pod) for pod in informer.list(target_ns)])
+            self._pod_index_cache[target_ns] = (cache_key, index)
+            return index
+        return PodIndex(self.list_pod_summaries("", target_ns))
+
+    def iter_pod_summaries(self, label_selector, namespace=None, chunk_size=None):
+        """Like iter_pods, but yields chunks of PodSummary records.
+
+        With fast_path on (and no synced informer) pages are decoded straight from
+        the response JSON, skipping the client's model deserialization. Errors are
+        raised as in iter_pods.
+        """
+        if not self.fast_path or self._synced_informer("pods"):
+            for chunk in self.iter_pods(label_selector, namespace, chunk_size):
+                yield [PodSummary.from_model(pod) for pod in chunk]
+            return
+
+        target_ns = namespace if namespace else self.active_namespace
+        selector_str = self._selector_string(label_selector)
+        v1 = client.CoreV1Api(self.api_client)
+        limit = chunk_size or self.list_chunk_size
+        if target_ns == "all":
+            pages = paginate(v1.list_pod_for_all_namespaces, limit, raw=True, label_selector=selector_str)
+        else:
+            pages = paginate(v1.list_namespaced_pod, limit, raw=True, namespace=target_ns, label_selector=selector_str)
+        for page in pages:
+            yield [PodSummary.from_dict(item) for item in page.get('items') or []]
+
+    def list_pod_summaries(self, label_selector, namespace=None):
+        try:
+            return [pod for chunk in self.iter_pod_summaries(label_selector, namespace) for pod in chunk]
+        except ApiException as e:
+            # Nothing rather than the pages read before the error
+            print(f"Error listing pods: {e}")
+            return []
+
+    @coalesced("summaries", "nodes")
+    def list_node_summaries(self):
+        if not self.fast_path or self._synced_informer("nodes"):
+            return [NodeSummary.from_model(node) for node in self.list_nodes()]
+        try:
+            v1 = client.CoreV1Api(self.api_client)
+            return [NodeSummary.from_dict(item) for item in self._list_raw(v1.list_node)]
+        except ApiException as e:
+            print(f"Error listing nodes: {e}")
+            self.coalescer.uncached()
+            return []
+
+    @coalesced("summaries", "deployments")
+    def list_deployment_summaries(self, namespace=None):
+        if not self.fast_path or self._synced_informer("deployments"):
+            return [WorkloadSummary.from_model(d, "deployment") for d in self.list_deployments(namespace)]
+        target_ns = namespace if namespace else self.active_namespace
+        try:
+            apps_v1 = client.AppsV1Api(self.api_client)
+            items = self._list_raw(apps_v1.list_namespaced_deployment, target_ns)
+            return [WorkloadSummary.from_dict(item, "deployment") for item in items]
+        except ApiException as e:
+            print(f"Error listing deployments: {e}")
+            self.coalescer.uncached()
+            return []
+
+    @coalesced("summaries", "statefulsets")
+    def list_statefulset_summaries(self, namespace=None):
+        if not self.fast_path or self._synced_informer("statefulsets"):
+            return [WorkloadSummary.from_model(s, "statefulset") for s in self.list_statefulsets(namespace)]
+        target_ns = namespace if namespace else self.active_namespace
+        try:
+            apps_v1 = client.AppsV1Api(self.api_client)
+            items = self._list_raw(apps_v1.list_namespaced_stateful_set, target_ns)
+            return [WorkloadSummary.from_dict(item, "statefulset") for item in items]
+        except ApiException as e:
+            print(f"Error listing statefulsets: {e}")
+            self.coalescer.uncached()
             return []
 
+    def _list_raw(self, list_func, *args, **kwargs):
+        """Runs a list_* call without model deserialization and returns the decoded items."""
+        response = list_func(*args, _preload_content=False, **kwargs)
+        return read_json(response).get('items') or []
+
+    def _selector_string(self, label_selector):
+        if isinstance(label_selector, dict):
+            return ",".join([f"{k}={v}" for k, v in label_selector.items()])
+        return label_selector
+
+    @coalesced("metrics", "pods")
     def get_pod_metrics(self, namespace=None):
-        """Returns a dict of pod metrics keyed by pod name."""
+        """Returns a dict of pod metrics keyed by namespace/name."""
         try:
-            custom_api = client.CustomObjectsApi()
+            custom_api = client.CustomObjectsApi(self.api_client)
             if namespace and namespace != "all":
                 metrics = custom_api.list_namespaced_custom_object(
                     group="metrics.k8s.io",
@@ -421,43 +718,27 @@ class KubeService:
                     plural="pods"
                 )
             
+            # Values stay as raw quantity strings, consumers turn them into numbers in
+            # one pass with quantity.usage_arrays
             metrics_map = {}
             for item in metrics.get('items', []):
-                pod_name = item['metadata']['name']
-                containers = item.get('containers', [])
-                
-                # Aggregate container metrics
-                total_cpu = 0
-                total_mem = 0
-                
-                for c in containers:
-                    cpu_str = c['usage']['cpu']
-                    mem_str = c['usage']['memory']
-                    
-                    # Simple parsing (approximate)
-                    # CPU: 100n, 10u, 1m -> convert to nanocores or millicores? 
-                    # Let's keep strings for display or do simple conversion if needed.
-                    # For now, just storing the raw first container or summing if we parse.
-                    # To keep it simple for display, let's just store the raw values of the first container
-                    # or try to sum them up if we can parse.
-                    
-                    # Let's just store the raw list of container metrics for the view to handle
-                    pass
-
-                metrics_map[pod_name] = item
+                metrics_map[f"{item['metadata']['namespace']}/{item['metadata']['name']}"] = item
             
             return metrics_map
         except ApiException as e:
             print(f"Error listing pod metrics: {e}")
+            self.coalescer.uncached()
             return {}
         except Exception as e:
             print(f"Unexpected error listing pod metrics: {e}")
+            self.coalescer.uncached()
             return {}
 
+    @coalesced("metrics", "nodes")
     def get_node_metrics(self):
         """Returns a dict of node metrics keyed by node name."""
         try:
-            custom_api = client.CustomObjectsApi()
+            custom_api = client.CustomObjectsApi(self.api_client)
             metrics = custom_api.list_cluster_custom_object(
                 group="metrics.k8s.io",
                 version="v1beta1",
@@ -472,68 +753,105 @@ class KubeService:
             return metrics_map
         except ApiException as e:
             print(f"Error listing node metrics: {e}")
+            self.coalescer.uncached()
             return {}
         except Exception as e:
             print(f"Unexpected error listing node metrics: {e}")
+            self.coalescer.uncached()
             return {}
 
     def get_pod_logs(self, pod_name, namespace=None):
         target_ns = namespace if namespace else self.active_namespace
         try:
-            v1 = client.CoreV1Api()
+            v1 = client.CoreV1Api(self.api_client)
             return v1.read_namespaced_pod_log(pod_name, target_ns)
         except ApiException as e:
             print(f"Error getting pod logs: {e}")
             return f"Error: {e}"
 
+    def stream_pod_logs(self, pod_name, namespace=None, container=None, follow=True,
+                        tail_lines=None, since_seconds=None, timestamps=False):
+        """Opens a log stream of one pod container and returns a LogStream of lines.
+
+        Nothing is buffered beyond the current chunk, so following a chatty pod
+        costs what the reader keeps. Close the stream when done; raises ApiException
+        if the log cannot be opened.
+        """
+        target_ns = namespace if namespace else self.active_namespace
+        options = {"container": container, "tail_lines": tail_lines, "since_seconds": since_seconds}
+        v1 = client.CoreV1Api(self.api_client)
+        response = v1.read_namespaced_pod_log(
+            pod_name,
+            target_ns,
+            follow=follow,
+            timestamps=timestamps,
+            _preload_content=False,
+            **{k: v for k, v in options.items() if v is not None}
+        )
+        return LogStream(response)
+
     def get_resource_yaml(self, resource_obj):
         try:
-            api_client = client.ApiClient()
-            return yaml.dump(api_client.sanitize_for_serialization(resource_obj))
+            return yaml.dump(self.api_client.sanitize_for_serialization(resource_obj))
         except Exception as e:
             return f"Error serializing to YAML: {e}"
 
+    @coalesced("list", "nodes")
     def list_nodes(self):
         """Returns a list of all nodes in the cluster."""
+        informer = self._synced_informer("nodes")
+        if informer:
+            return informer.list()
         try:
-            v1 = client.CoreV1Api()
+            v1 = client.CoreV1Api(self.api_client)
             nodes = v1.list_node()
             return nodes.items
         except ApiException as e:
             print(f"Error listing nodes: {e}")
+            self.coalescer.uncached()
             return []
         except Exception as e:
             print(f"Unexpected error listing nodes: {e}")
+            self.coalescer.uncached()
             return []
 
+    @coalesced("list", "events")
     def list_events(self, namespace=None):
         """Returns a list of events in the specified namespace."""
         target_ns = namespace if namespace else self.active_namespace
         try:
-            v1 = client.CoreV1Api()
-            events = v1.list_namespaced_event(target_ns)
+            informer = self._synced_informer("events")
+            if informer:
+                events = informer.list(target_ns)
+            else:
+                v1 = client.CoreV1Api(self.api_client)
+                events = v1.list_namespaced_event(target_ns).items
             # Sort by last timestamp descending
             sorted_events = sorted(
-                events.items, 
+                events, 
                 key=lambda x: x.last_timestamp or x.event_time or x.metadata.creation_timestamp, 
                 reverse=True
             )
             return sorted_events
         except ApiException as e:
             print(f"Error listing events: {e}")
+            self.coalescer.uncached()
             return []
         except Exception as e:
             print(f"Unexpected error listing events: {e}")
+            self.coalescer.uncached()
             return []
 
+    @coalesced("check", "connection")
     def check_connection(self):
         """Checks if the connection to the cluster is valid."""
         try:
-            v1 = client.CoreV1Api()
+            v1 = client.CoreV1Api(self.api_client)
             v1.list_node(limit=1)
             return True
         except Exception as e:
             print(f"Connection check failed: {e}")
+            self.coalescer.uncached()
             return False
 
 # Singleton instance
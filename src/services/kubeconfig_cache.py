@@ -0,0 +1,104 @@
+import datetime
+import os
+import threading
+
+from kubernetes import client
+from kubernetes.config import kube_config
+from kubernetes.config.config_exception import ConfigException
+
+from src.services.scheduler import scheduler
+
+
+class KubeconfigCache:
+    """Parsed kubeconfig and one Configuration per context, built once and kept fresh.
+
+    The kubeconfig files are parsed again only when one of them changes on disk.
+    Loading a context runs its exec or auth-provider plugin once; credentials
+    that carry an expiry are reloaded in the background refresh_margin seconds
+    before they expire, into the same Configuration object, so requests never
+    wait for a plugin and switching back to a visited context costs nothing.
+    """
+
+    def __init__(self, location=None, refresh_margin=120):
+        self.location = location or kube_config.KUBE_CONFIG_DEFAULT_LOCATION
+        self.refresh_margin = refresh_margin
+        self._lock = threading.RLock()
+        self._merger = None
+        self._signature = None
+        self._configurations = {}
+        self._refresh_jobs = {}
+
+    def _paths(self):
+        return [os.path.expanduser(p) for p in self.location.split(os.pathsep) if p]
+
+    def _current_signature(self):
+        return tuple(os.path.getmtime(p) if os.path.exists(p) else None for p in self._paths())
+
+    def merged(self):
+        """The merged kubeconfig, parsed again only if a file changed since the last call."""
+        with self._lock:
+            signature = self._current_signature()
+            if self._merger is None or signature != self._signature:
+                # Loaded contexts keep their Configuration; the file also changes
+                # whenever a refreshed auth-provider token is persisted
+                self._merger = kube_config.KubeConfigMerger(self.location)
+                self._signature = signature
+            if self._merger.config is None:
+                raise ConfigException("Invalid kube-config file. No configuration found.")
+            return self._merger
+
+    def list_contexts(self):
+        """Same as config.list_kube_config_contexts(), without re-reading unchanged files."""
+        loader = self._loader(None)
+        return loader.list_contexts(), loader.current_context
+
+    def configuration(self, context_name):
+        with self._lock:
+            configuration = self._configurations.get(context_name)
+            if configuration is None:
+                configuration = client.Configuration()
+                self._load(context_name, configuration)
+                self._configurations[context_name] = configuration
+            return configuration
+
+    def _loader(self, context_name):
+        merger = self.merged()
+        return kube_config.KubeConfigLoader(
+            config_dict=merger.config,
+            active_context=context_name,
+            config_base_path=None,
+            config_persister=merger.save_changes,
+        )
+
+    def _load(self, context_name, configuration):
+        loader = self._loader(context_name)
+        loader.load_and_set(configuration)
+        expiry = getattr(loader, "expiry", None)
+        if expiry:
+            self._schedule_refresh(context_name, configuration, expiry)
+
+    def _schedule_refresh(self, context_name, configuration, expiry):
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=datetime.timezone.utc)
+        remaining = (expiry - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+        delay = max(5, remaining - self.refresh_margin)
+
+        def refresh():
+            # The plugin runs outside the lock, other contexts stay usable meanwhile
+            with self._lock:
+                current = self._configurations.get(context_name) is configuration
+            if current:
+                self._load(context_name, configuration)
+
+        # Re-adding under the same name replaces the previous refresh of this context
+        self._refresh_jobs[context_name] = scheduler.add(
+            f"kubeconfig.refresh.{context_name}", refresh, delay,
+            run_now=False, jitter=0, background=True
+        )
+
+    def discard(self, context_name):
+        with self._lock:
+            self._configurations.pop(context_name, None)
+            job = self._refresh_jobs.pop(context_name, None)
+            if job:
+                scheduler.remove(job)
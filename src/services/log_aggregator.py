@@ -0,0 +1,144 @@
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import queue
+import threading
+import time
+
+from src.services.kube_service import kube_service
+
+_DONE = object()
+
+
+def timestamp_key(timestamp):
+    """Sort key for RFC3339Nano timestamps, which drop trailing zeros of the fraction."""
+    base, _, fraction = timestamp.rstrip("Z").partition(".")
+    return base + fraction.ljust(9, "0")
+
+
+class LogAggregator:
+    """Follows the logs of many pod containers at once and merges them by timestamp.
+
+    Every (pod, container) is read with timestamps=True on a bounded thread pool
+    into its own bounded queue; a full queue blocks its reader, which stops
+    reading the socket, so a slow consumer holds the streams back instead of
+    buffering them. Iterating yields (timestamp, pod, container, text) in
+    timestamp order through a k-way heap merge. A line is only released once
+    every live source has a line queued; a source that has been quiet for
+    merge_delay seconds stops holding the merge until it produces a line again,
+    so a quiet pod cannot stall the others.
+    """
+
+    def __init__(self, targets, namespace=None, follow=True, tail_lines=None, since_seconds=None,
+                 max_workers=16, queue_size=1000, merge_delay=1.0):
+        self.targets = list(targets)  # [(pod_name, container)]
+        self.namespace = namespace
+        self.follow = follow
+        self.tail_lines = tail_lines
+        self.since_seconds = since_seconds
+        self.max_workers = max_workers
+        self.merge_delay = merge_delay
+        self.closed = False
+
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in self.targets]
+        self._streams = {}
+        self._streams_lock = threading.Lock()
+        self._data = threading.Event()
+        self._executor = None
+
+    def start(self):
+        # Followed streams never end, so pods past max_workers are left out rather than starved
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="log-aggregator")
+        for index in range(min(len(self.targets), self.max_workers)):
+            self._executor.submit(self._read, index)
+        for q in self._queues[self.max_workers:]:
+            q.put(_DONE)
+        return self
+
+    @property
+    def skipped(self):
+        return max(0, len(self.targets) - self.max_workers)
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        with self._streams_lock:
+            streams = list(self._streams.values())
+        for stream in streams:
+            stream.close()
+        self._data.set()
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _read(self, index):
+        pod_name, container = self.targets[index]
+        try:
+            stream = kube_service.stream_pod_logs(
+                pod_name,
+                self.namespace,
+                container=container,
+                follow=self.follow,
+                tail_lines=self.tail_lines,
+                since_seconds=self.since_seconds,
+                timestamps=True,
+            )
+            with self._streams_lock:
+                self._streams[index] = stream
+            if self.closed:
+                stream.close()
+            for line in stream:
+                timestamp, _, text = line.partition(" ")
+                self._put(index, (timestamp_key(timestamp), timestamp, pod_name, container, text))
+        except Exception as e:
+            if not self.closed:
+                print(f"Error reading logs of {pod_name}/{container}: {e}")
+        finally:
+            self._put(index, _DONE)
+
+    def _put(self, index, item):
+        # Blocks while the consumer is behind, re-checking so close() never deadlocks
+        while not self.closed:
+            try:
+                self._queues[index].put(item, timeout=0.5)
+                self._data.set()
+                return
+            except queue.Full:
+                continue
+
+    def __iter__(self):
+        heap = []
+        waiting = set(range(len(self.targets)))  # live sources with no line in the heap
+        live = set(waiting)
+        started = time.monotonic()
+        quiet_since = dict.fromkeys(waiting, started)  # when each waiting source last ran dry
+
+        while not self.closed:
+            for index in list(waiting):
+                try:
+                    item = self._queues[index].get_nowait()
+                except queue.Empty:
+                    continue
+                waiting.discard(index)
+                if item is _DONE:
+                    live.discard(index)
+                else:
+                    heapq.heappush(heap, (item[0], index, item))
+
+            released = False
+            if heap:
+                # Sources quiet for merge_delay are given up on until their next line
+                now = time.monotonic()
+                holding = any(now - quiet_since[index] < self.merge_delay for index in waiting & live)
+                if not holding:
+                    _, index, item = heapq.heappop(heap)
+                    waiting.add(index)
+                    quiet_since[index] = time.monotonic()
+                    released = True
+                    yield item[1:]
+                    # loop to refill the source just consumed before choosing the next line
+
+            if not heap and not live:
+                return
+            if not released:
+                self._data.clear()
+                self._data.wait(0.1)
@@ -0,0 +1,38 @@
+class LogStream:
+    """Line iterator over a streamed pod log response.
+
+    Reading happens in whatever thread iterates; close() may be called from any
+    other thread to end a follow stream, the blocked read then stops quietly.
+    """
+
+    def __init__(self, response, chunk_size=64 * 1024):
+        self._response = response
+        self._chunk_size = chunk_size
+        self.closed = False
+
+    def __iter__(self):
+        remainder = b""
+        try:
+            for chunk in self._response.stream(self._chunk_size, decode_content=True):
+                lines = (remainder + chunk).split(b"\n")
+                remainder = lines.pop()
+                for line in lines:
+                    yield line.rstrip(b"\r").decode("utf-8", errors="replace")
+            if remainder:
+                yield remainder.decode("utf-8", errors="replace")
+        except Exception:
+            # Closing the socket under a pending read surfaces as a protocol error
+            if not self.closed:
+                raise
+        finally:
+            self.close()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._response.close()
+            self._response.release_conn()
+        except Exception:
+            pass
@@ -0,0 +1,276 @@
+import json
+import os
+import re
+import threading
+import time
+
+import numpy as np
+
+
+# One fixed-size record per (series, bucket). Segments are preallocated files of
+# these records, so they can be memory-mapped and read back as arrays without
+# any parsing; an unused record has t == 0.
+RECORD = np.dtype([("t", "<f8"), ("key", "<u4"), ("n", "<u4"), ("cpu", "<f8"), ("mem", "<f8")])
+
+# Rollup tiers: name -> bucket size in seconds. 5s is the sampling interval,
+# kept only long enough to seed the in-memory ring buffers at their own resolution.
+TIERS = {"5s": 5, "10s": 10, "1m": 60, "10m": 600}
+
+DEFAULT_RETENTION = {"5s": 2 * 3600, "10s": 24 * 3600, "1m": 7 * 24 * 3600, "10m": 90 * 24 * 3600}
+
+
+class _Segment:
+    """Append-only memory-mapped file of RECORD entries, named after its first timestamp."""
+
+    def __init__(self, path, capacity):
+        self.path = path
+        exists = os.path.exists(path)
+        self.records = np.memmap(path, dtype=RECORD, mode="r+" if exists else "w+", shape=(capacity,))
+        # Records are appended in time order, so the used ones are a prefix
+        self.count = int(np.count_nonzero(self.records["t"])) if exists else 0
+
+    @property
+    def full(self):
+        return self.count >= len(self.records)
+
+    def append(self, rows):
+        end = self.count + len(rows)
+        self.records[self.count:end] = rows
+        self.count = end
+
+    def flush(self):
+        self.records.flush()
+
+
+class _Tier:
+    def __init__(self, directory, bucket, segment_records):
+        self.directory = directory
+        self.bucket = bucket
+        self.segment_records = segment_records
+        self.segment = None
+        self.pending = {}  # key id -> [bucket start, n, cpu mean, mem mean]
+        os.makedirs(directory, exist_ok=True)
+
+    def segment_paths(self):
+        """Segment files sorted by their first timestamp."""
+        names = [n for n in os.listdir(self.directory) if n.endswith(".seg")]
+        return [os.path.join(self.directory, n) for n in sorted(names, key=lambda n: int(n[:-4]))]
+
+    def open_latest(self):
+        paths = self.segment_paths()
+        if paths:
+            self.segment = _Segment(paths[-1], self.segment_records)
+
+    def add(self, key_id, timestamp, cpu, memory):
+        """Folds a sample into its bucket; returns the finished bucket record if one closed."""
+        start = timestamp - timestamp % self.bucket
+        pending = self.pending.get(key_id)
+        if pending and pending[0] == start:
+            pending[1] += 1
+            pending[2] += (cpu - pending[2]) / pending[1]
+            pending[3] += (memory - pending[3]) / pending[1]
+            return None
+        self.pending[key_id] = [start, 1, cpu, memory]
+        if pending:
+            return (pending[0], key_id, pending[1], pending[2], pending[3])
+        return None
+
+    def write_pending(self):
+        """Writes the buckets still filling, e.g. on shutdown.
+
+        A bucket cut short this way is continued as a second record for the same
+        start if sampling resumes within it; readers average them like any samples.
+        """
+        self.write([(start, key_id, n, cpu, memory) for key_id, (start, n, cpu, memory) in self.pending.items()])
+        self.pending = {}
+
+    def write(self, rows):
+        if not rows:
+            return
+        rows = np.array(rows, dtype=RECORD)
+        while len(rows):
+            if self.segment is None or self.segment.full:
+                if self.segment:
+                    self.segment.flush()
+                path = os.path.join(self.directory, f"{int(rows[0]['t'])}.seg")
+                self.segment = _Segment(path, self.segment_records)
+            room = len(self.segment.records) - self.segment.count
+            self.segment.append(rows[:room])
+            rows = rows[room:]
+
+    def read(self, key_id, since):
+        """All records of one series newer than since, oldest first, read from the mapped segments."""
+        return self.read_all(since, key_ids=[key_id])
+
+    def read_all(self, since, key_ids=None):
+        """Records newer than since, of every series or of key_ids, oldest first; each segment is read once."""
+        paths = self.segment_paths()
+        chunks = []
+        for i, path in enumerate(paths):
+            # A segment ends where the next one starts, skip those entirely before since
+            if i + 1 < len(paths) and int(os.path.basename(paths[i + 1])[:-4]) < since:
+                continue
+            if self.segment and path == self.segment.path:
+                records = self.segment.records[:self.segment.count]
+            else:
+                records = np.memmap(path, dtype=RECORD, mode="r")
+            mask = records["t"] >= since
+            if key_ids is not None:
+                mask &= np.isin(records["key"], key_ids)
+            chunks.append(records[mask])
+        if not chunks:
+            return np.zeros(0, dtype=RECORD)
+        return np.concatenate(chunks)
+
+    def expire(self, cutoff):
+        paths = self.segment_paths()
+        for i, path in enumerate(paths[:-1]):
+            # Everything in a segment is older than the start of the next one
+            if int(os.path.basename(paths[i + 1])[:-4]) < cutoff:
+                os.remove(path)
+
+    def flush(self):
+        if self.segment:
+            self.segment.flush()
+
+
+class MetricsHistory:
+    """Persistent usage history in memory-mapped segment files under storage/.
+
+    Samples are rolled up into 5s, 10s, 1m and 10m buckets, one directory of
+    segment files per tier and kube context. Old segments are deleted past each
+    tier's retention (seconds, configurable per tier). close() writes the
+    buckets still filling, which would otherwise be lost.
+    """
+
+    def __init__(self, root="storage/metrics", retention=None, segment_records=65536):
+        self.root = root
+        self.retention = dict(DEFAULT_RETENTION, **(retention or {}))
+        self.segment_records = segment_records
+        self._lock = threading.Lock()
+        self._tiers = {}
+        self._keys = {}
+        self._keys_file = None
+        self._last_expire = 0
+
+    def open(self, context_name):
+        """Switches to the history of one context, closing whatever was open before."""
+        with self._lock:
+            self._close_locked()
+            directory = os.path.join(self.root, re.sub(r"[^A-Za-z0-9_.-]", "_", context_name or "default"))
+            os.makedirs(directory, exist_ok=True)
+
+            self._keys_file = os.path.join(directory, "keys.json")
+            self._keys = {}
+            if os.path.exists(self._keys_file):
+                with open(self._keys_file, 'r') as f:
+                    self._keys = json.load(f)
+
+            self._tiers = {}
+            for name, bucket in TIERS.items():
+                tier = _Tier(os.path.join(directory, name), bucket, self.segment_records)
+                tier.open_latest()
+                self._tiers[name] = tier
+
+    def append(self, series_key, timestamp, cpu, memory):
+        with self._lock:
+            if not self._tiers:
+                return
+            key_id = self._key_id(series_key)
+            for tier in self._tiers.values():
+                row = tier.add(key_id, timestamp, cpu, memory)
+                if row:
+                    tier.write([row])
+
+            if timestamp - self._last_expire > 600:
+                self._last_expire = timestamp
+                for name, tier in self._tiers.items():
+                    tier.expire(timestamp - self.retention[name])
+
+    def window(self, series_key, seconds, tier=None, now=None):
+        """Returns (times, values) of one series over the last seconds, values[:, 0] CPU and values[:, 1] memory.
+
+        Picks the finest tier that still covers the range unless one is given.
+        """
+        now = now or time.time()
+        tier = tier or self.tier_for(seconds)
+        with self._lock:
+            if series_key not in self._keys or tier not in self._tiers:
+                return np.zeros(0), np.zeros((0, 2))
+            records = self._tiers[tier].read(self._keys[series_key], now - seconds)
+        return records["t"], np.column_stack((records["cpu"], records["mem"]))
+
+    def windows(self, prefix, seconds, tier, now=None):
+        """window() of every series whose key starts with prefix, as {series key: (times, values)}.
+
+        Reads each segment once for all of them, e.g. to seed the in-memory store.
+        """
+        now = now or time.time()
+        with self._lock:
+            if tier not in self._tiers:
+                return {}
+            series = {key_id: key for key, key_id in self._keys.items() if key.startswith(prefix)}
+            if not series:
+                return {}
+            records = self._tiers[tier].read_all(now - seconds, key_ids=list(series))
+        # A stable sort keeps each series in time order
+        records = records[np.argsort(records["key"], kind="stable")]
+        key_ids, starts = np.unique(records["key"], return_index=True)
+        result = {}
+        for key_id, chunk in zip(key_ids, np.split(records, starts[1:])):
+            result[series[int(key_id)]] = (chunk["t"], np.column_stack((chunk["cpu"], chunk["mem"])))
+        return result
+
+    def series_keys(self, prefix=""):
+        with self._lock:
+            return [key for key in self._keys if key.startswith(prefix)]
+
+    def tier_for(self, seconds):
+        if seconds <= 2 * 3600:
+            return "10s"
+        if seconds <= 24 * 3600:
+            return "1m"
+        return "10m"
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """Writes the partly filled buckets and flushes; appends are ignored until the next open()."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self):
+        for tier in self._tiers.values():
+            tier.write_pending()
+        self._flush_locked()
+        self._tiers = {}
+
+    def _flush_locked(self):
+        for tier in self._tiers.values():
+            tier.flush()
+
+    def _key_id(self, series_key):
+        key_id = self._keys.get(series_key)
+        if key_id is None:
+            key_id = self._keys[series_key] = len(self._keys)
+            with open(self._keys_file, 'w') as f:
+                json.dump(self._keys, f)
+        return key_id
+
+
+def resample(times, values, start, end, buckets):
+    """Averages samples into evenly spaced buckets between start and end; empty buckets are 0."""
+    edges = np.linspace(start, end, buckets + 1)
+    index = np.clip(np.searchsorted(edges, times, side="right") - 1, 0, buckets - 1)
+    counts = np.bincount(index, minlength=buckets)
+    result = np.zeros((buckets, values.shape[1]))
+    for column in range(values.shape[1]):
+        sums = np.bincount(index, weights=values[:, column], minlength=buckets)
+        np.divide(sums, counts, out=result[:, column], where=counts > 0)
+    return edges[:-1], result
+
+
+# Singleton instance
+metrics_history = MetricsHistory()
@@ -0,0 +1,254 @@
+import threading
+import time
+
+import numpy as np
+
+from src.services.kube_service import kube_service
+from src.services.metrics_history import TIERS, metrics_history
+from src.services.quantity import usage_arrays
+from src.services.scheduler import scheduler
+
+
+class RingBuffer:
+    """Fixed-size time series of (cpu millicores, memory bytes) samples.
+
+    Every sample is written twice, at slot i and i + capacity, so the last n
+    samples are always one contiguous slice: appends are O(1) and window reads
+    are numpy views, never copies. A view's oldest sample can be overwritten by
+    a later append; copy it if it has to outlive the next tick.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.count = 0
+        self.last_timestamp = 0.0
+        self._next = 0
+        self._times = np.zeros(2 * capacity, dtype=np.float64)
+        self._values = np.zeros((2 * capacity, 2), dtype=np.float32)
+
+    def append(self, timestamp, cpu, memory):
+        i = self._next
+        j = i + self.capacity
+        self._times[i] = self._times[j] = timestamp
+        self._values[i, 0] = self._values[j, 0] = cpu
+        self._values[i, 1] = self._values[j, 1] = memory
+        self._next = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.last_timestamp = timestamp
+
+    def extend(self, times, values):
+        """Appends many samples at once, e.g. history loaded from disk."""
+        times, values = times[-self.capacity:], values[-self.capacity:]
+        if not len(times):
+            return
+        slots = (self._next + np.arange(len(times))) % self.capacity
+        self._times[slots] = self._times[slots + self.capacity] = times
+        self._values[slots] = self._values[slots + self.capacity] = values
+        self._next = (self._next + len(times)) % self.capacity
+        self.count = min(self.count + len(times), self.capacity)
+        self.last_timestamp = float(times[-1])
+
+    def window(self, n=None):
+        """Returns (times, values) for the last n samples, oldest first. values[:, 0] is CPU, values[:, 1] memory."""
+        n = self.count if n is None else min(n, self.count)
+        end = self._next + self.capacity
+        return self._times[end - n:end], self._values[end - n:end]
+
+    def stats(self, n=None, percentile=95):
+        """Min/max/mean/percentile per column over the last n samples, or None if empty."""
+        _, values = self.window(n)
+        if not len(values):
+            return None
+        return {
+            "min": values.min(axis=0),
+            "max": values.max(axis=0),
+            "mean": values.mean(axis=0),
+            f"p{percentile}": np.percentile(values, percentile, axis=0),
+        }
+
+
+class MetricsStore:
+    """Usage history per cluster, node, namespace, workload and pod, in ring buffers."""
+
+    # Samples kept per scope; at the 5s sampling interval 720 is one hour
+    CAPACITY = {"cluster": 720, "node": 720, "namespace": 360, "workload": 360, "pod": 120}
+
+    def __init__(self, stale_after=600):
+        self._series = {}
+        self._lock = threading.Lock()
+        self._stale_after = stale_after
+
+    def append(self, scope, key, timestamp, cpu, memory):
+        with self._lock:
+            series = self._series.get((scope, key))
+            if series is None:
+                series = self._series[(scope, key)] = RingBuffer(self.CAPACITY[scope])
+            series.append(timestamp, cpu, memory)
+
+    def extend(self, scope, key, times, values):
+        with self._lock:
+            series = self._series.get((scope, key))
+            if series is None:
+                series = self._series[(scope, key)] = RingBuffer(self.CAPACITY[scope])
+            series.extend(times, values)
+
+    def series(self, scope, key):
+        with self._lock:
+            return self._series.get((scope, key))
+
+    def window(self, scope, key, n=None):
+        series = self.series(scope, key)
+        if series is None:
+            return np.zeros(0), np.zeros((0, 2), dtype=np.float32)
+        return series.window(n)
+
+    def keys(self, scope):
+        with self._lock:
+            return [key for s, key in self._series if s == scope]
+
+    def clear(self):
+        with self._lock:
+            self._series = {}
+
+    def record(self, pod_metrics, node_metrics, pods, timestamp=None):
+        """Appends one sample to every series from a single metrics tick.
+
+        pod_metrics is keyed by namespace/name as returned by get_pod_metrics("all"),
+        pods is a list of PodSummary used to roll pods up into their workload.
+        """
+        timestamp = timestamp or time.time()
+
+        keys, cpu, memory = usage_arrays(pod_metrics)
+        cpu = np.frombuffer(cpu, dtype=np.float64)
+        memory = np.frombuffer(memory, dtype=np.float64)
+
+        for key, c, m in zip(keys, cpu, memory):
+            self.append("pod", key, timestamp, c, m)
+        self.append("cluster", "all", timestamp, cpu.sum(), memory.sum())
+
+        # Roll up with one bincount per scope instead of per-pod dict updates
+        namespaces = [key.split("/", 1)[0] for key in keys]
+        workloads_by_pod = {f"{p.namespace}/{p.name}": _workload_of(p) for p in pods}
+        workloads = [
+            f"{ns}/{workloads_by_pod[key]}" if workloads_by_pod.get(key) else None
+            for ns, key in zip(namespaces, keys)
+        ]
+        self._append_grouped("namespace", namespaces, cpu, memory, timestamp)
+        self._append_grouped("workload", workloads, cpu, memory, timestamp)
+
+        node_keys, node_cpu, node_memory = usage_arrays(node_metrics)
+        for key, c, m in zip(node_keys, node_cpu, node_memory):
+            self.append("node", key, timestamp, c, m)
+
+        self._prune(timestamp)
+
+    def _append_grouped(self, scope, groups, cpu, memory, timestamp):
+        selected = [i for i, group in enumerate(groups) if group]
+        if not selected:
+            return
+        names, inverse = np.unique([groups[i] for i in selected], return_inverse=True)
+        cpu_sums = np.bincount(inverse, weights=cpu[selected], minlength=len(names))
+        memory_sums = np.bincount(inverse, weights=memory[selected], minlength=len(names))
+        for name, c, m in zip(names, cpu_sums, memory_sums):
+            self.append(scope, str(name), timestamp, c, m)
+
+    def _prune(self, now):
+        # Pods and workloads come and go, drop series nobody has written to in a while
+        with self._lock:
+            stale = [key for key, series in self._series.items() if now - series.last_timestamp > self._stale_after]
+            for key in stale:
+                del self._series[key]
+
+
+def _workload_of(pod):
+    """Deployment pods are owned by a ReplicaSet named <deployment>-<pod-template-hash>."""
+    controller = pod.controller
+    template_hash = pod.labels.get("pod-template-hash")
+    if controller and template_hash and controller.endswith(f"-{template_hash}"):
+        return controller[:-len(template_hash) - 1]
+    return controller
+
+
+class MetricsSampler:
+    """Scheduler job that feeds the store from metrics.k8s.io every interval seconds.
+
+    Cluster and node samples are also written to the on-disk history, which seeds
+    the store again on the next start so charts do not begin from zero.
+    """
+
+    # Scopes written to disk; pods, workloads and namespaces churn too much to keep
+    PERSISTED_SCOPES = ("cluster", "node")
+
+    def __init__(self, store, history=None, interval=5, pods_max_age=60):
+        self.store = store
+        self.history = history
+        self.interval = interval
+        self._pods_max_age = pods_max_age
+        self._pods = []
+        self._pods_fetched_at = 0
+        self._job = None
+
+    def start(self):
+        if self._job:
+            return
+        self._open_history()
+        # Keeps sampling while the window is in the background so history has no gaps
+        self._job = scheduler.add("metrics.sample", self.sample, self.interval, jitter=0, background=True)
+
+    def stop(self):
+        if self._job:
+            scheduler.remove(self._job)
+            self._job = None
+        if self.history:
+            self.history.close()
+
+    def reset(self):
+        """Forgets everything recorded so far, e.g. after switching to another cluster."""
+        self.store.clear()
+        self._pods = []
+        self._pods_fetched_at = 0
+        self._open_history()
+
+    def _open_history(self):
+        if not self.history:
+            return
+        self.history.open(kube_service.get_active_context_name())
+        # Only the tier at the sampling interval is read, coarser ones would mix
+        # resolutions in one ring buffer
+        tier = next((name for name, bucket in TIERS.items() if bucket == self.interval), None)
+        if tier is None:
+            return
+        # Memory-mapped, so this is array slicing rather than parsing; one pass over
+        # the segments per scope, not per series
+        for scope in self.PERSISTED_SCOPES:
+            seconds = MetricsStore.CAPACITY[scope] * self.interval
+            for series_key, (times, values) in self.history.windows(f"{scope}/", seconds, tier).items():
+                self.store.extend(scope, series_key.split("/", 1)[1], times, values)
+
+    def sample(self):
+        pod_metrics = kube_service.get_pod_metrics(namespace="all")
+        node_metrics = kube_service.get_node_metrics()
+        timestamp = time.time()
+        self.store.record(pod_metrics, node_metrics, self._workload_pods(), timestamp=timestamp)
+        if self.history:
+            self._persist(timestamp)
+
+    def _persist(self, timestamp):
+        for scope in self.PERSISTED_SCOPES:
+            for key in self.store.keys(scope):
+                times, values = self.store.window(scope, key, 1)
+                if len(times) and times[-1] == timestamp:
+                    self.history.append(f"{scope}/{key}", timestamp, float(values[-1, 0]), float(values[-1, 1]))
+
+    def _workload_pods(self):
+        # Pod -> workload mapping changes slowly, so it is refreshed at most once a minute
+        # unless the pod informer makes the listing free anyway
+        if kube_service.cache_synced("pods") or time.time() - self._pods_fetched_at > self._pods_max_age:
+            self._pods = kube_service.list_pod_summaries("", namespace="all")
+            self._pods_fetched_at = time.time()
+        return self._pods
+
+
+# Singleton instances
+metrics_store = MetricsStore()
+metrics_sampler = MetricsSampler(metrics_store, history=metrics_history)
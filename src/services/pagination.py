@@ -0,0 +1,27 @@
+from src.services.instrumentation import read_json
+
+
+def paginate(list_func, limit, raw=False, **kwargs):
+    """Calls a kubernetes list_* function with limit/continue and yields each page.
+
+    Every page is the list object the client returns (items plus metadata), so
+    callers can read the resourceVersion of the snapshot from the last one.
+    With raw=True the client skips model deserialization and pages are the
+    decoded JSON dicts instead.
+    """
+    if raw:
+        kwargs['_preload_content'] = False
+    _continue = None
+    while True:
+        if _continue:
+            page = list_func(limit=limit, _continue=_continue, **kwargs)
+        else:
+            page = list_func(limit=limit, **kwargs)
+        if raw:
+            page = read_json(page)
+            _continue = page.get('metadata', {}).get('continue')
+        else:
+            _continue = page.metadata._continue
+        yield page
+        if not _continue:
+            break
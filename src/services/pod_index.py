@@ -0,0 +1,77 @@
+from collections import defaultdict
+
+
+class PodIndex:
+    """Inverted index from label key=value to PodSummary records, built once from a pod snapshot.
+
+    Lets every workload find its pods by intersecting sets instead of asking the
+    API server once per workload.
+    """
+
+    def __init__(self, pods):
+        self._pods = {}
+        self._by_label = defaultdict(set)  # (key, value) -> pod keys
+        self._by_label_key = defaultdict(set)  # key -> pod keys, for Exists / DoesNotExist
+        self._by_namespace = defaultdict(set)
+
+        for pod in pods:
+            pod_key = f"{pod.namespace}/{pod.name}"
+            self._pods[pod_key] = pod
+            self._by_namespace[pod.namespace].add(pod_key)
+            for key, value in pod.labels.items():
+                self._by_label[(key, value)].add(pod_key)
+                self._by_label_key[key].add(pod_key)
+
+    def __len__(self):
+        return len(self._pods)
+
+    def select(self, selector, namespace=None):
+        """Returns the pods matched by a V1LabelSelector, SelectorSummary or plain match_labels dict.
+
+        A None selector matches nothing, an empty one matches everything, same as the API.
+        """
+        if selector is None:
+            return []
+
+        if isinstance(selector, dict):
+            match_labels, match_expressions = selector, []
+        else:
+            match_labels = selector.match_labels or {}
+            match_expressions = selector.match_expressions or []
+
+        if namespace and namespace != "all":
+            candidates = self._by_namespace.get(namespace, set())
+        else:
+            candidates = set(self._pods)
+
+        # Smallest sets first so the intersection shrinks as fast as possible
+        required = sorted(
+            (self._by_label.get((k, v), set()) for k, v in match_labels.items()),
+            key=len
+        )
+        for pod_keys in required:
+            candidates = candidates & pod_keys
+            if not candidates:
+                return []
+
+        for expr in match_expressions:
+            candidates = self._apply_expression(candidates, expr)
+            if not candidates:
+                return []
+
+        return [self._pods[key] for key in sorted(candidates)]
+
+    def _apply_expression(self, candidates, expr):
+        values = expr.values or []
+        if expr.operator == "In":
+            matching = set().union(*(self._by_label.get((expr.key, v), set()) for v in values))
+            return candidates & matching
+        if expr.operator == "NotIn":
+            excluded = set().union(*(self._by_label.get((expr.key, v), set()) for v in values))
+            return candidates - excluded
+        if expr.operator == "Exists":
+            return candidates & self._by_label_key.get(expr.key, set())
+        if expr.operator == "DoesNotExist":
+            return candidates - self._by_label_key.get(expr.key, set())
+        print(f"Unknown label selector operator: {expr.operator}")
+        return set()
@@ -0,0 +1,191 @@
+from collections import OrderedDict, deque
+import itertools
+import threading
+import time
+
+from kubernetes.client.rest import ApiException
+
+from src.services.kube_service import kube_service
+from src.services.scheduler import scheduler
+
+# Resource types ResourceView can show -> informer kind
+KINDS = {"deployment": "deployments", "cronjob": "cronjobs"}
+
+# Lines of the first pod's log kept, what LogsTab shows by default
+LOG_TAIL = 500
+
+# Rough bytes per pod model, for the memory budget
+POD_SIZE = 4096
+
+# Priorities, lower runs first
+HOVER, RECENT, VISIBLE = 0, 1, 2
+
+
+class PrefetchEntry:
+    """What ResourceView needs to open one workload, read ahead of the click."""
+    __slots__ = ("resource", "pods", "log_pod", "log_container", "log_tail", "yaml", "fetched_at", "size")
+
+    def __init__(self, resource, pods, log_pod, log_container, log_tail, yaml, fetched_at):
+        self.resource = resource
+        self.pods = pods
+        self.log_pod = log_pod  # pod and container the tail was read from
+        self.log_container = log_container
+        self.log_tail = log_tail  # list of lines, None if there was no pod to read
+        self.yaml = yaml
+        self.fetched_at = fetched_at
+        self.size = 2 * len(yaml) + POD_SIZE * len(pods) + sum(len(line) + 50 for line in log_tail or [])
+
+
+class Prefetcher:
+    """Warms the deployment, its pods, a log tail and the YAML of workloads about to be opened.
+
+    Requests come from hovered cards, the most recently opened resources and the
+    cards in view, in that order of priority. Cards in view are warmed once and
+    without a log tail, so a view left open does not keep re-reading them. One
+    background thread works the queue, pausing between fetches and while the
+    window is inactive, so it never competes with what is on screen. Entries
+    expire after ttl seconds and the least recently used are dropped beyond
+    budget_bytes. Informer events for a workload drop its entry. Entries are
+    only drawn first, ResourceView reads everything again after.
+    """
+
+    def __init__(self, budget_bytes=32 * 2**20, ttl=30, max_recent=5, pause=0.2):
+        self.budget_bytes = budget_bytes
+        self.ttl = ttl
+        self.pause = pause
+        self.enabled = True  # False ignores requests, e.g. while benchmarking the views
+        self._cond = threading.Condition()
+        self._entries = OrderedDict()  # key -> PrefetchEntry, least recently used first
+        self._size = 0
+        self._queue = {}  # key -> (priority, order)
+        self._order = itertools.count()
+        self._recent = deque(maxlen=max_recent)
+        self._thread = None
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, resource_type, name, namespace):
+        return (kube_service.get_active_context_name(), namespace or kube_service.active_namespace, resource_type, name)
+
+    def hover(self, resource_type, name, namespace=None):
+        self._enqueue(self._key(resource_type, name, namespace), HOVER)
+
+    def visible(self, items, namespace=None):
+        """(resource type, name) of the cards in view; also re-warms the recently opened ones."""
+        for resource_type, name in items:
+            self._enqueue(self._key(resource_type, name, namespace), VISIBLE)
+        for key in list(self._recent):
+            self._enqueue(key, RECENT)
+
+    def opened(self, resource_type, name, namespace=None):
+        key = self._key(resource_type, name, namespace)
+        with self._cond:
+            if key in self._recent:
+                self._recent.remove(key)
+            self._recent.appendleft(key)
+
+    def get(self, resource_type, name, namespace=None):
+        """The fresh entry for a workload, or None."""
+        key = self._key(resource_type, name, namespace)
+        with self._cond:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry.fetched_at > self.ttl:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _enqueue(self, key, priority):
+        if not self.enabled or key[2] not in KINDS:
+            return
+        with self._cond:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if priority == VISIBLE:
+                    # Even an expired one; only informer changes and eviction bring a card back
+                    return
+                with_logs = entry.log_tail is not None or not entry.pods
+                if with_logs and time.monotonic() - entry.fetched_at <= self.ttl:
+                    return
+            queued = self._queue.get(key)
+            if queued is None or priority < queued[0]:
+                self._queue[key] = (priority, next(self._order))
+            starting = self._thread is None
+            if starting:
+                self._thread = threading.Thread(target=self._loop, name="prefetch", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        if starting:
+            kube_service.subscribe(self._on_change, kinds=list(KINDS.values()))
+
+    def _on_change(self, kind, event_type, obj):
+        if obj is None:
+            return
+        resource_type = {v: k for k, v in KINDS.items()}[kind]
+        with self._cond:
+            for key in [k for k in self._entries if k[1:] == (obj.metadata.namespace, resource_type, obj.metadata.name)]:
+                self._size -= self._entries.pop(key).size
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._queue or not scheduler.window_active:
+                    # The window state is not signalled here, look again now and then
+                    self._cond.wait(1.0)
+                key = min(self._queue, key=self._queue.get)
+                priority, _ = self._queue.pop(key)
+            if key[0] == kube_service.get_active_context_name():
+                try:
+                    entry = self._fetch(*key[1:], with_logs=priority != VISIBLE)
+                except Exception as e:
+                    print(f"Error prefetching {key[2]} {key[3]}: {e}")
+                    entry = None
+                if entry is not None:
+                    self._store(key, entry)
+            time.sleep(self.pause)
+
+    def _fetch(self, namespace, resource_type, name, with_logs=True):
+        resource = kube_service.cached_object(KINDS[resource_type], name, namespace)
+        if resource is None and resource_type == "deployment":
+            resource = kube_service.get_deployment(name, namespace)
+        elif resource is None and resource_type == "cronjob":
+            resource = kube_service.get_cronjob(name, namespace)
+        if resource is None:
+            return None
+
+        pods = []
+        if resource_type == "deployment" and resource.spec.selector.match_labels:
+            selector_str = ",".join([f"{k}={v}" for k, v in resource.spec.selector.match_labels.items()])
+            pods = kube_service.list_pods(selector_str, namespace)
+
+        # Same pod and container LogsTab starts with
+        log_pod = log_container = log_tail = None
+        if with_logs and pods and pods[0].spec.containers:
+            log_pod, log_container = pods[0].metadata.name, pods[0].spec.containers[0].name
+            try:
+                log_tail = list(kube_service.stream_pod_logs(
+                    log_pod, namespace, container=log_container, follow=False, tail_lines=LOG_TAIL
+                ))
+            except ApiException as e:
+                print(f"Error prefetching pod logs: {e}")
+
+        yaml_str = kube_service.get_resource_yaml(resource)
+        return PrefetchEntry(resource, pods, log_pod, log_container, log_tail, yaml_str, time.monotonic())
+
+    def _store(self, key, entry):
+        if entry.size > self.budget_bytes:
+            return
+        with self._cond:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old.size
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.budget_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+
+# Singleton instance
+prefetcher = Prefetcher()
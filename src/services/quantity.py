@@ -0,0 +1,108 @@
+import re
+from array import array
+from functools import lru_cache
+
+
+# Kubernetes resource.Quantity: <signed number><suffix>, where the suffix is a
+# binary SI unit (Ki..Ei), a decimal SI unit (n..E) or a decimal exponent (e3, E-2).
+_QUANTITY_RE = re.compile(r"^([+-]?(?:\d+\.?\d*|\.\d+))(?:(Ki|Mi|Gi|Ti|Pi|Ei|[numkMGTPE])|[eE]([+-]?\d+))?$")
+
+_MULTIPLIERS = {
+    "Ki": 2 ** 10, "Mi": 2 ** 20, "Gi": 2 ** 30, "Ti": 2 ** 40, "Pi": 2 ** 50, "Ei": 2 ** 60,
+    "n": 1e-9, "u": 1e-6, "m": 1e-3, None: 1,
+    "k": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "P": 1e15, "E": 1e18,
+}
+
+_MIB = 2 ** 20
+
+
+@lru_cache(maxsize=4096)
+def parse_quantity(value):
+    """Parses a quantity string into a float in base units (cores, bytes, count).
+
+    Metrics repeat the same handful of strings on every tick, so results are cached.
+    Raises ValueError for anything that is not a valid quantity.
+    """
+    match = _QUANTITY_RE.match(value.strip())
+    if not match:
+        raise ValueError(f"Invalid quantity: {value!r}")
+    number, suffix, exponent = match.groups()
+    if exponent is not None:
+        return float(number) * 10 ** int(exponent)
+    return float(number) * _MULTIPLIERS[suffix]
+
+
+def _parse_or_zero(value):
+    if value is None:
+        return 0.0
+    try:
+        return parse_quantity(str(value))
+    except ValueError:
+        return 0.0
+
+
+def to_millicores(value):
+    """CPU quantity -> millicores. Missing or invalid values count as 0."""
+    return _parse_or_zero(value) * 1000
+
+
+def to_bytes(value):
+    """Memory or storage quantity -> bytes. Missing or invalid values count as 0."""
+    return _parse_or_zero(value)
+
+
+def parse_count(value):
+    """Plain count such as a node's pod capacity. Missing or invalid values count as 0."""
+    return _parse_or_zero(value)
+
+
+def usage_arrays(metrics_map):
+    """Converts a metrics.k8s.io map (pods or nodes) into numeric arrays in one pass.
+
+    Returns (keys, cpu_millicores, memory_bytes); pod entries are summed over
+    their containers, node entries read their top-level usage.
+    """
+    keys = []
+    cpu = array('d')
+    memory = array('d')
+    for key, item in metrics_map.items():
+        usages = [c.get('usage', {}) for c in item['containers']] if 'containers' in item else [item.get('usage', {})]
+        keys.append(key)
+        cpu.append(sum(to_millicores(u.get('cpu')) for u in usages))
+        memory.append(sum(to_bytes(u.get('memory')) for u in usages))
+    return keys, cpu, memory
+
+
+def container_totals(containers):
+    """Sums requests and limits over ContainerSummary records.
+
+    Returns (cpu_req, cpu_lim, mem_req, mem_lim) in millicores / bytes, with None
+    for anything no container sets.
+    """
+    cpu_req = cpu_lim = mem_req = mem_lim = None
+    for c in containers:
+        if 'cpu' in c.requests: cpu_req = (cpu_req or 0) + to_millicores(c.requests['cpu'])
+        if 'cpu' in c.limits: cpu_lim = (cpu_lim or 0) + to_millicores(c.limits['cpu'])
+        if 'memory' in c.requests: mem_req = (mem_req or 0) + to_bytes(c.requests['memory'])
+        if 'memory' in c.limits: mem_lim = (mem_lim or 0) + to_bytes(c.limits['memory'])
+    return cpu_req, cpu_lim, mem_req, mem_lim
+
+
+def format_cpu(millicores):
+    if millicores is None:
+        return None
+    if millicores >= 1000 and millicores % 1000 == 0:
+        return f"{int(millicores // 1000)}"
+    if millicores >= 1:
+        return f"{millicores:.0f}m"
+    return f"{millicores:.2f}m"
+
+
+def format_memory(num_bytes):
+    if num_bytes is None:
+        return None
+    for unit, size in (("Ti", 2 ** 40), ("Gi", 2 ** 30), ("Mi", _MIB), ("Ki", 2 ** 10)):
+        if num_bytes >= size:
+            value = num_bytes / size
+            return f"{value:.0f}{unit}" if value == int(value) else f"{value:.1f}{unit}"
+    return f"{num_bytes:.0f}"
@@ -0,0 +1,156 @@
+from concurrent.futures import ThreadPoolExecutor
+import random
+import threading
+import time
+
+
+class Job:
+    """One periodic task. Created through Scheduler.add, which returns it as a handle."""
+
+    def __init__(self, name, func, interval, jitter=0.1, max_backoff=300, min_gap=1.0, owner=None, background=False):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self.min_gap = min_gap  # Triggers never run a job more often than this
+        self.owner = owner  # Flet control; the job is paused while it is not on a page
+        self.background = background  # Keeps running while the window is minimized or unfocused
+        self.paused = False
+        self.failures = 0
+        self.next_run = 0.0
+        self.last_start = 0.0
+        self.last_duration = None  # Seconds the last run took
+        self.in_flight = False
+        self.rerun = False
+
+
+class Scheduler:
+    """Runs every periodic job of the app from one timer thread.
+
+    Jobs run on a small worker pool and a job never overlaps itself: a job that
+    comes due, or is triggered, while it is still running runs once more right
+    after instead of stacking up. Each run is rescheduled interval seconds out
+    with some jitter, so jobs added together do not stay in lockstep; failures
+    back off exponentially up to max_backoff. Jobs owned by a control pause while
+    it is unmounted, and all but background jobs pause while the window is
+    minimized or unfocused.
+    """
+
+    def __init__(self, max_workers=4):
+        self._jobs = {}
+        self._cond = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scheduler")
+        self._running = False
+        self.window_active = True
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        threading.Thread(target=self._loop, name="scheduler", daemon=True).start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+    def add(self, name, func, interval, run_now=True, **options):
+        """Registers func to run every interval seconds, replacing any job of the same name."""
+        job = Job(name, func, interval, **options)
+        job.next_run = time.monotonic() if run_now else self._next_time(job)
+        with self._cond:
+            self._jobs[name] = job
+            self._cond.notify_all()
+        return job
+
+    def remove(self, job):
+        """Unregisters a job handle; a newer job registered under the same name is left alone."""
+        with self._cond:
+            if self._jobs.get(job.name) is job:
+                del self._jobs[job.name]
+
+    def jobs(self):
+        """Snapshot of the registered jobs."""
+        with self._cond:
+            return list(self._jobs.values())
+
+    def trigger(self, job):
+        """Runs a job as soon as its min_gap allows, e.g. when a watch reports a change."""
+        with self._cond:
+            if job.in_flight:
+                job.rerun = True
+                return
+            job.next_run = min(job.next_run, max(time.monotonic(), job.last_start + job.min_gap))
+            self._cond.notify_all()
+
+    def pause(self, job):
+        with self._cond:
+            job.paused = True
+
+    def resume(self, job):
+        with self._cond:
+            job.paused = False
+            self._cond.notify_all()
+
+    def set_window_active(self, active):
+        with self._cond:
+            self.window_active = active
+            self._cond.notify_all()
+
+    def _runnable(self, job):
+        if job.paused or job.in_flight:
+            return False
+        if not job.background and not self.window_active:
+            return False
+        return job.owner is None or job.owner.page is not None
+
+    def _loop(self):
+        with self._cond:
+            while self._running:
+                now = time.monotonic()
+                runnable = [job for job in self._jobs.values() if self._runnable(job)]
+                for job in runnable:
+                    if job.next_run <= now:
+                        job.in_flight = True
+                        job.last_start = now
+                        try:
+                            self._executor.submit(self._execute, job)
+                        except RuntimeError:
+                            # The pool is shut down at interpreter exit
+                            return
+
+                upcoming = [job.next_run for job in runnable if not job.in_flight]
+                # Re-check at least once a second, owners can be unmounted without telling us
+                timeout = min([1.0] + [max(0.0, t - now) for t in upcoming])
+                self._cond.wait(timeout)
+
+    def _execute(self, job):
+        started = time.monotonic()
+        try:
+            job.func()
+            job.failures = 0
+        except Exception as e:
+            job.failures += 1
+            print(f"Error in scheduled job {job.name} (attempt {job.failures}): {e}")
+
+        with self._cond:
+            job.last_duration = time.monotonic() - started
+            job.in_flight = False
+            if job.rerun:
+                job.rerun = False
+                job.next_run = job.last_start + job.min_gap
+            else:
+                job.next_run = self._next_time(job)
+            self._cond.notify_all()
+
+    def _next_time(self, job):
+        delay = job.interval
+        if job.failures:
+            delay = min(job.interval * 2 ** job.failures, max(job.max_backoff, job.interval))
+        return time.monotonic() + delay * random.uniform(1 - job.jitter, 1 + job.jitter)
+
+
+# Singleton instance
+scheduler = Scheduler()
@@ -0,0 +1,148 @@
+import functools
+import threading
+import time
+
+
+class _Call:
+    __slots__ = ("done", "value", "error", "cacheable")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.cacheable = True
+
+
+class SingleFlight:
+    """Shares one execution between identical concurrent calls.
+
+    The first caller for a key runs the function and everyone arriving while it
+    is in flight waits for and gets the same result. Results then stay fresh for
+    ttl seconds, so callers in the same refresh cycle reuse them too; expired
+    ones are dropped when looked up and swept once per ttl. Errors are passed to
+    every waiter but never cached, and neither is a result whose resource was
+    invalidated while it was being read, nor a fallback value the function
+    returned after calling uncached().
+    """
+
+    def __init__(self, ttl=2.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._results = {}  # key -> (finished at, value)
+        self._generations = {}  # resource -> invalidations so far, None for invalidate() of everything
+        self._last_sweep = time.monotonic()
+        self._local = threading.local()  # per thread, the calls this thread is running, outermost first
+
+    def _generation(self, key):
+        return self._generations.get(None, 0), self._generations.get(key[1], 0)
+
+    def do(self, key, func):
+        with self._lock:
+            cached = self._results.get(key)
+            if cached:
+                if time.monotonic() - cached[0] < self.ttl:
+                    return cached[1]
+                del self._results[key]
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _Call()
+                generation = self._generation(key)
+
+        if not leader:
+            call.done.wait()
+            if call.error:
+                raise call.error
+            if not call.cacheable:
+                # A result built from this one is no better
+                self.uncached()
+            return call.value
+
+        stack = self._stack()
+        stack.append(call)
+        try:
+            call.value = func()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            stack.pop()
+            with self._lock:
+                if self._in_flight.get(key) is call:
+                    del self._in_flight[key]
+                if call.error is None and call.cacheable and self.ttl > 0 and self._generation(key) == generation:
+                    self._store(key, call.value)
+            call.done.set()
+        return call.value
+
+    def uncached(self):
+        """Keeps the results being computed on this thread out of the cache.
+
+        For functions that catch an error and return a fallback such as []: the
+        waiting callers still get it, but the next call tries again. Calls
+        further out that use the result are kept out of the cache too.
+        """
+        for call in self._stack():
+            call.cacheable = False
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _store(self, key, value):
+        now = time.monotonic()
+        if now - self._last_sweep >= self.ttl:
+            for expired in [k for k, (finished, _) in self._results.items() if now - finished >= self.ttl]:
+                del self._results[expired]
+            self._last_sweep = now
+        self._results[key] = (now, value)
+
+    def invalidate(self, resource=None):
+        """Drops cached results of one resource (the key's second item), or all of them.
+
+        Reads of it already in flight still answer their callers but are not
+        cached, and later callers start a new read instead of joining them.
+        """
+        with self._lock:
+            self._generations[resource] = self._generations.get(resource, 0) + 1
+            if resource is None:
+                self._results.clear()
+                self._in_flight.clear()
+                return
+            for key in [k for k in self._results if k[1] == resource]:
+                del self._results[key]
+            for key in [k for k in self._in_flight if k[1] == resource]:
+                del self._in_flight[key]
+
+
+def coalesced(verb, resource):
+    """KubeService method decorator: identical calls share one round trip through self.coalescer.
+
+    Calls are keyed by verb, resource, the active context and namespace (the
+    default for namespace=None) and the call arguments, e.g. the selector.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (verb, resource, self.get_active_context_name(), self.active_namespace,
+                   repr(args), repr(sorted(kwargs.items())))
+            return self.coalescer.do(key, lambda: method(self, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def invalidates(*resources):
+    """KubeService method decorator for writes: cached reads of these resources are dropped afterwards."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                for resource in resources:
+                    self.coalescer.invalidate(resource)
+        return wrapper
+    return decorator
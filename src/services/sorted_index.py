@@ -0,0 +1,86 @@
+import bisect
+import threading
+
+
+class SortedIndex:
+    """Objects kept in several sort orders at once, updated incrementally.
+
+    keys maps an order name to a key function. Each order is a sorted list of
+    (key, identity) pairs, so adding, changing or removing one object is a
+    bisect per order instead of a re-sort, and switching orders (or direction)
+    is only a matter of reading another list. Objects are told apart by
+    identity(obj), e.g. their UID. Safe to use from several threads, e.g.
+    windows read while scrolling during a refresh.
+    """
+
+    # Above this share of changed objects one sort per order beats many insertions
+    REBUILD_FRACTION = 0.25
+
+    def __init__(self, keys, identity):
+        self.keys = keys
+        self.identity = identity
+        self._key_funcs = list(keys.values())
+        self._objects = {}  # identity -> (obj, tuple of its key in each order)
+        self._orders = [[] for _ in keys]  # per order, sorted (key, identity)
+        self._positions = {order: i for i, order in enumerate(keys)}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._objects)
+
+    def update(self, objects):
+        """Adds new objects and re-positions changed ones; returns how many moved or arrived."""
+        keyed = self._keyed(objects)
+        with self._lock:
+            return self._update(keyed)
+
+    def replace(self, objects):
+        """Makes the index hold exactly objects; returns (added or changed, removed)."""
+        keyed = self._keyed(objects)
+        seen = {ident for ident, _, _ in keyed}
+        with self._lock:
+            # Removals and updates happen under one hold, readers never see an object half gone
+            gone = [ident for ident in self._objects if ident not in seen]
+            self._apply([(ident, self._objects.pop(ident)[1], None) for ident in gone])
+            return self._update(keyed), len(gone)
+
+    def _keyed(self, objects):
+        # Keys are computed before taking the lock, readers only wait for the moves
+        return [(self.identity(obj), obj, tuple([key(obj) for key in self._key_funcs])) for obj in objects]
+
+    def _update(self, keyed):
+        moves = []  # (identity, old keys or None, new keys or None)
+        for ident, obj, keys in keyed:
+            current = self._objects.get(ident)
+            self._objects[ident] = (obj, keys)
+            if current is None or current[1] != keys:
+                moves.append((ident, current[1] if current else None, keys))
+        self._apply(moves)
+        return len(moves)
+
+    def _apply(self, moves):
+        if not moves:
+            return
+        if len(moves) > len(self._objects) * self.REBUILD_FRACTION:
+            for i in range(len(self._orders)):
+                # identity makes every entry unique, so equal keys never need the objects compared
+                self._orders[i] = sorted((keys[i], ident) for ident, (_, keys) in self._objects.items())
+            return
+        for ident, old, new in moves:
+            for i, entries in enumerate(self._orders):
+                if old is not None:
+                    del entries[bisect.bisect_left(entries, (old[i], ident))]
+                if new is not None:
+                    bisect.insort(entries, (new[i], ident))
+
+    def window(self, order, ascending, start, count):
+        """The objects at positions start..start+count of an order."""
+        with self._lock:
+            entries = self._orders[self._positions[order]]
+            if ascending:
+                selected = entries[start:start + count]
+            else:
+                end = len(entries) - start
+                selected = entries[max(0, end - count):max(0, end)][::-1]
+            return [self._objects[ident][0] for _, ident in selected]
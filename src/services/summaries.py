@@ -0,0 +1,201 @@
+import datetime
+
+
+# Compact read-only records holding just the fields the dashboard and controller
+# views render. They are built either straight from the decoded JSON of a LIST
+# (from_dict, the fast path) or from kubernetes client models (from_model).
+
+def _parse_timestamp(value):
+    """RFC3339 string from the API -> epoch seconds."""
+    if not value:
+        return None
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+class ExpressionSummary:
+    __slots__ = ("key", "operator", "values")
+
+    def __init__(self, key, operator, values):
+        self.key = key
+        self.operator = operator
+        self.values = values
+
+
+class SelectorSummary:
+    """Same attribute names as V1LabelSelector, so PodIndex accepts either."""
+    __slots__ = ("match_labels", "match_expressions")
+
+    def __init__(self, match_labels, match_expressions):
+        self.match_labels = match_labels
+        self.match_expressions = match_expressions
+
+    @classmethod
+    def from_dict(cls, raw):
+        if raw is None:
+            return None
+        return cls(
+            raw.get("matchLabels") or {},
+            [ExpressionSummary(e["key"], e["operator"], e.get("values") or []) for e in raw.get("matchExpressions") or []],
+        )
+
+    @classmethod
+    def from_model(cls, selector):
+        if selector is None:
+            return None
+        return cls(
+            selector.match_labels or {},
+            [ExpressionSummary(e.key, e.operator, e.values or []) for e in selector.match_expressions or []],
+        )
+
+
+class ContainerSummary:
+    __slots__ = ("name", "image", "requests", "limits")
+
+    def __init__(self, name, image, requests, limits):
+        self.name = name
+        self.image = image
+        self.requests = requests
+        self.limits = limits
+
+    @classmethod
+    def from_dict(cls, raw):
+        resources = raw.get("resources") or {}
+        return cls(raw.get("name"), raw.get("image"), resources.get("requests") or {}, resources.get("limits") or {})
+
+    @classmethod
+    def from_model(cls, container):
+        resources = container.resources
+        requests = (resources.requests if resources else None) or {}
+        limits = (resources.limits if resources else None) or {}
+        return cls(container.name, container.image, requests, limits)
+
+
+class PodSummary:
+    __slots__ = ("uid", "name", "namespace", "labels", "phase", "controller", "created", "restarts", "node_name")
+
+    def __init__(self, uid, name, namespace, labels, phase, controller, created, restarts, node_name):
+        self.uid = uid
+        self.name = name
+        self.namespace = namespace
+        self.labels = labels
+        self.phase = phase
+        self.controller = controller
+        self.created = created
+        self.restarts = restarts
+        self.node_name = node_name
+
+    @classmethod
+    def from_dict(cls, raw):
+        metadata = raw.get("metadata") or {}
+        status = raw.get("status") or {}
+        owners = metadata.get("ownerReferences")
+        return cls(
+            metadata.get("uid"),
+            metadata.get("name"),
+            metadata.get("namespace"),
+            metadata.get("labels") or {},
+            status.get("phase"),
+            owners[0].get("name") if owners else None,
+            _parse_timestamp(metadata.get("creationTimestamp")),
+            sum(cs.get("restartCount", 0) for cs in status.get("containerStatuses") or []),
+            (raw.get("spec") or {}).get("nodeName"),
+        )
+
+    @classmethod
+    def from_model(cls, pod):
+        metadata = pod.metadata
+        owners = metadata.owner_references
+        return cls(
+            metadata.uid,
+            metadata.name,
+            metadata.namespace,
+            metadata.labels or {},
+            pod.status.phase if pod.status else None,
+            owners[0].name if owners else None,
+            metadata.creation_timestamp.timestamp() if metadata.creation_timestamp else None,
+            sum(cs.restart_count or 0 for cs in (pod.status.container_statuses if pod.status else None) or []),
+            pod.spec.node_name if pod.spec else None,
+        )
+
+
+class NodeSummary:
+    __slots__ = ("name", "ready", "capacity")
+
+    def __init__(self, name, ready, capacity):
+        self.name = name
+        self.ready = ready
+        self.capacity = capacity
+
+    @classmethod
+    def from_dict(cls, raw):
+        status = raw.get("status") or {}
+        return cls(
+            (raw.get("metadata") or {}).get("name"),
+            any(c.get("type") == "Ready" and c.get("status") == "True" for c in status.get("conditions") or []),
+            status.get("capacity") or {},
+        )
+
+    @classmethod
+    def from_model(cls, node):
+        status = node.status
+        return cls(
+            node.metadata.name,
+            any(c.type == "Ready" and c.status == "True" for c in (status.conditions if status else None) or []),
+            (status.capacity if status else None) or {},
+        )
+
+
+class WorkloadSummary:
+    """Deployment or StatefulSet, as far as the controller cards are concerned."""
+    __slots__ = (
+        "uid", "kind", "name", "namespace", "replicas", "ready_replicas",
+        "available_replicas", "selector", "containers", "created",
+    )
+
+    def __init__(self, uid, kind, name, namespace, replicas, ready_replicas, available_replicas, selector, containers, created):
+        self.uid = uid
+        self.kind = kind
+        self.name = name
+        self.namespace = namespace
+        self.replicas = replicas
+        self.ready_replicas = ready_replicas
+        self.available_replicas = available_replicas
+        self.selector = selector
+        self.containers = containers
+        self.created = created
+
+    @classmethod
+    def from_dict(cls, raw, kind):
+        metadata = raw.get("metadata") or {}
+        spec = raw.get("spec") or {}
+        status = raw.get("status") or {}
+        pod_spec = (spec.get("template") or {}).get("spec") or {}
+        return cls(
+            metadata.get("uid"),
+            kind,
+            metadata.get("name"),
+            metadata.get("namespace"),
+            spec.get("replicas") or 0,
+            status.get("readyReplicas") or 0,
+            status.get("availableReplicas") or 0,
+            SelectorSummary.from_dict(spec.get("selector")),
+            [ContainerSummary.from_dict(c) for c in pod_spec.get("containers") or []],
+            _parse_timestamp(metadata.get("creationTimestamp")),
+        )
+
+    @classmethod
+    def from_model(cls, workload, kind):
+        metadata = workload.metadata
+        status = workload.status
+        return cls(
+            metadata.uid,
+            kind,
+            metadata.name,
+            metadata.namespace,
+            workload.spec.replicas or 0,
+            (status.ready_replicas if status else None) or 0,
+            (status.available_replicas if status else None) or 0,
+            SelectorSummary.from_model(workload.spec.selector),
+            [ContainerSummary.from_model(c) for c in workload.spec.template.spec.containers or []],
+            metadata.creation_timestamp.timestamp() if metadata.creation_timestamp else None,
+        )
@@ -0,0 +1,43 @@
+import threading
+
+
+class TopicListeners:
+    """Per-handler subscriptions to a page's pubsub topics.
+
+    Flet's unsubscribe_topic drops every handler a session has on the topic; here
+    each page and topic gets one dispatcher registered with Flet, and handlers
+    come and go behind it without touching anyone else's.
+    """
+
+    def __init__(self):
+        self._handlers = {}  # (session id, topic) -> handlers
+        self._lock = threading.Lock()
+
+    def subscribe(self, page, topic, handler):
+        """Calls handler(topic, message) for messages on topic. Returns a function that removes it."""
+        key = (page.session_id, topic)
+        with self._lock:
+            handlers = self._handlers.get(key)
+            if handlers is None:
+                handlers = self._handlers[key] = []
+                # Stays registered once empty, unsubscribing it would drop other handlers of the topic
+                page.pubsub.subscribe_topic(topic, lambda topic, message: self._dispatch(key, topic, message))
+            handlers.append(handler)
+
+        def unsubscribe():
+            with self._lock:
+                if handler in handlers:
+                    handlers.remove(handler)
+        return unsubscribe
+
+    def _dispatch(self, key, topic, message):
+        with self._lock:
+            handlers = list(self._handlers.get(key, ()))
+        for handler in handlers:
+            try:
+                handler(topic, message)
+            except Exception as e:
+                print(f"Error in {topic} listener: {e}")
+
+
+topic_listeners = TopicListeners()
@@ -0,0 +1,360 @@
+import base64
+import gzip
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from urllib3._collections import HTTPHeaderDict
+from urllib3.exceptions import HTTPError
+
+# Request headers that never go into a recording
+REDACTED_HEADERS = {"authorization", "cookie", "proxy-authorization"}
+
+# Bodies are stored as the caller read them, i.e. already decompressed
+DROPPED_RESPONSE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def _encode_body(data):
+    if isinstance(data, str):
+        return {"text": data}
+    try:
+        return {"text": data.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"b64": base64.b64encode(data).decode("ascii")}
+
+
+def _decode_body(record):
+    if "b64" in record:
+        return base64.b64decode(record["b64"])
+    return record["text"].encode("utf-8")
+
+
+def _request_url(method, url, fields):
+    """The URL urllib3 ends up requesting; GET-style query fields are encoded onto it."""
+    if fields and method in ("GET", "HEAD", "DELETE"):
+        return url + ("&" if "?" in url else "?") + urlencode(fields)
+    return url
+
+
+def exchange_key(method, url, body=None):
+    """What a replayed request is matched on: method, path, sorted query and body, not the host."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return method, parts.path, query, body or ""
+
+
+class TrafficRecorder:
+    """Wraps urllib3 pool managers and writes every exchange to a gzip'd JSON lines file.
+
+    Each request, response head, body chunk and end is one event, written when it
+    happens and stamped with seconds since the recording started, so streams
+    (watches, followed logs) keep their timing and a file cut short by a crash
+    is still readable up to that point. Credentials are never written.
+    """
+
+    def __init__(self, path, flush_interval=1.0):
+        self.path = path
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._start = time.monotonic()
+        self._flush_interval = flush_interval
+        self._last_flush = self._start
+
+    def wrap(self, pool_manager):
+        return _RecordingPoolManager(pool_manager, self)
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def _new_id(self):
+        with self._lock:
+            self._next_id += 1
+            return self._next_id
+
+    def write(self, event, **fields):
+        now = time.monotonic()
+        line = json.dumps({"event": event, "t": round(now - self._start, 6), **fields})
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(line + "\n")
+            if now - self._last_flush >= self._flush_interval:
+                self._file.flush()
+                self._last_flush = now
+
+
+class _RecordingPoolManager:
+    def __init__(self, pool_manager, recorder):
+        self._pool_manager = pool_manager
+        self._recorder = recorder
+
+    def __getattr__(self, name):
+        return getattr(self._pool_manager, name)
+
+    def request(self, method, url, fields=None, headers=None, body=None, **kwargs):
+        recorder = self._recorder
+        exchange = recorder._new_id()
+        request_body = body if fields is None or method in ("GET", "HEAD", "DELETE") else urlencode(fields)
+        recorder.write(
+            "request", id=exchange, method=method, url=_request_url(method, url, fields),
+            headers={k: v for k, v in (headers or {}).items() if k.lower() not in REDACTED_HEADERS},
+            body=request_body.decode("utf-8", "replace") if isinstance(request_body, bytes) else request_body,
+        )
+        try:
+            response = self._pool_manager.request(method, url, fields=fields, headers=headers, body=body, **kwargs)
+        except Exception as e:
+            recorder.write("error", id=exchange, error=f"{type(e).__name__}: {e}")
+            raise
+        recorder.write(
+            "response", id=exchange, status=response.status, reason=response.reason,
+            headers={k: v for k, v in response.headers.items() if k.lower() not in DROPPED_RESPONSE_HEADERS},
+        )
+        recorded = _RecordingResponse(response, recorder, exchange)
+        if kwargs.get("preload_content", True):
+            recorded.data
+        return recorded
+
+
+class _RecordingResponse:
+    """Passes a urllib3 response through, recording the body as the caller reads it."""
+
+    def __init__(self, response, recorder, exchange):
+        self._response = response
+        self._recorder = recorder
+        self._exchange = exchange
+        self._ended = False
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    @property
+    def data(self):
+        data = self._response.data
+        if not self._ended:
+            if data:
+                self._chunk(data)
+            self._end()
+        return data
+
+    def read(self, amt=None, *args, **kwargs):
+        data = self._response.read(amt, *args, **kwargs)
+        if data:
+            self._chunk(data)
+        elif amt is None or amt > 0:
+            self._end()
+        return data
+
+    def stream(self, amt=2 ** 16, decode_content=None):
+        try:
+            for chunk in self._response.stream(amt, decode_content=decode_content):
+                if chunk:
+                    self._chunk(chunk)
+                yield chunk
+        finally:
+            self._end()
+
+    def close(self):
+        self._response.close()
+        self._end()
+
+    def release_conn(self):
+        self._response.release_conn()
+
+    def _chunk(self, data):
+        self._recorder.write("chunk", id=self._exchange, **_encode_body(data))
+
+    def _end(self):
+        if not self._ended:
+            self._ended = True
+            self._recorder.write("end", id=self._exchange)
+
+
+class _Exchange:
+    __slots__ = ("key", "start", "status", "reason", "headers", "response_at", "chunks", "error", "is_watch")
+
+    def __init__(self, key, start, is_watch):
+        self.key = key
+        self.start = start
+        self.is_watch = is_watch
+        self.status = None
+        self.reason = None
+        self.headers = {}
+        self.response_at = 0
+        self.chunks = []  # (seconds after the request, bytes)
+        self.error = None
+
+
+class TrafficReplayer:
+    """Serves a TrafficRecorder file back in place of the network.
+
+    Requests are matched on method, path, query and body. Repeats of the same
+    request get the recorded responses in order, then the last one again, so
+    a replay is deterministic however often a view polls. speed=1 keeps the
+    recorded latency and stream timing, 2 plays twice as fast, 0 as fast as
+    possible. Unmatched requests get a 404; an unmatched or used-up watch stays
+    open without events until its timeoutSeconds.
+    """
+
+    def __init__(self, path, speed=1.0):
+        self.path = path
+        self.speed = speed
+        self.exchanges = defaultdict(deque)
+        self._last = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        pending = {}
+        for record in self._records():
+            event, exchange = record["event"], pending.get(record["id"])
+            if event == "request":
+                key = exchange_key(record["method"], record["url"], record.get("body"))
+                query = dict(parse_qsl(urlsplit(record["url"]).query))
+                pending[record["id"]] = exchange = _Exchange(key, record["t"], query.get("watch") in ("true", "True", "1"))
+                self.exchanges[key].append(exchange)
+            elif exchange is None:
+                continue
+            elif event == "response":
+                exchange.status = record["status"]
+                exchange.reason = record["reason"]
+                exchange.headers = record["headers"]
+                exchange.response_at = record["t"] - exchange.start
+            elif event == "chunk":
+                exchange.chunks.append((record["t"] - exchange.start, _decode_body(record)))
+            elif event == "error":
+                exchange.error = record["error"]
+        # Requests whose response never arrived cannot be replayed
+        for key, queue in self.exchanges.items():
+            self.exchanges[key] = deque(e for e in queue if e.status is not None or e.error)
+
+    def _records(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    yield json.loads(line)
+            except (EOFError, ValueError):
+                # Truncated tail of a recording that was never closed
+                return
+
+    def wrap(self, pool_manager):
+        return _ReplayPoolManager(self)
+
+    def close(self):
+        pass
+
+    def next_exchange(self, key):
+        with self._lock:
+            queue = self.exchanges.get(key)
+            if queue:
+                exchange = self._last[key] = queue.popleft()
+                return exchange
+            exchange = self._last.get(key)
+            # A watch is not replayed twice, its events would be applied again
+            return None if exchange is not None and exchange.is_watch else exchange
+
+    def wait(self, seconds, cancelled=None):
+        if self.speed and seconds > 0:
+            if cancelled:
+                cancelled.wait(seconds / self.speed)
+            else:
+                time.sleep(seconds / self.speed)
+
+
+class _ReplayPoolManager:
+    def __init__(self, replayer):
+        self._replayer = replayer
+
+    def clear(self):
+        pass
+
+    def request(self, method, url, fields=None, headers=None, body=None, preload_content=True, **kwargs):
+        replayer = self._replayer
+        url = _request_url(method, url, fields)
+        if fields is not None and method not in ("GET", "HEAD", "DELETE"):
+            body = urlencode(fields)
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", "replace")
+        exchange = replayer.next_exchange(exchange_key(method, url, body))
+
+        if exchange is None:
+            query = dict(parse_qsl(urlsplit(url).query))
+            if query.get("watch") in ("true", "True", "1"):
+                idle = float(query.get("timeoutSeconds") or 300)
+                response = _ReplayResponse(replayer, 200, "OK", {"Content-Type": "application/json"}, [], idle)
+            else:
+                status = {"kind": "Status", "apiVersion": "v1", "status": "Failure", "code": 404,
+                          "reason": "NotFound", "message": f"{method} {url} is not in the recording"}
+                response = _ReplayResponse(replayer, 404, "Not Found", {"Content-Type": "application/json"},
+                                           [(0, json.dumps(status).encode())])
+        else:
+            replayer.wait(exchange.response_at)
+            if exchange.error:
+                raise HTTPError(f"Replayed: {exchange.error}")
+            response = _ReplayResponse(replayer, exchange.status, exchange.reason, exchange.headers,
+                                       [(t - exchange.response_at, data) for t, data in exchange.chunks])
+        if preload_content:
+            response.data
+        return response
+
+
+class _ReplayResponse:
+    """The subset of urllib3.HTTPResponse the kubernetes client and KubeService use."""
+
+    def __init__(self, replayer, status, reason, headers, chunks, idle=0):
+        self._replayer = replayer
+        self.status = status
+        self.reason = reason
+        self.headers = HTTPHeaderDict(headers)
+        self._chunks = chunks
+        self._idle = idle  # seconds to keep an empty stream open
+        self._closed = threading.Event()
+        self._data = None
+        self._read = False
+
+    def getheaders(self):
+        return self.headers
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+    def _iter_chunks(self):
+        elapsed = 0
+        for at, data in self._chunks:
+            self._replayer.wait(at - elapsed, self._closed)
+            elapsed = max(elapsed, at)
+            if self._closed.is_set():
+                return
+            yield data
+        if self._idle:
+            # Real time on purpose: nothing happens on an idle watch however fast the replay
+            self._closed.wait(self._idle)
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = b"".join(self._iter_chunks())
+        return self._data
+
+    def read(self, amt=None, *args, **kwargs):
+        # The whole body in one read, then EOF
+        if self._read:
+            return b""
+        self._read = True
+        return self.data
+
+    def stream(self, amt=2 ** 16, decode_content=None):
+        if self._data is not None:
+            yield self._data
+            return
+        yield from self._iter_chunks()
+
+    def close(self):
+        self._closed.set()
+
+    def release_conn(self):
+        pass
@@ -1,7 +1,20 @@
 import flet as ft
+from src.services.instrumentation import api_metrics
+from src.services.frame_scheduler import frame_scheduler
+from src.services.kube_service import kube_service
+from src.services.scheduler import scheduler
+from src.services.topics import topic_listeners
+from src.views.api_stats_dialog import ApiStatsDialog, format_seconds
 
 class Footer(ft.Container):
-    def __init__(self):
+    """Status bar: context and namespace, live API latency and request rate, and the last refresh.
+
+    Figures cover the last minute of calls (api_metrics' rolling window); a click
+    opens the per-endpoint breakdown, along with the dashboard's latest per-call
+    timings published on the dashboard.timings topic.
+    """
+
+    def __init__(self, interval=2):
         super().__init__()
         self.height = 30
         self.bgcolor = ft.Colors.SURFACE_CONTAINER_HIGHEST
@@ -11,9 +24,59 @@ class Footer(ft.Container):
             offset=ft.Offset(0, -5),
         )
         self.padding = ft.padding.symmetric(horizontal=10)
+        self.interval = interval
+        self.tooltip = "Show API call details"
+        self.on_click = self._open_details
+        self.dashboard_timings = {}
+
+        self.location_text = ft.Text("", size=12)
+        self.latency_text = ft.Text("API p50 - / p99 -", size=12)
+        self.rate_text = ft.Text("0.0 req/s", size=12)
+        self.errors_text = ft.Text("", size=12, color=ft.Colors.RED, visible=False)
+        self.refresh_text = ft.Text("", size=12, color=ft.Colors.OUTLINE)
         self.content = ft.Row(
             [
-                ft.Text("Cluster: local > Namespace: default", size=12),
+                self.location_text,
+                ft.Container(expand=True), # Spacer
+                ft.Icon(ft.Icons.SPEED, size=14),
+                self.latency_text,
+                self.rate_text,
+                self.errors_text,
+                self.refresh_text,
             ],
+            spacing=15,
             vertical_alignment=ft.CrossAxisAlignment.CENTER,
         )
+
+    def did_mount(self):
+        self._job = scheduler.add("footer", self._refresh, self.interval, owner=self, jitter=0)
+        self._unsubscribe_timings = topic_listeners.subscribe(self.page, "dashboard.timings", self._on_dashboard_timings)
+
+    def will_unmount(self):
+        scheduler.remove(self._job)
+        self._unsubscribe_timings()
+
+    def _on_dashboard_timings(self, topic, timings):
+        self.dashboard_timings = timings
+
+    def _refresh(self):
+        context = kube_service.get_active_context_name() or "none"
+        self.location_text.value = f"Cluster: {context} > Namespace: {kube_service.active_namespace}"
+
+        latency, rate, errors = api_metrics.recent()
+        self.latency_text.value = (
+            f"API p50 {format_seconds(latency.quantile(0.5))} / p99 {format_seconds(latency.quantile(0.99))}"
+        )
+        self.rate_text.value = f"{rate:.1f} req/s"
+        self.errors_text.value = f"{errors} errors"
+        self.errors_text.visible = errors > 0
+
+        # Most recent refresh of any view or service, this bar's own job aside
+        finished = [job for job in scheduler.jobs() if job is not self._job and job.last_duration is not None]
+        if finished:
+            last = max(finished, key=lambda job: job.last_start)
+            self.refresh_text.value = f"Last refresh: {last.name} {format_seconds(last.last_duration)}"
+        frame_scheduler.request(self)
+
+    def _open_details(self, e):
+        e.page.open(ApiStatsDialog(e.page, dashboard_timings=lambda: self.dashboard_timings))
@@ -1,5 +1,6 @@
 import flet as ft
 from src.services.kube_service import kube_service
+from src.services.metrics_store import metrics_sampler
 from src.views.namespace_manager import NamespaceManager
 from src.views.context_manager import ContextManager
 
@@ -75,6 +76,9 @@ class Header(ft.AppBar):
 
     def on_context_change(self, e):
         if kube_service.set_context(self.context_dropdown.value):
+            # Usage history belongs to the previous cluster
+            metrics_sampler.reset()
+
             # Reload namespaces
             self.refresh_namespaces()
             
@@ -1,8 +1,10 @@
 import flet as ft
 from .header import Header
+from .footer import Footer
 
 from src.views.resource_view import ResourceView
 from src.views.controllers_view import ControllersView
+from src.views.fleet_view import FleetView
 
 class AppLayout(ft.Column):
     def __init__(self, page: ft.Page):
@@ -47,6 +49,7 @@ class AppLayout(ft.Column):
                     ft.Container(expand=True), # Spacer
                     controllers_submenu,
                     ft.Container(expand=True), # Spacer
+                    ft.IconButton(icon=ft.Icons.HUB, icon_color=ft.Colors.WHITE, tooltip="Fleet", on_click=lambda _: self.page.pubsub.send_all("show_fleet")),
                     ft.IconButton(icon=ft.Icons.SEARCH, icon_color=ft.Colors.WHITE), # Placeholder
                 ],
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
@@ -63,6 +66,7 @@ class AppLayout(ft.Column):
                 expand=True,
                 spacing=0
             ),
+            Footer(),
         ]
 
     def did_mount(self):
@@ -88,6 +92,9 @@ class AppLayout(ft.Column):
              from src.views.dashboard.dashboard_view import DashboardView
              self.main_content.content = DashboardView()
              self.main_content.update()
+        elif data == "show_fleet":
+             self.main_content.content = FleetView()
+             self.main_content.update()
         elif data == "refresh_resources":
             # Refresh current view if it's ControllersView
             if isinstance(self.main_content.content, ControllersView):
@@ -0,0 +1,123 @@
+import flet as ft
+from src.services.frame_scheduler import frame_scheduler
+from src.services.instrumentation import api_metrics
+
+
+def format_seconds(value):
+    if value is None:
+        return "-"
+    return f"{value * 1000:.0f}ms" if value < 1 else f"{value:.2f}s"
+
+
+def format_size(value):
+    if value is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.0f}{unit}"
+        value /= 1024
+    return f"{value:.1f}GiB"
+
+
+class ApiStatsDialog(ft.AlertDialog):
+    """Per-endpoint API call histograms collected since startup (or the last reset).
+
+    Also shows how many UI updates the frame scheduler merged into shared batches
+    and, given dashboard_timings, how long each of the dashboard's calls last took.
+    """
+
+    def __init__(self, page: ft.Page, dashboard_timings=None):
+        self.page_ref = page
+        self.dashboard_timings = dashboard_timings  # callable returning {call: seconds}
+
+        self.data_table = ft.DataTable(
+            columns=[
+                ft.DataColumn(ft.Text("Endpoint")),
+                ft.DataColumn(ft.Text("Calls"), numeric=True),
+                ft.DataColumn(ft.Text("Errors"), numeric=True),
+                ft.DataColumn(ft.Text("Retries"), numeric=True),
+                ft.DataColumn(ft.Text("p50"), numeric=True),
+                ft.DataColumn(ft.Text("p99"), numeric=True),
+                ft.DataColumn(ft.Text("Max"), numeric=True),
+                ft.DataColumn(ft.Text("Avg Size"), numeric=True),
+                ft.DataColumn(ft.Text("Avg Objects"), numeric=True),
+            ],
+            rows=[],
+            column_spacing=20,
+            data_row_max_height=40,
+        )
+        self.frames_text = ft.Text("", size=12, color=ft.Colors.OUTLINE)
+        self.timings_text = ft.Text("", size=12, color=ft.Colors.OUTLINE, selectable=True)
+
+        super().__init__(
+            title=ft.Text("API Calls"),
+            content=ft.Container(
+                width=1100,
+                height=500,
+                content=ft.Column(
+                    [self.frames_text, self.timings_text, ft.Row([self.data_table], scroll=ft.ScrollMode.AUTO)],
+                    scroll=ft.ScrollMode.AUTO
+                )
+            ),
+            actions=[
+                ft.TextButton("Reset", on_click=self.reset),
+                ft.TextButton("Refresh", on_click=lambda _: self.refresh_table()),
+                ft.TextButton("Close", on_click=self.close_dialog),
+            ],
+        )
+        self.refresh_table(update=False)
+
+    def refresh_table(self, update=True):
+        rows = []
+        for endpoint, stats in api_metrics.endpoints():
+            errors = sum(stats.errors.values())
+            error_detail = ", ".join(f"{code}: {count}" for code, count in stats.errors.most_common())
+            rows.append(
+                ft.DataRow(
+                    cells=[
+                        ft.DataCell(ft.Text(endpoint, size=12, selectable=True)),
+                        ft.DataCell(ft.Text(str(stats.calls))),
+                        ft.DataCell(ft.Text(
+                            str(errors),
+                            color=ft.Colors.RED if errors else None,
+                            tooltip=error_detail or None
+                        )),
+                        ft.DataCell(ft.Text(str(stats.retries))),
+                        ft.DataCell(ft.Text(format_seconds(stats.latency.quantile(0.5)))),
+                        ft.DataCell(ft.Text(format_seconds(stats.latency.quantile(0.99)))),
+                        ft.DataCell(ft.Text(format_seconds(stats.latency.max))),
+                        ft.DataCell(ft.Text(format_size(stats.bytes.mean))),
+                        ft.DataCell(ft.Text(f"{stats.objects.mean:.0f}" if stats.objects.count else "-")),
+                    ]
+                )
+            )
+        if not rows:
+            rows.append(ft.DataRow(cells=[ft.DataCell(ft.Text("No API calls yet", italic=True))] +
+                                         [ft.DataCell(ft.Text("")) for _ in range(8)]))
+        self.data_table.rows = rows
+
+        frames = frame_scheduler.stats()
+        self.frames_text.value = (
+            f"UI updates: {frames['requests']} requested, sent in {frames['frames']} batches "
+            f"({frames['merged']} merged)"
+        )
+
+        timings = self.dashboard_timings() if self.dashboard_timings else {}
+        if timings:
+            slowest_first = sorted(timings.items(), key=lambda item: item[1], reverse=True)
+            self.timings_text.value = "Dashboard calls (last run): " + ", ".join(
+                f"{name} {format_seconds(seconds)}" for name, seconds in slowest_first
+            )
+        else:
+            self.timings_text.value = "Dashboard calls: not run yet"
+        if update:
+            self.page_ref.update()
+
+    def reset(self, e):
+        api_metrics.reset()
+        frame_scheduler.reset_stats()
+        self.refresh_table()
+
+    def close_dialog(self, e):
+        self.open = False
+        self.page_ref.update()
@@ -1,11 +1,17 @@
 import flet as ft
 from src.services.kube_service import kube_service
+from src.services.prefetch import prefetcher
+from src.services.frame_scheduler import frame_scheduler
+from src.services.quantity import container_totals, format_cpu, format_memory
+from src.services.summaries import ContainerSummary
+from src.services.scheduler import scheduler
+from src.views.workload_cards import CronJobCard, CronJobModel, KeyedGrid, WorkloadCard, WorkloadModel
 import datetime
 
-import threading
-import time
-
 class ControllersView(ft.Container):
+    # Cards per grid taken as in view for prefetching: the first rows of three
+    VISIBLE_CARDS = 9
+
     def __init__(self, filter_type="all"):
         super().__init__()
         self.expand = True
@@ -13,9 +19,19 @@ class ControllersView(ft.Container):
         self.running = False
         self.filter_type = filter_type
         
-        self.deployments_container = ft.Container()
-        self.cronjobs_container = ft.Container()
-        self.statefulsets_container = ft.Container()
+        # Cards keyed by UID, patched in place on every refresh
+        self.deployments_container = KeyedGrid(
+            lambda model: WorkloadCard(self, model), "No deployments found in this namespace.",
+            runs_count=3, max_extent=400, child_aspect_ratio=1.3, spacing=10, run_spacing=10,
+        )
+        self.statefulsets_container = KeyedGrid(
+            lambda model: WorkloadCard(self, model), "No statefulsets found in this namespace.",
+            runs_count=3, max_extent=400, child_aspect_ratio=1.7, spacing=10, run_spacing=10,
+        )
+        self.cronjobs_container = KeyedGrid(
+            lambda model: CronJobCard(self, model), "No cronjobs found in this namespace.",
+            runs_count=3, max_extent=400, child_aspect_ratio=1.5, spacing=10, run_spacing=10,
+        )
         
         controls = []
         if self.filter_type == "all":
@@ -70,204 +86,87 @@ class ControllersView(ft.Container):
 
     def did_mount(self):
         self.running = True
-        self.refresh_thread = threading.Thread(target=self._auto_refresh_loop, daemon=True)
-        self.refresh_thread.start()
+        self._job = scheduler.add("controllers", self._refresh, 5, owner=self)
+        self._unsubscribe = kube_service.subscribe(
+            lambda kind, event_type, obj: scheduler.trigger(self._job),
+            kinds=["deployments", "statefulsets", "cronjobs", "pods"]
+        )
 
     def will_unmount(self):
         self.running = False
+        self._unsubscribe()
+        scheduler.remove(self._job)
 
-    def _auto_refresh_loop(self):
-        while self.running:
-            try:
-                # Update deployments grid
-                if self.filter_type in ["all", "deployments"]:
-                    self.deployments_container.content = self._build_deployments_grid()
-                    self.deployments_container.update()
-
-                # Update statefulsets grid
-                if self.filter_type in ["all", "statefulsets"]:
-                    self.statefulsets_container.content = self._build_statefulsets_grid()
-                    self.statefulsets_container.update()
-
-                # Update cronjobs grid
-                if self.filter_type in ["all", "cronjobs"]:
-                    self.cronjobs_container.content = self._build_cronjobs_grid()
-                    self.cronjobs_container.update()
-                    
-            except Exception as e:
-                print(f"Error in auto-refresh: {e}")
-            
-            # Wait for 5 seconds
-            for _ in range(50):
-                if not self.running: break
-                time.sleep(0.1)
-
-    def _build_deployments_grid(self):
-        deployments = kube_service.list_deployments()
-        if not deployments:
-            return ft.Text("No deployments found in this namespace.")
-        
-        # Fetch all metrics for the namespace once
-        metrics_map = kube_service.get_pod_metrics()
-        
-        return ft.GridView(
-            runs_count=3,
-            max_extent=400,
-            child_aspect_ratio=1.3,
-            spacing=10,
-            run_spacing=10,
-            controls=[
-                self._build_deployment_card(d, metrics_map) for d in deployments
-            ]
-        )
+    def _refresh(self):
+        # One pod snapshot per refresh, shared by every card
+        pod_index = None
+        if self.filter_type in ["all", "deployments", "statefulsets"]:
+            pod_index = kube_service.get_pod_index()
 
-    def _build_statefulsets_grid(self):
-        statefulsets = kube_service.list_statefulsets()
-        if not statefulsets:
-            return ft.Text("No statefulsets found in this namespace.")
-        
-        # Fetch all metrics for the namespace once
-        metrics_map = kube_service.get_pod_metrics()
-        
-        return ft.GridView(
-            runs_count=3,
-            max_extent=400,
-            child_aspect_ratio=1.7,
-            spacing=10,
-            run_spacing=10,
-            controls=[
-                self._build_statefulset_card(s, metrics_map) for s in statefulsets
-            ]
-        )
+        # Patch each grid in place; update() only when a card actually changed
+        if self.filter_type in ["all", "deployments"]:
+            deployments = kube_service.list_deployment_summaries()
+            if self.deployments_container.reconcile(
+                (self._key(d.uid, d.name), self._workload_model(d, d.available_replicas, pod_index)) for d in deployments
+            ):
+                frame_scheduler.request(self.deployments_container)
+
+        if self.filter_type in ["all", "statefulsets"]:
+            statefulsets = kube_service.list_statefulset_summaries()
+            if self.statefulsets_container.reconcile(
+                # StatefulSet uses ready_replicas
+                (self._key(s.uid, s.name), self._workload_model(s, s.ready_replicas, pod_index)) for s in statefulsets
+            ):
+                frame_scheduler.request(self.statefulsets_container)
 
-    def _build_cronjobs_grid(self):
-        cronjobs = kube_service.list_cronjobs()
-        if not cronjobs:
-            return ft.Text("No cronjobs found in this namespace.")
-
-        return ft.GridView(
-            runs_count=3,
-            max_extent=400,
-            child_aspect_ratio=1.5,
-            spacing=10,
-            run_spacing=10,
-            controls=[
-                self._build_cronjob_card(c) for c in cronjobs
-            ]
+        if self.filter_type in ["all", "cronjobs"]:
+            cronjobs = kube_service.list_cronjobs()
+            if self.cronjobs_container.reconcile(
+                (self._key(c.metadata.uid, c.metadata.name), self._cronjob_model(c)) for c in cronjobs
+            ):
+                frame_scheduler.request(self.cronjobs_container)
+
+        # Flet does not report which cards are on screen; the first rows of each grid are
+        in_view = [("deployment", card.model.name)
+                   for card in list(self.deployments_container.cards.values())[:self.VISIBLE_CARDS]]
+        in_view += [("cronjob", card.model.name)
+                    for card in list(self.cronjobs_container.cards.values())[:self.VISIBLE_CARDS]]
+        prefetcher.visible(in_view)
+
+    def _key(self, uid, name):
+        return uid or f"{kube_service.active_namespace}/{name}"
+
+    def _workload_model(self, workload, available, pod_index):
+        cpu_req, cpu_lim, mem_req, mem_lim = self._calculate_resources(workload.containers)
+        # Pods for this workload, matchExpressions included
+        pods = pod_index.select(workload.selector, workload.namespace)
+        return WorkloadModel(
+            workload.kind,
+            workload.name,
+            workload.replicas,
+            available,
+            f"{cpu_req or '-'}/{cpu_lim or '-'}",
+            f"{mem_req or '-'}/{mem_lim or '-'}",
+            tuple((pod.uid or pod.name, pod.name, pod.phase) for pod in pods),
         )
 
-    def _build_deployment_card(self, deployment, metrics_map):
-        name = deployment.metadata.name
-        replicas = deployment.spec.replicas or 0
-        available = deployment.status.available_replicas or 0
-        
-        # Status Color Logic
-        if available == replicas:
-            status_color = ft.Colors.GREEN
-        elif available > (replicas * 0.5):
-            status_color = ft.Colors.YELLOW
-        else:
-            status_color = ft.Colors.RED
+    def _cronjob_model(self, cronjob):
+        last_schedule = "Never"
+        if cronjob.status.last_schedule_time:
+            # Whole minutes, so an idle cronjob card does not change on every refresh
+            elapsed = datetime.datetime.now(datetime.timezone.utc) - cronjob.status.last_schedule_time
+            last_schedule = str(elapsed).split('.')[0].rsplit(':', 1)[0] + " ago"
 
-        # Resources
-        containers = deployment.spec.template.spec.containers
+        # Resources (from Job Template)
+        containers = [ContainerSummary.from_model(c) for c in cronjob.spec.job_template.spec.template.spec.containers]
         cpu_req, cpu_lim, mem_req, mem_lim = self._calculate_resources(containers)
-
-        # Fetch Pods for this deployment
-        selector = deployment.spec.selector.match_labels
-        pods = kube_service.list_pods(selector)
-        
-        pod_icons = []
-        for pod in pods:
-            pod_name = pod.metadata.name
-            pod_status = pod.status.phase
-            
-            icon_color = ft.Colors.RED
-            if pod_status in ["Running", "Succeeded"]:
-                icon_color = ft.Colors.GREEN
-            elif pod_status == "Pending":
-                icon_color = ft.Colors.YELLOW
-            
-            pod_icons.append(
-                ft.Icon(
-                    ft.Icons.CIRCLE, 
-                    size=12, 
-                    color=icon_color, 
-                    tooltip=f"{pod_name}: {pod_status}"
-                )
-            )
-
-        return ft.Card(
-            content=ft.Container(
-                content=ft.Column(
-                    [
-                        ft.Row(
-                            [
-                                ft.Icon(ft.Icons.APPS, size=24, color=ft.Colors.PRIMARY),
-                                ft.Text(name, size=16, weight=ft.FontWeight.BOLD, overflow=ft.TextOverflow.ELLIPSIS, expand=True),
-                                ft.Container(
-                                    content=ft.Text(f"{available}/{replicas}", color=ft.Colors.WHITE, weight=ft.FontWeight.BOLD, size=12),
-                                    bgcolor=status_color,
-                                    padding=ft.padding.symmetric(horizontal=8, vertical=4),
-                                    border_radius=12
-                                )
-                            ],
-                            alignment=ft.MainAxisAlignment.SPACE_BETWEEN
-                        ),
-                        ft.Divider(height=10, thickness=1),
-                        ft.Row(
-                            [
-                                self._build_resource_chip("CPU", f"{cpu_req or '-'}/{cpu_lim or '-'}", ft.Icons.SPEED),
-                                self._build_resource_chip("Mem", f"{mem_req or '-'}/{mem_lim or '-'}", ft.Icons.MEMORY),
-                            ],
-                            alignment=ft.MainAxisAlignment.SPACE_BETWEEN
-                        ),
-                        ft.Container(height=5),
-                        ft.Text("Pods Status", size=12, weight=ft.FontWeight.BOLD),
-                        ft.Row(
-                            pod_icons,
-                            wrap=True,
-                            spacing=5,
-                            run_spacing=5
-                        ),
-                        ft.Container(expand=True),
-                        ft.Divider(height=10, thickness=1),
-                        ft.Row(
-                            [
-                                ft.IconButton(
-                                    icon=ft.Icons.LINEAR_SCALE,
-                                    tooltip="Scale",
-                                    icon_color=ft.Colors.BLUE_200,
-                                    on_click=lambda _: self._open_scale_dialog(name, replicas)
-                                ),
-                                ft.IconButton(
-                                    icon=ft.Icons.RESTART_ALT,
-                                    tooltip="Restart",
-                                    icon_color=ft.Colors.ORANGE_300,
-                                    on_click=lambda _: self._restart_deployment(name)
-                                ),
-                                ft.IconButton(
-                                    icon=ft.Icons.EDIT,
-                                    tooltip="Edit",
-                                    icon_color=ft.Colors.BLUE_GREY_300,
-                                    on_click=lambda _: self._open_deployment_dialog(deployment)
-                                ),
-                                ft.IconButton(
-                                    icon=ft.Icons.DELETE_OUTLINE,
-                                    tooltip="Delete",
-                                    icon_color=ft.Colors.RED_300,
-                                    on_click=lambda _: self._confirm_delete_deployment(name)
-                                ),
-                            ],
-                            alignment=ft.MainAxisAlignment.SPACE_EVENLY
-                        )
-                    ],
-                ),
-                padding=15,
-                on_click=lambda e: self._on_card_click("deployment", name),
-                border_radius=10,
-            ),
-            elevation=3,
+        return CronJobModel(
+            cronjob.metadata.name,
+            cronjob.spec.schedule,
+            bool(cronjob.spec.suspend),
+            last_schedule,
+            f"{cpu_req or '-'}/{cpu_lim or '-'}",
+            f"{mem_req or '-'}/{mem_lim or '-'}",
         )
 
     def _open_scale_dialog(self, name, current_replicas):
@@ -368,170 +267,9 @@ class ControllersView(ft.Container):
              dlg.open = True
              self.page.update()
 
-    def _build_statefulset_card(self, statefulset, metrics_map):
-        name = statefulset.metadata.name
-        replicas = statefulset.spec.replicas or 0
-        available = statefulset.status.ready_replicas or 0 # StatefulSet uses ready_replicas
-        
-        # Status Color Logic
-        if available == replicas:
-            status_color = ft.Colors.GREEN
-        elif available > (replicas * 0.5):
-            status_color = ft.Colors.YELLOW
-        else:
-            status_color = ft.Colors.RED
-
-        # Resources
-        containers = statefulset.spec.template.spec.containers
-        cpu_req, cpu_lim, mem_req, mem_lim = self._calculate_resources(containers)
-
-        # Fetch Pods for this statefulset
-        selector = statefulset.spec.selector.match_labels
-        pods = kube_service.list_pods(selector)
-        
-        pod_icons = []
-        for pod in pods:
-            pod_name = pod.metadata.name
-            pod_status = pod.status.phase
-            
-            icon_color = ft.Colors.RED
-            if pod_status in ["Running", "Succeeded"]:
-                icon_color = ft.Colors.GREEN
-            elif pod_status == "Pending":
-                icon_color = ft.Colors.YELLOW
-            
-            pod_icons.append(
-                ft.Icon(
-                    ft.Icons.CIRCLE, 
-                    size=12, 
-                    color=icon_color, 
-                    tooltip=f"{pod_name}: {pod_status}"
-                )
-            )
-
-        return ft.Card(
-            content=ft.Container(
-                content=ft.Column(
-                    [
-                        ft.Row(
-                            [
-                                ft.Icon(ft.Icons.LAYERS, size=24, color=ft.Colors.PRIMARY), # Icon for StatefulSet
-                                ft.Text(name, size=16, weight=ft.FontWeight.BOLD, overflow=ft.TextOverflow.ELLIPSIS, expand=True),
-                                ft.Container(
-                                    content=ft.Text(f"{available}/{replicas}", color=ft.Colors.WHITE, weight=ft.FontWeight.BOLD, size=12),
-                                    bgcolor=status_color,
-                                    padding=ft.padding.symmetric(horizontal=8, vertical=4),
-                                    border_radius=12
-                                )
-                            ],
-                            alignment=ft.MainAxisAlignment.SPACE_BETWEEN
-                        ),
-                        ft.Divider(height=10, thickness=1),
-                        ft.Row(
-                            [
-                                self._build_resource_chip("CPU", f"{cpu_req or '-'}/{cpu_lim or '-'}", ft.Icons.SPEED),
-                                self._build_resource_chip("Mem", f"{mem_req or '-'}/{mem_lim or '-'}", ft.Icons.MEMORY),
-                            ],
-                            alignment=ft.MainAxisAlignment.SPACE_BETWEEN
-                        ),
-                        ft.Container(height=5),
-                        ft.Text("Pods Status", size=12, weight=ft.FontWeight.BOLD),
-                        ft.Row(
-                            pod_icons,
-                            wrap=True,
-                            spacing=5,
-                            run_spacing=5
-                        )
-                    ],
-                ),
-                padding=15,
-                on_click=lambda e: self._on_card_click("statefulset", name),
-                border_radius=10,
-            ),
-            elevation=3,
-        )
-
-    def _build_cronjob_card(self, cronjob):
-        name = cronjob.metadata.name
-        schedule = cronjob.spec.schedule
-        suspend = cronjob.spec.suspend
-        
-        last_schedule = "Never"
-        if cronjob.status.last_schedule_time:
-             last_schedule = str(datetime.datetime.now(datetime.timezone.utc) - cronjob.status.last_schedule_time).split('.')[0] + " ago"
-
-        # Resources (from Job Template)
-        containers = cronjob.spec.job_template.spec.template.spec.containers
-        cpu_req, cpu_lim, mem_req, mem_lim = self._calculate_resources(containers)
-
-        return ft.Card(
-            content=ft.Container(
-                content=ft.Column(
-                    [
-                        ft.Row(
-                            [
-                                ft.Icon(ft.Icons.SCHEDULE, size=24, color=ft.Colors.PRIMARY),
-                                ft.Text(name, size=16, weight=ft.FontWeight.BOLD, overflow=ft.TextOverflow.ELLIPSIS, expand=True),
-                                ft.Icon(ft.Icons.PAUSE_CIRCLE if suspend else ft.Icons.PLAY_CIRCLE, 
-                                        color=ft.Colors.GREY if suspend else ft.Colors.GREEN, size=20)
-                            ],
-                            alignment=ft.MainAxisAlignment.SPACE_BETWEEN
-                        ),
-                        ft.Divider(height=10, thickness=1),
-                        ft.Text(f"Schedule: {schedule}", size=12),
-                        ft.Text(f"Last Run: {last_schedule}", size=12),
-                        ft.Container(height=5),
-                        ft.Row(
-                            [
-                                self._build_resource_chip("CPU", f"{cpu_req or '-'}/{cpu_lim or '-'}", ft.Icons.SPEED),
-                                self._build_resource_chip("Mem", f"{mem_req or '-'}/{mem_lim or '-'}", ft.Icons.MEMORY),
-                            ],
-                            alignment=ft.MainAxisAlignment.SPACE_BETWEEN
-                        ),
-                    ],
-                ),
-                padding=15,
-                on_click=lambda e: self._on_card_click("cronjob", name),
-                border_radius=10,
-            ),
-            elevation=3,
-        )
-
-    def _build_resource_chip(self, label, value, icon):
-        return ft.Container(
-            content=ft.Row(
-                [
-                    ft.Icon(icon, size=12, color=ft.Colors.OUTLINE),
-                    ft.Text(f"{label}: {value}", size=10, weight=ft.FontWeight.BOLD),
-                ],
-                spacing=5,
-                vertical_alignment=ft.CrossAxisAlignment.CENTER
-            ),
-            bgcolor=ft.Colors.SURFACE_CONTAINER_HIGHEST,
-            padding=ft.padding.symmetric(horizontal=8, vertical=4),
-            border_radius=4
-        )
-
     def _calculate_resources(self, containers):
-        cpu_reqs = []
-        cpu_lims = []
-        mem_reqs = []
-        mem_lims = []
-        
-        for c in containers:
-            resources = c.resources
-            if resources:
-                if resources.requests:
-                    if 'cpu' in resources.requests: cpu_reqs.append(resources.requests['cpu'])
-                    if 'memory' in resources.requests: mem_reqs.append(resources.requests['memory'])
-                if resources.limits:
-                    if 'cpu' in resources.limits: cpu_lims.append(resources.limits['cpu'])
-                    if 'memory' in resources.limits: mem_lims.append(resources.limits['memory'])
-        
-        def join_vals(vals):
-            return "+".join(set(vals)) if vals else None
-
-        return join_vals(cpu_reqs), join_vals(cpu_lims), join_vals(mem_reqs), join_vals(mem_lims)
+        cpu_req, cpu_lim, mem_req, mem_lim = container_totals(containers)
+        return format_cpu(cpu_req), format_cpu(cpu_lim), format_memory(mem_req), format_memory(mem_lim)
 
     def _on_card_click(self, resource_type, name):
         self.page.pubsub.send_all(("resource_selected", {
@@ -1,4 +1,5 @@
 import flet as ft
+from src.services.frame_scheduler import frame_scheduler
 
 class Alerts(ft.Container):
     def __init__(self):
@@ -46,4 +47,4 @@ class Alerts(ft.Container):
                 new_controls.append(ft.Container(height=10))
                 
         self.content.controls = new_controls
-        self.update()
+        frame_scheduler.request(self)
@@ -1,4 +1,5 @@
 import flet as ft
+from src.services.frame_scheduler import frame_scheduler
 
 class ClusterStatus(ft.Container):
     def __init__(self):
@@ -6,6 +7,10 @@ class ClusterStatus(ft.Container):
         self.padding = 20
         self.bgcolor = ft.Colors.SURFACE_CONTAINER_HIGHEST
         self.border_radius = 10
+        self.total_nodes = 0
+        self.ready_nodes = 0
+        self.total_pods = 0
+        self.running_pods = 0
         self.content = ft.Column(
             [
                 ft.Text("Cluster Status", size=16, weight=ft.FontWeight.BOLD),
@@ -47,20 +52,26 @@ class ClusterStatus(ft.Container):
         )
 
     def update_data(self, nodes, pods):
-        total_nodes = len(nodes)
-        ready_nodes = sum(1 for n in nodes if any(c.type == "Ready" and c.status == "True" for c in n.status.conditions))
+        self.total_nodes = len(nodes)
+        self.ready_nodes = sum(1 for n in nodes if n.ready)
         
-        total_pods = len(pods)
-        running_pods = sum(1 for p in pods if p.status.phase == "Running")
+        self.total_pods = 0
+        self.running_pods = 0
+        self.add_pods(pods)
+
+    def add_pods(self, pods):
+        """Adds another chunk of pods to the counts shown by the last update_data call."""
+        self.total_pods += len(pods)
+        self.running_pods += sum(1 for p in pods if p.phase == "Running")
 
         # Update Chart
-        healthy_ratio = (ready_nodes / total_nodes * 100) if total_nodes > 0 else 0
+        healthy_ratio = (self.ready_nodes / self.total_nodes * 100) if self.total_nodes > 0 else 0
         self.content.controls[2].controls[0].sections[0].value = healthy_ratio
         self.content.controls[2].controls[0].sections[1].value = 100 - healthy_ratio
         
         # Update Text
         status_col = self.content.controls[2].controls[1]
-        status_col.controls[1].value = f"Nodes: {ready_nodes}/{total_nodes} Up"
-        status_col.controls[2].value = f"Pods: {running_pods}/{total_pods} Running"
+        status_col.controls[1].value = f"Nodes: {self.ready_nodes}/{self.total_nodes} Up"
+        status_col.controls[2].value = f"Pods: {self.running_pods}/{self.total_pods} Running"
         
-        self.update()
+        frame_scheduler.request(self)
@@ -1,23 +1,34 @@
 import flet as ft
+from src.services.frame_scheduler import frame_scheduler
 import datetime
+import time
+from src.services.metrics_store import metrics_store, MetricsSampler
+from src.services.metrics_history import metrics_history, resample
+
+# Chart ranges beyond the live ring buffer, read from the on-disk history
+RANGES = {"Live": None, "1h": 3600, "6h": 6 * 3600, "24h": 24 * 3600, "7d": 7 * 24 * 3600}
 
 class CpuMemoryUtilization(ft.Container):
-    def __init__(self):
+    """CPU/memory chart over one metrics_store series, the whole cluster by default."""
+
+    def __init__(self, scope="cluster", key="all", title="Cluster Utilization (All Namespaces)", history_len=20):
         super().__init__()
         self.padding = 20
         self.bgcolor = ft.Colors.SURFACE_CONTAINER_HIGHEST
         self.border_radius = 10
+        self.scope = scope
+        self.key = key
+        self.range_seconds = None
         
-        # Data history
-        self.history_len = 20
-        self.cpu_history = [0] * self.history_len
-        self.mem_history = [0] * self.history_len
-        self.time_labels = [""] * self.history_len
+        # Points are created once and only their y values change on each tick
+        self.history_len = history_len
+        self.cpu_points = [ft.LineChartDataPoint(i, 0) for i in range(self.history_len)]
+        self.mem_points = [ft.LineChartDataPoint(i, 0) for i in range(self.history_len)]
 
         self.chart = ft.LineChart(
             data_series=[
                 ft.LineChartData(
-                    data_points=[],
+                    data_points=self.cpu_points,
                     stroke_width=2,
                     color=ft.Colors.CYAN,
                     curved=True,
@@ -25,7 +36,7 @@ class CpuMemoryUtilization(ft.Container):
                     below_line_bgcolor=ft.Colors.with_opacity(0.2, ft.Colors.CYAN),
                 ),
                 ft.LineChartData(
-                    data_points=[],
+                    data_points=self.mem_points,
                     stroke_width=2,
                     color=ft.Colors.PURPLE,
                     curved=True,
@@ -57,11 +68,20 @@ class CpuMemoryUtilization(ft.Container):
             [
                 ft.Row(
                     [
-                        ft.Text("Cluster Utilization (All Namespaces)", size=16, weight=ft.FontWeight.BOLD),
+                        ft.Text(title, size=16, weight=ft.FontWeight.BOLD),
                         ft.Row(
                             [
                                 self._build_legend_item("Total CPU", ft.Colors.CYAN),
                                 self._build_legend_item("Total Memory", ft.Colors.PURPLE),
+                                ft.Dropdown(
+                                    value="Live",
+                                    options=[ft.dropdown.Option(name) for name in RANGES],
+                                    width=90,
+                                    dense=True,
+                                    text_size=12,
+                                    on_change=self._on_range_change,
+                                    visible=scope in MetricsSampler.PERSISTED_SCOPES,
+                                ),
                             ],
                             spacing=10
                         )
@@ -86,67 +106,42 @@ class CpuMemoryUtilization(ft.Container):
             vertical_alignment=ft.CrossAxisAlignment.CENTER
         )
 
-    def update_data(self, metrics_map):
-        # Calculate totals across ALL namespaces
-        total_cpu = 0 # millicores
-        total_mem = 0 # MiB
-        
-        # metrics_map contains pods from all namespaces now
-        for pod_name, metrics in metrics_map.items():
-            containers = metrics.get('containers', [])
-            for c in containers:
-                # CPU
-                cpu_str = c['usage']['cpu']
-                if cpu_str.endswith('n'): total_cpu += int(cpu_str[:-1]) / 1000000
-                elif cpu_str.endswith('u'): total_cpu += int(cpu_str[:-1]) / 1000
-                elif cpu_str.endswith('m'): total_cpu += int(cpu_str[:-1])
-                else: 
-                    try: total_cpu += int(cpu_str) * 1000
-                    except: pass
-                
-                # Mem
-                mem_str = c['usage']['memory']
-                if mem_str.endswith('Ki'): total_mem += int(mem_str[:-2]) / 1024
-                elif mem_str.endswith('Mi'): total_mem += int(mem_str[:-2])
-                elif mem_str.endswith('Gi'): total_mem += int(mem_str[:-2]) * 1024
-                else:
-                    try: total_mem += int(mem_str) / (1024*1024)
-                    except: pass
-
-        # Update History
-        self.cpu_history.pop(0)
-        self.cpu_history.append(total_cpu)
-        
-        self.mem_history.pop(0)
-        self.mem_history.append(total_mem)
-        
-        now = datetime.datetime.now()
-        time_label = now.strftime("%H:%M:%S")
-        self.time_labels.pop(0)
-        self.time_labels.append(time_label)
+    def _on_range_change(self, e):
+        self.range_seconds = RANGES[e.control.value]
+        self.update_data()
+
+    def _load_window(self):
+        if not self.range_seconds:
+            # Views straight into the ring buffer, no history is copied
+            return metrics_store.window(self.scope, self.key, self.history_len)
+        end = time.time()
+        start = end - self.range_seconds
+        times, values = metrics_history.window(f"{self.scope}/{self.key}", self.range_seconds, now=end)
+        return resample(times, values, start, end, self.history_len)
+
+    def update_data(self):
+        times, values = self._load_window()
+        count = len(times)
+        offset = self.history_len - count # Right-align, older slots stay at 0
+
+        cpu = values[:, 0] # millicores
+        mem = values[:, 1] / (1024 * 1024) # MiB
 
         # Scaling for Dual Axis Simulation
-        max_cpu = max(self.cpu_history) if max(self.cpu_history) > 0 else 1
-        max_mem = max(self.mem_history) if max(self.mem_history) > 0 else 1
+        max_cpu = float(cpu.max()) if count and cpu.max() > 0 else 1
+        max_mem = float(mem.max()) if count and mem.max() > 0 else 1
         
         # Add 10% headroom
         max_cpu = max_cpu * 1.1
         max_mem = max_mem * 1.1
 
-        cpu_points = []
-        mem_points = []
-        
+        # Normalize to 0-100 for plotting
+        cpu_scaled = cpu / max_cpu * 100
+        mem_scaled = mem / max_mem * 100
         for i in range(self.history_len):
-            # Normalize to 0-100 for plotting
-            cpu_val = (self.cpu_history[i] / max_cpu) * 100
-            mem_val = (self.mem_history[i] / max_mem) * 100
-            
-            cpu_points.append(ft.LineChartDataPoint(i, cpu_val))
-            mem_points.append(ft.LineChartDataPoint(i, mem_val))
-
-        self.chart.data_series[0].data_points = cpu_points
-        self.chart.data_series[1].data_points = mem_points
-        
+            self.cpu_points[i].y = float(cpu_scaled[i - offset]) if i >= offset else 0
+            self.mem_points[i].y = float(mem_scaled[i - offset]) if i >= offset else 0
+
         self.chart.min_y = 0
         self.chart.max_y = 100
         self.chart.min_x = 0
@@ -172,10 +167,16 @@ class CpuMemoryUtilization(ft.Container):
         ]
         
         # Bottom Axis (Time)
+        def time_label(i):
+            if i < offset:
+                return ""
+            fmt = "%H:%M:%S" if not self.range_seconds else "%H:%M" if self.range_seconds <= 24 * 3600 else "%d %b"
+            return datetime.datetime.fromtimestamp(times[i - offset]).strftime(fmt)
+
         self.chart.bottom_axis.labels = [
-            ft.ChartAxisLabel(value=0, label=ft.Text(self.time_labels[0], size=10)),
-            ft.ChartAxisLabel(value=int(self.history_len/2), label=ft.Text(self.time_labels[int(self.history_len/2)], size=10)),
-            ft.ChartAxisLabel(value=self.history_len-1, label=ft.Text(self.time_labels[-1], size=10)),
+            ft.ChartAxisLabel(value=0, label=ft.Text(time_label(0), size=10)),
+            ft.ChartAxisLabel(value=int(self.history_len/2), label=ft.Text(time_label(int(self.history_len/2)), size=10)),
+            ft.ChartAxisLabel(value=self.history_len-1, label=ft.Text(time_label(self.history_len-1), size=10)),
         ]
 
-        self.update()
+        frame_scheduler.request(self)
@@ -1,7 +1,9 @@
 import flet as ft
 import threading
-import time
 from src.services.kube_service import kube_service
+from src.services.executor import fan_out
+from src.services.frame_scheduler import frame_scheduler
+from src.services.scheduler import scheduler
 from .cluster_status import ClusterStatus
 from .cpu_memory_utilization import CpuMemoryUtilization
 from .resource_overview import ResourceOverview
@@ -9,11 +11,39 @@ from .alerts import Alerts
 from .pod_list import PodList
 
 class DashboardView(ft.Container):
+    # Scheduler jobs: name -> (sources fetched together, seconds between runs, cache kinds that trigger it)
+    JOBS = {
+        "dashboard.metrics": (("connection", "node_metrics"), 5, ()),
+        "dashboard.pods": (("pods",), 10, ("pods",)),
+        "dashboard.events": (("events",), 15, ("events",)),
+        "dashboard.nodes": (("nodes",), 60, ("nodes",)),
+    }
+
+    # Longest back-off after failures, for jobs that must not wait the scheduler's default;
+    # the connection check has to notice a cluster that is back within half a minute
+    MAX_BACKOFF = {"dashboard.metrics": 30}
+
+    # Seconds each fetch may take before the job goes on without it
+    DEADLINES = {"connection": 5, "nodes": 10, "events": 10, "node_metrics": 10, "pods": 30}
+
+    # Widget -> results it is drawn from; each is updated as soon as its inputs are in.
+    # ClusterStatus also counts pods page by page while they are listed, see _fetch_pods.
+    WIDGET_INPUTS = {
+        "alerts": ("events",),
+        "cluster_status": ("nodes", "pods"),
+        "resource_overview": ("nodes", "node_metrics", "pods"),
+    }
+
     def __init__(self):
         super().__init__()
         self.expand = True
         self.padding = 20
         self.running = False
+        self.last_timings = {}
+        self.connected = None
+        self._results = {}
+        self._stale = set()
+        self._lock = threading.Lock()  # Jobs run concurrently and share results
         
         self.cluster_status = ClusterStatus()
         self.cpu_memory_utilization = CpuMemoryUtilization()
@@ -65,51 +95,109 @@ class DashboardView(ft.Container):
 
     def did_mount(self):
         self.running = True
-        self.refresh_thread = threading.Thread(target=self._auto_refresh_loop, daemon=True)
-        self.refresh_thread.start()
+        self._jobs = {}
+        for name, (sources, interval, _) in self.JOBS.items():
+            options = {"max_backoff": self.MAX_BACKOFF[name]} if name in self.MAX_BACKOFF else {}
+            self._jobs[name] = scheduler.add(
+                name, lambda sources=sources: self._refresh(sources), interval, owner=self, **options
+            )
+        self._unsubscribe = kube_service.subscribe(self._on_cache_change, kinds=["nodes", "pods", "events"])
 
     def will_unmount(self):
         self.running = False
+        self._unsubscribe()
+        for job in self._jobs.values():
+            scheduler.remove(job)
 
-    def _auto_refresh_loop(self):
-        while self.running:
-            try:
-                self._fetch_and_update_data()
-            except Exception as e:
-                print(f"Error in dashboard auto-refresh: {e}")
-            
-            # Wait for 5 seconds
-            for _ in range(50):
-                if not self.running: break
-                time.sleep(0.1)
-
-    def _fetch_and_update_data(self):
-        # Check connection first
-        if not kube_service.check_connection():
-            self.clean()
-            self.content = ft.Column(
-                [
-                    ft.Container(
-                        content=ft.Column(
-                            [
-                                ft.Icon(name=ft.Icons.ERROR_OUTLINE, color=ft.Colors.RED, size=50),
-                                ft.Text("Cannot connect to cluster", size=20, weight=ft.FontWeight.BOLD, color=ft.Colors.RED),
-                                ft.Text("Please check your configuration.", size=14)
-                            ],
-                            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                            alignment=ft.MainAxisAlignment.CENTER
-                        ),
-                        alignment=ft.alignment.center,
-                        expand=True
-                    )
-                ],
-                alignment=ft.MainAxisAlignment.CENTER,
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                expand=True
-            )
-            self.update()
-            return
+    def _on_cache_change(self, kind, event_type, obj):
+        for name, (_, _, kinds) in self.JOBS.items():
+            if kind in kinds:
+                scheduler.trigger(self._jobs[name])
+
+    def _refresh(self, sources):
+        # The sources of one job are fetched at once on the shared executor and
+        # applied in the order they arrive; results of the other jobs are reused,
+        # so every widget redraws as soon as any of its inputs changed.
+        calls = {name: self._source(name) for name in sources}
+        timings = {}
+        errors = []
+
+        for result in fan_out(calls, deadlines=self.DEADLINES):
+            timings[result.name] = round(result.elapsed, 3)
+            if result.error:
+                errors.append(f"{result.name}: {result.error}")
+                continue
+
+            with self._lock:
+                self._apply(result, errors)
+
+        self._publish_timings(timings)
+        if errors:
+            # Raising lets the scheduler back the job off
+            raise RuntimeError("; ".join(errors))
+
+    def _apply(self, result, errors):
+        if result.name == "connection":
+            if not result.value:
+                self.connected = False
+                self._show_connection_error()
+                errors.append("connection: cannot connect to cluster")
+                return
+            if not self.connected:
+                self._restore_layout()
+                # Everything fetched while disconnected still has to be drawn
+                self._stale.update(self.WIDGET_INPUTS)
+            self.connected = True
+            # Utilization history is recorded by the metrics sampler, the chart only reads it
+            self.cpu_memory_utilization.update_data()
+        else:
+            self._results[result.name] = result.value
+            self._stale.update(w for w, inputs in self.WIDGET_INPUTS.items() if result.name in inputs)
 
+        if self.connected:
+            self._update_widgets()
+
+    def _source(self, name):
+        if name == "pods":
+            return self._fetch_pods
+        return {
+            "connection": kube_service.check_connection,
+            "nodes": kube_service.list_node_summaries,
+            "events": kube_service.list_events,
+            "node_metrics": kube_service.get_node_metrics,
+        }[name]
+
+    def _update_widgets(self):
+        for widget in list(self._stale):
+            if all(name in self._results for name in self.WIDGET_INPUTS[widget]):
+                self._stale.discard(widget)
+                self._update_widget(widget, self._results)
+
+    def _show_connection_error(self):
+        self.clean()
+        self.content = ft.Column(
+            [
+                ft.Container(
+                    content=ft.Column(
+                        [
+                            ft.Icon(name=ft.Icons.ERROR_OUTLINE, color=ft.Colors.RED, size=50),
+                            ft.Text("Cannot connect to cluster", size=20, weight=ft.FontWeight.BOLD, color=ft.Colors.RED),
+                            ft.Text("Please check your configuration.", size=14)
+                        ],
+                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                        alignment=ft.MainAxisAlignment.CENTER
+                    ),
+                    alignment=ft.alignment.center,
+                    expand=True
+                )
+            ],
+            alignment=ft.MainAxisAlignment.CENTER,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            expand=True
+        )
+        frame_scheduler.request(self)
+
+    def _restore_layout(self):
         # Restore dashboard layout if it was showing error
         if len(self.content.controls) == 1 and isinstance(self.content.controls[0], ft.Container) and isinstance(self.content.controls[0].content, ft.Column) and len(self.content.controls[0].content.controls) == 3:
              self.content = ft.Column(
@@ -142,30 +230,54 @@ class DashboardView(ft.Container):
                 expand=True,
                 horizontal_alignment=ft.CrossAxisAlignment.STRETCH
             )
+             # Redraws the widgets with it; their own requests are dropped until they are mounted again
+             frame_scheduler.request(self)
 
-        # Fetch data
-        nodes = kube_service.list_nodes()
-        current_pods = kube_service.list_pods("") # Pods in current namespace
-        all_pods = kube_service.list_pods("", namespace="all") # All pods in cluster
-        events = kube_service.list_events()
-        metrics_map = kube_service.get_pod_metrics(namespace="all")
-        node_metrics = kube_service.get_node_metrics()
-
-        # Update components
-        if hasattr(self.cluster_status, 'update_data'):
-            self.cluster_status.update_data(nodes, all_pods)
-        
-        if hasattr(self.cpu_memory_utilization, 'update_data'):
-             self.cpu_memory_utilization.update_data(metrics_map)
+    def _fetch_pods(self):
+        # All pods in cluster, page by page. Each page is sorted into the list as
+        # it arrives, which then only draws the rows in view.
+        all_pods = []
+        try:
+            for chunk in kube_service.iter_pod_summaries("", namespace="all"):
+                first = not all_pods
+                all_pods.extend(chunk)
 
-        if hasattr(self.resource_overview, 'update_data'):
-            self.resource_overview.update_data(nodes, node_metrics, all_pods)
+                # Counts start with the first page instead of waiting for the whole listing;
+                # the finished listing then redraws them once more from the complete list
+                with self._lock:
+                    if self.connected is not False:
+                        if first:
+                            self.cluster_status.update_data(self._results.get("nodes", []), chunk)
+                        else:
+                            self.cluster_status.add_pods(chunk)
 
-        if hasattr(self.alerts, 'update_data'):
-            self.alerts.update_data(events)
+                # Only update pod list if it's actually in the view (mounted)
+                if self.pod_list.page:
+                    self.pod_list.append_data(chunk)
+        except Exception:
+            # A listing cut short is not the cluster's pods: the pod list keeps its rows,
+            # nothing is stored, and the counts go back to the last complete listing
+            with self._lock:
+                self._stale.add("cluster_status")
+                if self.connected:
+                    self._update_widgets()
+            raise
 
-        # Only update pod list if it's actually in the view (mounted)
-        if hasattr(self.pod_list, 'update_data') and self.pod_list.page:
+        if self.pod_list.page:
+            # Pages only add and update pods, drop the ones that are gone
             self.pod_list.update_data(all_pods)
-        
-        self.update()
+        return all_pods
+
+    def _update_widget(self, widget, results):
+        if widget == "alerts":
+            self.alerts.update_data(results["events"])
+        elif widget == "cluster_status":
+            self.cluster_status.update_data(results["nodes"], results["pods"])
+        elif widget == "resource_overview":
+            self.resource_overview.update_data(results["nodes"], results["node_metrics"], results["pods"])
+
+    def _publish_timings(self, timings):
+        # Seconds per call, latest run of each; timed out calls report when they were given up on
+        self.last_timings.update(timings)
+        if self.page:
+            self.page.pubsub.send_all_on_topic("dashboard.timings", dict(self.last_timings))
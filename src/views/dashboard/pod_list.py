@@ -1,7 +1,31 @@
 import flet as ft
 import datetime
+from src.services.frame_scheduler import frame_scheduler
+from src.services.sorted_index import SortedIndex
 
 class PodList(ft.Container):
+    """Pod table for any number of pods: only the rows in view exist as controls.
+
+    Pods are kept in a SortedIndex with one order per column, so refreshes
+    move only the pods that changed and sorting only reads another order. The
+    table body is a fixed pool of rows inside a scrolling column, padded above
+    and below to the height of the rows that are not materialized; scrolling
+    and sorting refill the pool with the pods of the new window.
+    """
+
+    ROW_HEIGHT = 40
+    VIEWPORT_HEIGHT = 600
+    OVERSCAN = 10  # rows materialized beyond the viewport, split above and below
+
+    # (title, relative width, sort key)
+    COLUMNS = [
+        ("Namespace", 2, lambda pod: (pod.namespace or "", pod.name or "")),
+        ("Name", 4, lambda pod: pod.name or ""),
+        ("Controller", 3, lambda pod: pod.controller or ""),
+        ("Status", 2, lambda pod: pod.phase or ""),
+        ("Age", 1, lambda pod: pod.created or 0),
+    ]
+
     def __init__(self):
         super().__init__()
         self.padding = 20
@@ -10,97 +34,129 @@ class PodList(ft.Container):
         self.pods = []
         self.sort_column_index = 0
         self.sort_ascending = True
-        
-        self.datatable = ft.DataTable(
-            columns=[
-                ft.DataColumn(ft.Text("Namespace"), on_sort=self._on_sort),
-                ft.DataColumn(ft.Text("Name"), on_sort=self._on_sort),
-                ft.DataColumn(ft.Text("Controller"), on_sort=self._on_sort),
-                ft.DataColumn(ft.Text("Status"), on_sort=self._on_sort),
-                ft.DataColumn(ft.Text("Age"), on_sort=self._on_sort),
-            ],
-            width=float("inf"), # Expand to fill width
-            heading_row_height=40,
-            data_row_max_height=50,
-            sort_column_index=0,
-            sort_ascending=True,
+        self.first_row = 0
+
+        self.index = SortedIndex(
+            {i: key for i, (_, _, key) in enumerate(self.COLUMNS)},
+            identity=lambda pod: pod.uid or f"{pod.namespace}/{pod.name}",
         )
 
+        self.sort_icons = []
+        headers = []
+        for i, (title, width, _) in enumerate(self.COLUMNS):
+            icon = ft.Icon(ft.Icons.ARROW_UPWARD, size=14, visible=False)
+            self.sort_icons.append(icon)
+            headers.append(ft.Container(
+                content=ft.Row([ft.Text(title, weight=ft.FontWeight.BOLD), icon], spacing=4),
+                expand=width,
+                on_click=lambda e, i=i: self._on_sort(i),
+            ))
+        self._show_sort_icon()
+
+        pool_size = self.VIEWPORT_HEIGHT // self.ROW_HEIGHT + self.OVERSCAN
+        self.row_pool = [self._build_row() for _ in range(pool_size)]
+        self.top_spacer = ft.Container(height=0)
+        self.bottom_spacer = ft.Container(height=0)
+        self.body = ft.Column(
+            [self.top_spacer, *self.row_pool, self.bottom_spacer],
+            spacing=0,
+            height=self.VIEWPORT_HEIGHT,
+            scroll=ft.ScrollMode.AUTO,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=50,
+        )
+        self.count_text = ft.Text("", size=12, color=ft.Colors.OUTLINE)
+
         self.content = ft.Column(
-            [self.datatable],
-            scroll=ft.ScrollMode.AUTO
+            [
+                ft.Container(content=ft.Row(headers), height=self.ROW_HEIGHT),
+                ft.Divider(height=1),
+                self.body,
+                self.count_text,
+            ],
+            spacing=0,
         )
 
-    def _on_sort(self, e):
-        self.sort_column_index = e.column_index
-        self.sort_ascending = e.ascending
-        self.datatable.sort_column_index = self.sort_column_index
-        self.datatable.sort_ascending = self.sort_ascending
-        self.refresh_rows()
+    def _on_sort(self, column_index):
+        if column_index == self.sort_column_index:
+            self.sort_ascending = not self.sort_ascending
+        else:
+            self.sort_column_index = column_index
+            self.sort_ascending = True
+        self._show_sort_icon()
+        # Every column is already sorted, only the rows in view are refilled
+        self._fill_rows()
+        frame_scheduler.request(self)
+
+    def _show_sort_icon(self):
+        for i, icon in enumerate(self.sort_icons):
+            icon.visible = i == self.sort_column_index
+            icon.name = ft.Icons.ARROW_UPWARD if self.sort_ascending else ft.Icons.ARROW_DOWNWARD
+
+    def _on_scroll(self, e):
+        first_row = max(0, int(e.pixels) // self.ROW_HEIGHT - self.OVERSCAN // 2)
+        if first_row != self.first_row:
+            self.first_row = first_row
+            self._fill_rows()
+            frame_scheduler.request(self)
 
     def update_data(self, pods):
-        self.pods = pods
+        self.pods = list(pods)
         self.refresh_rows()
 
+    def append_data(self, pods):
+        """Shows another chunk of a paginated listing; it is sorted in with the rest right away."""
+        pods = list(pods)
+        self.pods.extend(pods)
+        self.index.update(pods)
+        self._fill_rows()
+        frame_scheduler.request(self)
+
     def refresh_rows(self):
-        if not self.pods:
-            self.datatable.rows = []
-            self.update()
-            return
-
-        # Helper to safely get values for sorting
-        def get_sort_key(pod):
-            # 0: Namespace
-            # 1: Name
-            # 2: Controller
-            # 3: Status
-            # 4: Age
-            
-            if self.sort_column_index == 0:
-                return (pod.metadata.namespace or "", pod.metadata.name or "")
-            elif self.sort_column_index == 1:
-                return pod.metadata.name or ""
-            elif self.sort_column_index == 2:
-                controller = ""
-                if pod.metadata.owner_references:
-                     controller = pod.metadata.owner_references[0].name
-                return controller
-            elif self.sort_column_index == 3:
-                return pod.status.phase or ""
-            elif self.sort_column_index == 4:
-                if pod.metadata.creation_timestamp:
-                    return pod.metadata.creation_timestamp.timestamp()
-                return 0
-            return ""
-
-        sorted_pods = sorted(self.pods, key=get_sort_key, reverse=not self.sort_ascending)
-        
-        # Secondary sort by name if first key is equal (stable sort property of python helps, but good to be explicit if needed)
-        # Python sort is stable, so if we sort by name first then by column, it works. 
-        # But here I'm using complex keys for specific needs.
-        
-        rows = []
-        for pod in sorted_pods: # removed [:10] limit to show all pods as requested "muestre los pods todo el cluster"
-            rows.append(self._build_row(pod))
-            
-        self.datatable.rows = rows
-        self.update()
-
-    def _build_row(self, pod):
-        name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        status = pod.status.phase
-        
+        # Only pods that were added, changed or removed since the last call move in the index
+        self.index.replace(self.pods)
+        self._fill_rows()
+        frame_scheduler.request(self)
+
+    def _fill_rows(self):
+        total = len(self.index)
+        self.first_row = min(self.first_row, max(0, total - len(self.row_pool)))
+        shown = self.index.window(self.sort_column_index, self.sort_ascending, self.first_row, len(self.row_pool))
+        for row, pod in zip(self.row_pool, shown):
+            self._set_row(row, pod)
+            row.visible = True
+        for row in self.row_pool[len(shown):]:
+            row.visible = False
+
+        self.top_spacer.height = self.first_row * self.ROW_HEIGHT
+        self.bottom_spacer.height = (total - self.first_row - len(shown)) * self.ROW_HEIGHT
+        if total:
+            self.count_text.value = f"{total} pods"
+        else:
+            self.count_text.value = "No pods"
+
+    def _build_row(self):
+        return ft.Container(
+            content=ft.Row(
+                [ft.Text("", expand=width, no_wrap=True, overflow=ft.TextOverflow.ELLIPSIS)
+                 for _, width, _ in self.COLUMNS],
+            ),
+            height=self.ROW_HEIGHT,
+            visible=False,
+        )
+
+    def _set_row(self, row, pod):
+        name = pod.name
+        namespace = pod.namespace
+        status = pod.phase
+
         # Controller
-        controller = "N/A"
-        if pod.metadata.owner_references:
-            controller = pod.metadata.owner_references[0].name
+        controller = pod.controller or "N/A"
 
         # Age
         age = "Unknown"
-        age_sort_value = 0
-        if pod.metadata.creation_timestamp:
-            delta = datetime.datetime.now(datetime.timezone.utc) - pod.metadata.creation_timestamp
+        if pod.created:
+            delta = datetime.datetime.now(datetime.timezone.utc) - datetime.datetime.fromtimestamp(pod.created, datetime.timezone.utc)
             if delta.days > 0:
                 age = f"{delta.days}d"
             elif delta.seconds > 3600:
@@ -109,13 +165,11 @@ class PodList(ft.Container):
                 age = f"{delta.seconds // 60}m"
 
         is_error = status not in ["Running", "Succeeded"]
-        
-        return ft.DataRow(
-            cells=[
-                ft.DataCell(ft.Text(namespace)),
-                ft.DataCell(ft.Text(name)),
-                ft.DataCell(ft.Text(controller)),
-                ft.DataCell(ft.Text(status, color=ft.Colors.RED if is_error else ft.Colors.GREEN)),
-                ft.DataCell(ft.Text(age)),
-            ],
-        )
+
+        cells = row.content.controls
+        cells[0].value = namespace
+        cells[1].value = name
+        cells[2].value = controller
+        cells[3].value = status
+        cells[3].color = ft.Colors.RED if is_error else ft.Colors.GREEN
+        cells[4].value = age
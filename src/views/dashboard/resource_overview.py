@@ -1,10 +1,12 @@
 import flet as ft
+from src.services.frame_scheduler import frame_scheduler
 
 class ResourceOverview(ft.Container):
     def __init__(self):
         super().__init__()
         self.padding = 20
 import flet as ft
+from src.services.quantity import to_millicores, to_bytes, parse_count, usage_arrays
 
 class ResourceOverview(ft.Container):
     def __init__(self):
@@ -50,74 +52,19 @@ class ResourceOverview(ft.Container):
         
         # Calculate Capacity from Nodes
         for node in nodes:
-            # CPU
-            cpu = node.status.capacity.get('cpu', '0')
-            if cpu.endswith('m'): total_cpu_capacity += int(cpu[:-1])
-            else: total_cpu_capacity += int(cpu) * 1000
-                
-            # Mem
-            mem = node.status.capacity.get('memory', '0')
-            if mem.endswith('Ki'): total_mem_capacity += int(mem[:-2]) * 1024
-            elif mem.endswith('Mi'): total_mem_capacity += int(mem[:-2]) * 1024 * 1024
-            elif mem.endswith('Gi'): total_mem_capacity += int(mem[:-2]) * 1024 * 1024 * 1024
-            else:
-                 try: total_mem_capacity += int(mem)
-                 except: pass
-            
-            # Pods
-            pods = node.status.capacity.get('pods', '0')
-            try: total_pods_capacity += int(pods)
-            except: pass
-
-            # Ephemeral Storage
-            storage = node.status.capacity.get('ephemeral-storage', '0')
-            if storage.endswith('Ki'): total_storage_capacity += int(storage[:-2]) * 1024
-            elif storage.endswith('Mi'): total_storage_capacity += int(storage[:-2]) * 1024 * 1024
-            elif storage.endswith('Gi'): total_storage_capacity += int(storage[:-2]) * 1024 * 1024 * 1024
-            else:
-                 try: total_storage_capacity += int(storage)
-                 except: pass
+            total_cpu_capacity += to_millicores(node.capacity.get('cpu'))
+            total_mem_capacity += to_bytes(node.capacity.get('memory'))
+            total_pods_capacity += parse_count(node.capacity.get('pods'))
+            total_storage_capacity += to_bytes(node.capacity.get('ephemeral-storage'))
 
         # Calculate Usage from Node Metrics
-        for node_name, metrics in node_metrics.items():
-            usage = metrics.get('usage', {})
-            
-            # CPU
-            cpu_str = usage.get('cpu', '0')
-            val = 0
-            if cpu_str.endswith('n'): val = int(cpu_str[:-1]) / 1000000
-            elif cpu_str.endswith('u'): val = int(cpu_str[:-1]) / 1000
-            elif cpu_str.endswith('m'): val = int(cpu_str[:-1])
-            else: 
-                try: val = int(cpu_str) * 1000
-                except: pass
-            total_cpu_usage += val
-            
-            # Mem
-            mem_str = usage.get('memory', '0')
-            val_mem = 0
-            if mem_str.endswith('Ki'): val_mem = int(mem_str[:-2]) * 1024
-            elif mem_str.endswith('Mi'): val_mem = int(mem_str[:-2]) * 1024 * 1024
-            elif mem_str.endswith('Gi'): val_mem = int(mem_str[:-2]) * 1024 * 1024 * 1024
-            else:
-                try: val_mem = int(mem_str)
-                except: pass
-            total_mem_usage += val_mem
+        _, cpu_usage, mem_usage = usage_arrays(node_metrics)
+        total_cpu_usage = sum(cpu_usage)
+        total_mem_usage = sum(mem_usage)
 
-            # Storage (if available in metrics, usually not in standard kubectl top node, but let's check)
-            # Standard metrics.k8s.io usually doesn't provide ephemeral-storage usage for nodes directly in the same way.
-            # However, if it's there, it would be 'ephemeral-storage'. 
-            # If not, we might default to 0 or try to sum pod usage if we had it.
-            # Let's try to read it from node metrics if present.
-            storage_str = usage.get('ephemeral-storage', '0')
-            val_storage = 0
-            if storage_str.endswith('Ki'): val_storage = int(storage_str[:-2]) * 1024
-            elif storage_str.endswith('Mi'): val_storage = int(storage_str[:-2]) * 1024 * 1024
-            elif storage_str.endswith('Gi'): val_storage = int(storage_str[:-2]) * 1024 * 1024 * 1024
-            else:
-                try: val_storage = int(storage_str)
-                except: pass
-            total_storage_usage += val_storage
+        # Storage (if available in metrics, usually not in standard kubectl top node, but let's check)
+        # Standard metrics.k8s.io usually doesn't provide ephemeral-storage usage for nodes directly in the same way.
+        total_storage_usage = sum(to_bytes(m.get('usage', {}).get('ephemeral-storage')) for m in node_metrics.values())
 
         # Pod Usage
         total_pods_usage = len(all_pods)
@@ -148,4 +95,4 @@ class ResourceOverview(ft.Container):
         # self.content.controls[6].controls[1].value = 0
         # self.content.controls[6].controls[2].value = "N/A"
         
-        self.update()
+        frame_scheduler.request(self)
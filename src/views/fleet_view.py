@@ -0,0 +1,117 @@
+import flet as ft
+from src.services.frame_scheduler import frame_scheduler
+from src.services.kube_service import kube_service
+from src.services.fleet import collect_fleet
+from src.services.scheduler import scheduler
+
+class FleetView(ft.Container):
+    """One summary row per kube context, collected from all clusters at once."""
+
+    def __init__(self, interval=30):
+        super().__init__()
+        self.expand = True
+        self.padding = 20
+        self.running = False
+        self.interval = interval
+        self._rows = {}
+
+        self.status_text = ft.Text("", size=12, color=ft.Colors.OUTLINE)
+        self.data_table = ft.DataTable(
+            columns=[
+                ft.DataColumn(ft.Text("Cluster")),
+                ft.DataColumn(ft.Text("Status")),
+                ft.DataColumn(ft.Text("Nodes Ready"), numeric=True),
+                ft.DataColumn(ft.Text("Running"), numeric=True),
+                ft.DataColumn(ft.Text("Pending"), numeric=True),
+                ft.DataColumn(ft.Text("Failed"), numeric=True),
+                ft.DataColumn(ft.Text("CPU")),
+                ft.DataColumn(ft.Text("Memory")),
+                ft.DataColumn(ft.Text("Latency"), numeric=True),
+            ],
+            rows=[]
+        )
+
+        self.content = ft.Column(
+            [
+                ft.Row(
+                    [
+                        ft.Text("Fleet", size=24, weight=ft.FontWeight.BOLD),
+                        self.status_text,
+                    ],
+                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+                ),
+                ft.Divider(),
+                ft.Row([self.data_table], scroll=ft.ScrollMode.AUTO),
+            ],
+            scroll=ft.ScrollMode.AUTO,
+            expand=True
+        )
+
+    def did_mount(self):
+        self.running = True
+        self._job = scheduler.add("fleet", self._refresh, self.interval, owner=self)
+
+    def will_unmount(self):
+        self.running = False
+        scheduler.remove(self._job)
+
+    def _refresh(self):
+        contexts = kube_service.contexts
+        # Keep rows in context order; each is filled in as its cluster answers
+        for ctx in contexts:
+            if ctx['name'] not in self._rows:
+                self._rows[ctx['name']] = self._build_pending_row(ctx['name'])
+        self._rows = {ctx['name']: self._rows[ctx['name']] for ctx in contexts}
+        self.data_table.rows = list(self._rows.values())
+        self.status_text.value = f"Collecting {len(contexts)} clusters..."
+        frame_scheduler.request(self)
+
+        reachable = 0
+        for summary in collect_fleet(contexts):
+            reachable += summary.reachable
+            self._fill_row(self._rows[summary.context], summary)
+            frame_scheduler.request(self.data_table)
+
+        self.status_text.value = f"{reachable}/{len(contexts)} clusters reachable"
+        frame_scheduler.request(self)
+
+    def _build_pending_row(self, name):
+        cells = [ft.DataCell(ft.Text(name, weight=ft.FontWeight.BOLD))]
+        cells += [ft.DataCell(ft.Text("...")) for _ in range(len(self.data_table.columns) - 1)]
+        return ft.DataRow(cells=cells)
+
+    def _fill_row(self, row, summary):
+        values = row.cells
+        if not summary.reachable:
+            values[1].content = ft.Row(
+                [
+                    ft.Icon(ft.Icons.CLOUD_OFF, color=ft.Colors.RED, size=16),
+                    ft.Text("Unreachable", color=ft.Colors.RED, tooltip=summary.error),
+                ],
+                spacing=5
+            )
+            for cell in values[2:8]:
+                cell.content = ft.Text("-")
+        else:
+            healthy = summary.nodes_ready == summary.nodes_total and not summary.pod_phases.get("Failed")
+            color = ft.Colors.GREEN if healthy else ft.Colors.ORANGE
+            values[1].content = ft.Row(
+                [ft.Icon(ft.Icons.CIRCLE, color=color, size=12), ft.Text("Healthy" if healthy else "Degraded", color=color)],
+                spacing=5
+            )
+            values[2].content = ft.Text(f"{summary.nodes_ready}/{summary.nodes_total}")
+            values[3].content = ft.Text(str(summary.pod_phases.get("Running", 0)))
+            values[4].content = ft.Text(str(summary.pod_phases.get("Pending", 0)))
+            values[5].content = ft.Text(str(summary.pod_phases.get("Failed", 0)))
+            values[6].content = self._build_usage_bar(summary.cpu_percent, ft.Colors.BLUE)
+            values[7].content = self._build_usage_bar(summary.memory_percent, ft.Colors.GREEN)
+        values[8].content = ft.Text(f"{summary.elapsed:.1f}s" if summary.elapsed is not None else "-")
+
+    def _build_usage_bar(self, value, color):
+        return ft.Row(
+            [
+                ft.ProgressBar(value=min(value, 1.0), color=color, bgcolor=ft.Colors.with_opacity(0.1, color), width=80),
+                ft.Text(f"{int(value * 100)}%", color=color),
+            ],
+            spacing=5
+        )
@@ -1,54 +1,172 @@
 import flet as ft
+from src.services.executor import shared_executor
+from src.services.frame_scheduler import frame_scheduler
 from src.services.kube_service import kube_service
+from src.services.prefetch import prefetcher
+from src.services.summaries import ContainerSummary
+from src.services.quantity import container_totals, format_cpu, format_memory
 from src.views.tabs.pods_tab import PodsTab
 from src.views.tabs.logs_tab import LogsTab
 from src.views.tabs.yaml_tab import YamlTab
+from src.views.tabs.metrics_tab import MetricsTab
 import datetime
+import threading
+
+def build_skeleton(lines=6):
+    """Grey placeholder bars shown where content is still loading."""
+    return ft.Container(
+        content=ft.Column(
+            [
+                ft.Container(
+                    height=16,
+                    width=None if i % 3 else 240,
+                    bgcolor=ft.Colors.SURFACE_CONTAINER_HIGHEST,
+                    border_radius=4,
+                )
+                for i in range(lines)
+            ],
+            spacing=12,
+        ),
+        padding=20,
+    )
+
 
 class ResourceView(ft.Container):
+    """Details of one workload; shown at once, with every tab loaded on first selection.
+
+    The header and info bar are drawn from the informer cache or the prefetcher
+    when either has the object; otherwise the info bar fills in once the object has been read, in
+    one read shared by the tabs. A tab starts as a skeleton and is built and loaded on the shared
+    executor the first time it is selected. Prefetched data is only drawn first:
+    the object is still read and a tab that showed prefetched data is loaded once
+    more, so the view never stays on what may be ttl seconds old. Loads still
+    queued or running when the view is left are cancelled, and their results dropped.
+    """
+
+    # (title, icon, tab class)
+    TABS = [
+        ("Pods", ft.Icons.APPS, PodsTab),
+        ("Logs", ft.Icons.TERMINAL, LogsTab),
+        ("YAML", ft.Icons.CODE, YamlTab),
+        ("Metrics", ft.Icons.SHOW_CHART, MetricsTab),
+    ]
+
+    KINDS = {"deployment": "deployments", "cronjob": "cronjobs"}
+
     def __init__(self, resource_type, resource_name, namespace):
         super().__init__()
         self.resource_type = resource_type
         self.resource_name = resource_name
         self.namespace = namespace
         self.expand = True
-        
-        # Fetch resource object for InfoBar
-        self.resource_obj = self._fetch_resource()
+
+        self._closed = threading.Event()
+        self._loads = {}  # tab index -> Future
+        self._resource_lock = threading.Lock()  # Tabs loading together share one read
+
+        # The informer keeps its copy current, so with one there is nothing to read;
+        # otherwise a prefetched copy is drawn until the object has been read again
+        self.resource_obj = None
+        if resource_type in self.KINDS:
+            self.resource_obj = kube_service.cached_object(self.KINDS[resource_type], resource_name, namespace)
+        self._resource_loaded = self.resource_obj is not None  # True once it is current
+        if self.resource_obj is None:
+            entry = prefetcher.get(resource_type, resource_name, namespace)
+            self.resource_obj = entry.resource if entry else None
 
         self.tabs = ft.Tabs(
             selected_index=0,
             animation_duration=300,
             tabs=[
-                ft.Tab(
-                    text="Pods",
-                    icon=ft.Icons.APPS,
-                    content=PodsTab(resource_type, resource_name, namespace),
-                ),
-                ft.Tab(
-                    text="Logs",
-                    icon=ft.Icons.TERMINAL,
-                    content=LogsTab(resource_type, resource_name, namespace),
-                ),
-                ft.Tab(
-                    text="YAML",
-                    icon=ft.Icons.CODE,
-                    content=YamlTab(resource_type, resource_name, namespace),
-                ),
+                ft.Tab(text=title, icon=icon, content=build_skeleton())
+                for title, icon, _ in self.TABS
             ],
+            on_change=lambda e: self._load_tab(self.tabs.selected_index),
             expand=True,
         )
 
+        self.info_bar = ft.Container(
+            content=self._build_info_bar() if self.resource_obj else build_skeleton(lines=1)
+        )
         self.content = ft.Column(
             [
                 self._build_header(),
-                self._build_info_bar(),
+                self.info_bar,
                 self.tabs
             ],
             expand=True,
             spacing=0
         )
 
+    def did_mount(self):
+        prefetcher.opened(self.resource_type, self.resource_name, self.namespace)
+        if not self._resource_loaded:
+            self._loads["info_bar"] = shared_executor.submit(self._load_info_bar)
+        self._load_tab(self.tabs.selected_index)
+
+    def will_unmount(self):
+        self._closed.set()
+        for future in self._loads.values():
+            # Queued loads never start; running ones finish unobserved
+            future.cancel()
+
+    def _load_tab(self, index):
+        if index not in self._loads and not self._closed.is_set():
+            self._loads[index] = shared_executor.submit(self._build_tab, index)
+
+    def _build_tab(self, index):
+        title, _, tab_class = self.TABS[index]
+        prefetched = False
+        try:
+            # A prefetched object is drawn from as it is, the reload below brings the current one
+            resource = self.resource_obj if self.resource_obj is not None else self._get_resource()
+            if self._closed.is_set():
+                return
+            tab = tab_class(self.resource_type, self.resource_name, self.namespace, resource=resource)
+            prefetched = tab.load()
+        except Exception as e:
+            print(f"Error loading {title} tab: {e}")
+            tab = ft.Container(content=ft.Text(f"Error loading {title}: {e}", color=ft.Colors.RED), padding=20)
+        if self._closed.is_set():
+            return
+        self.tabs.tabs[index].content = tab
+        frame_scheduler.request(self.tabs)
+        if prefetched:
+            self._reload_tab(tab, title)
+
+    def _reload_tab(self, tab, title):
+        try:
+            tab.resource = self._get_resource()
+            if self._closed.is_set():
+                return
+            tab.load(prefetched=False)
+        except Exception as e:
+            print(f"Error reloading {title} tab: {e}")
+            return
+        if not self._closed.is_set():
+            frame_scheduler.request(tab)
+
+    def _load_info_bar(self):
+        try:
+            self._get_resource()
+            info_bar = self._build_info_bar()
+        except Exception as e:
+            print(f"Error loading {self.resource_type} {self.resource_name}: {e}")
+            info_bar = ft.Container()
+        if self._closed.is_set():
+            return
+        self.info_bar.content = info_bar
+        frame_scheduler.request(self.info_bar)
+
+    def _get_resource(self):
+        with self._resource_lock:
+            if not self._resource_loaded and not self._closed.is_set():
+                resource = self._fetch_resource()
+                self._resource_loaded = True
+                if resource is not None:
+                    self.resource_obj = resource
+            return self.resource_obj
+
     def _fetch_resource(self):
         if self.resource_type == "deployment":
             return kube_service.get_deployment(self.resource_name, self.namespace)
@@ -85,7 +203,7 @@ class ResourceView(ft.Container):
             info_items.append(self._build_info_chip("Replicas", replicas, ft.Icons.COPY_ALL))
             
             # Strategy
-            strategy = self.resource_obj.spec.strategy.type
+            strategy = self.resource_obj.spec.strategy.type if self.resource_obj.spec.strategy else "-"
             info_items.append(self._build_info_chip("Strategy", strategy, ft.Icons.SHUFFLE))
             
             # Images
@@ -111,7 +229,7 @@ class ResourceView(ft.Container):
             containers = self.resource_obj.spec.job_template.spec.template.spec.containers
 
         # Resources (CPU/Memory)
-        cpu_req, cpu_lim, mem_req, mem_lim = self._calculate_resources(containers)
+        cpu_req, cpu_lim, mem_req, mem_lim = self._calculate_resources([ContainerSummary.from_model(c) for c in containers])
         
         if cpu_req or cpu_lim:
             val = f"{cpu_req or '-'} / {cpu_lim or '-'}"
@@ -128,28 +246,8 @@ class ResourceView(ft.Container):
         )
 
     def _calculate_resources(self, containers):
-        # Simple string concatenation for now, or just taking the first if multiple
-        # Real parsing is complex without a library
-        cpu_reqs = []
-        cpu_lims = []
-        mem_reqs = []
-        mem_lims = []
-        
-        for c in containers:
-            resources = c.resources
-            if resources:
-                if resources.requests:
-                    if 'cpu' in resources.requests: cpu_reqs.append(resources.requests['cpu'])
-                    if 'memory' in resources.requests: mem_reqs.append(resources.requests['memory'])
-                if resources.limits:
-                    if 'cpu' in resources.limits: cpu_lims.append(resources.limits['cpu'])
-                    if 'memory' in resources.limits: mem_lims.append(resources.limits['memory'])
-        
-        # Helper to join unique values
-        def join_vals(vals):
-            return "+".join(set(vals)) if vals else None
-
-        return join_vals(cpu_reqs), join_vals(cpu_lims), join_vals(mem_reqs), join_vals(mem_lims)
+        cpu_req, cpu_lim, mem_req, mem_lim = container_totals(containers)
+        return format_cpu(cpu_req), format_cpu(cpu_lim), format_memory(mem_req), format_memory(mem_lim)
 
     def _build_info_chip(self, label, value, icon):
         return ft.Container(
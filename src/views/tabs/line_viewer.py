@@ -0,0 +1,166 @@
+import contextlib
+import flet as ft
+from src.services.frame_scheduler import frame_scheduler
+from functools import lru_cache
+from itertools import islice
+import re
+
+LOG_LEVEL_COLORS = {
+    "ERROR": ft.Colors.RED_400,
+    "FATAL": ft.Colors.RED_400,
+    "WARN": ft.Colors.AMBER_400,
+    "WARNING": ft.Colors.AMBER_400,
+    "INFO": ft.Colors.GREEN_400,
+    "DEBUG": ft.Colors.BLUE_GREY_300,
+}
+LOG_LEVEL_RE = re.compile(r"\b(ERROR|FATAL|WARN|WARNING|INFO|DEBUG)\b")
+TIMESTAMP_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\S+\s")
+YAML_KEY_RE = re.compile(r"^(\s*(?:- )?)([^\s:#][^:#]*?):(\s|$)")
+
+class LineViewer(ft.Container):
+    """Virtualized read-only monospace view over a backing sequence of lines.
+
+    Only window_size rows exist as controls. They sit in a fixed-extent ListView
+    and show lines[start:start + window_size]; when a scroll gets close to either
+    edge the window slides by half its size and the offset is moved back by the
+    same amount, so the client only ever lays out one window. Lines are
+    highlighted when they become visible; a highlighter maps a line to a tuple
+    of (text, color, bold) segments, or None for plain text, and should be cached.
+    A buffer that another thread changes needs a lock, held by that thread while
+    it changes the buffer and by the viewer while it reads the window.
+    """
+
+    def __init__(self, highlighter=None, line_height=18, window_size=200, font_size=12, lock=None):
+        super().__init__()
+        self.expand = True
+        self.bgcolor = ft.Colors.BLACK
+        self.padding = 10
+        self.border_radius = 5
+
+        self.lines = []
+        self.start = 0
+        self.line_height = line_height
+        self.window_size = window_size
+        self.font_size = font_size
+        self.highlighter = highlighter
+        self.lock = lock or contextlib.nullcontext()
+        self._at_bottom = True
+
+        self._rows = [self._build_row() for _ in range(window_size)]
+        self.list_view = ft.ListView(
+            controls=[],
+            item_extent=line_height,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=50,
+            expand=True,
+        )
+        self.position_text = ft.Text("", size=10, color=ft.Colors.OUTLINE)
+        self.content = ft.Column(
+            [
+                self.list_view,
+                ft.Row([self.position_text], alignment=ft.MainAxisAlignment.END),
+            ],
+            expand=True,
+            spacing=2
+        )
+
+    def _build_row(self):
+        return ft.Text("", font_family="monospace", size=self.font_size, color=ft.Colors.WHITE, selectable=True, no_wrap=True)
+
+    def set_lines(self, lines, at_end=False):
+        """Replaces the backing buffer, any sequence of str (list, deque), showing its start or its end."""
+        self.lines = lines
+        self.start = max(0, len(lines) - self.window_size) if at_end else 0
+        self._at_bottom = at_end
+        self._render()
+
+    def lines_changed(self):
+        """Call after the backing buffer grew or was trimmed; sticks to the end if it was showing."""
+        if self._at_bottom:
+            self.start = max(0, len(self.lines) - self.window_size)
+            self._render()
+            self.list_view.scroll_to(offset=-1, duration=0)
+        else:
+            self.start = min(self.start, max(0, len(self.lines) - self.window_size))
+            self._render()
+
+    def _render(self):
+        with self.lock:
+            visible = list(islice(self.lines, self.start, self.start + self.window_size))
+            total = len(self.lines)
+        for row, line in zip(self._rows, visible):
+            if row.data != line:
+                row.data = line
+                self._paint(row, line)
+        if len(self.list_view.controls) != len(visible):
+            self.list_view.controls = self._rows[:len(visible)]
+
+        if visible:
+            self.position_text.value = f"Lines {self.start + 1}-{self.start + len(visible)} of {total}"
+        else:
+            self.position_text.value = ""
+
+    def _paint(self, row, line):
+        segments = self.highlighter(line) if self.highlighter else None
+        if segments:
+            row.value = None
+            row.spans = [
+                ft.TextSpan(text, style=ft.TextStyle(color=color, weight=ft.FontWeight.BOLD if bold else None))
+                for text, color, bold in segments
+            ]
+        else:
+            row.value = line
+            row.spans = None
+
+    def _on_scroll(self, e):
+        if e.pixels is None or e.max_scroll_extent is None:
+            return
+        extent = self.line_height
+        shift = 0
+        if e.pixels < self.window_size // 4 * extent and self.start > 0:
+            shift = -min(self.start, self.window_size // 2)
+        elif e.pixels > e.max_scroll_extent - self.window_size // 4 * extent:
+            shift = min(len(self.lines) - self.start - self.window_size, self.window_size // 2)
+            shift = max(shift, 0)
+        self._at_bottom = shift == 0 and e.pixels >= e.max_scroll_extent - extent
+
+        if shift:
+            self.start += shift
+            self._render()
+            self.list_view.scroll_to(offset=max(0, e.pixels - shift * extent), duration=0)
+            frame_scheduler.request(self)
+
+
+@lru_cache(maxsize=4096)
+def highlight_log_line(line):
+    """Dims a leading RFC3339 timestamp and colors the first log level keyword."""
+    segments = []
+    timestamp = TIMESTAMP_RE.match(line)
+    if timestamp:
+        segments.append((timestamp.group(0), ft.Colors.OUTLINE, False))
+        line = line[timestamp.end():]
+
+    level = LOG_LEVEL_RE.search(line)
+    if not level:
+        return tuple(segments) + ((line, None, False),) if segments else None
+
+    segments.append((line[:level.start()], None, False))
+    segments.append((level.group(0), LOG_LEVEL_COLORS[level.group(0)], True))
+    segments.append((line[level.end():], None, False))
+    return tuple(segments)
+
+
+@lru_cache(maxsize=4096)
+def highlight_yaml_line(line):
+    """Colors mapping keys and comments, enough for kubectl-style YAML."""
+    if line.lstrip().startswith("#"):
+        return ((line, ft.Colors.OUTLINE, False),)
+
+    key = YAML_KEY_RE.match(line)
+    if not key:
+        return None
+    return (
+        (key.group(1), None, False),
+        (key.group(2), ft.Colors.CYAN_300, False),
+        (line[key.end(2):], None, False),
+    )
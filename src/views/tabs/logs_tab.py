@@ -1,61 +1,286 @@
 import flet as ft
+from kubernetes.client.rest import ApiException
+from src.services.executor import shared_executor
+from src.services.frame_scheduler import frame_scheduler
 from src.services.kube_service import kube_service
+from src.services.log_aggregator import LogAggregator
+from src.services.prefetch import prefetcher
+from src.services.scheduler import scheduler
+from src.views.tabs.line_viewer import LineViewer, highlight_log_line
+
+from collections import deque
+import threading
+import time
+
+# Tail options in lines, None streams the whole log
+TAIL_OPTIONS = {"100": 100, "500": 500, "1000": 1000, "All": None}
+SINCE_OPTIONS = {"All": None, "5m": 300, "1h": 3600, "24h": 86400}
+ALL_PODS = "All pods"
+ALL_CONTAINERS = "All containers"
 
 class LogsTab(ft.Container):
-    def __init__(self, resource_type, resource_name, namespace):
+    """Streams the log of one pod container into a bounded ring buffer of lines."""
+
+    def __init__(self, resource_type, resource_name, namespace, max_lines=5000, flush_interval=0.25, resource=None):
         super().__init__()
         self.resource_type = resource_type
         self.resource_name = resource_name
         self.namespace = namespace
+        self.resource = resource  # Already fetched object, saves load() a read
         self.padding = 10
-        
+        self.expand = True
+
+        # Oldest lines fall off once max_lines is reached
+        self.lines = deque(maxlen=max_lines)
+        self._lines_lock = threading.Lock()  # lines change on the scheduler thread while the viewer reads them
+        self._pending = deque()
+        self._max_pending = max_lines
+        self._stream = None
+        self._stream_lock = threading.Lock()  # Streams are started from events, reloads and did_mount
+        self._pods = {}
+        self._flush_interval = flush_interval
+        self._seed_lines = None  # Prefetched tail shown while the first stream connects
+        self._seeded = False
+        self.running = False
+
         self.pod_selector = ft.Dropdown(
             label="Select Pod",
             options=[],
             on_change=self.on_pod_change,
             width=300
         )
-        
-        self.logs_view = ft.Markdown(
-            "",
-            selectable=True,
-            extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
-            code_theme="atom-one-dark",
+        self.container_selector = ft.Dropdown(
+            label="Container",
+            options=[],
+            on_change=self.on_options_change,
+            width=200
+        )
+        self.tail_selector = ft.Dropdown(
+            label="Tail",
+            value="500",
+            options=[ft.dropdown.Option(name) for name in TAIL_OPTIONS],
+            on_change=self.on_options_change,
+            width=100
         )
-        
+        self.since_selector = ft.Dropdown(
+            label="Since",
+            value="All",
+            options=[ft.dropdown.Option(name) for name in SINCE_OPTIONS],
+            on_change=self.on_options_change,
+            width=100
+        )
+        self.follow_switch = ft.Switch(label="Follow", value=True, on_change=self.on_options_change)
+        self.timestamps_checkbox = ft.Checkbox(label="Timestamps", value=False, on_change=self.on_options_change)
+        self.status_text = ft.Text("", size=12, color=ft.Colors.OUTLINE)
+
+        self.logs_view = LineViewer(highlighter=highlight_log_line, lock=self._lines_lock)
+        self.logs_view.set_lines(self.lines, at_end=True)
+
         self.content = ft.Column(
             [
-                self.pod_selector,
-                ft.Container(
-                    content=self.logs_view,
-                    bgcolor=ft.Colors.BLACK,
-                    padding=10,
-                    border_radius=5,
-                    expand=True,
-                )
+                ft.Row(
+                    [
+                        self.pod_selector,
+                        self.container_selector,
+                        self.tail_selector,
+                        self.since_selector,
+                        self.follow_switch,
+                        self.timestamps_checkbox,
+                    ],
+                    wrap=True
+                ),
+                self.status_text,
+                self.logs_view,
             ],
             expand=True
         )
-        self._load_pods()
 
-    def _load_pods(self):
+    def load(self, prefetched=True):
+        """Fetches the pods to pick from; blocking, called off the UI thread before the tab is shown.
+
+        The log itself only starts streaming once the tab is mounted; a prefetched
+        tail of the same pod and container is shown until the stream's own arrives.
+        Returns True if the pods were prefetched, see PodsTab.load; loading them
+        again moves the stream to another pod only if the one shown is gone.
+        """
+        entry = prefetcher.get(self.resource_type, self.resource_name, self.namespace) if prefetched else None
+        if entry is None:
+            shown = self.pod_selector.value
+            self._load_pods()
+            if shown is not None and self.pod_selector.value != shown and self.running:
+                self._start_stream()
+            return False
+
+        self._load_pods(entry.pods)
+        if entry.log_tail is not None and \
+                (entry.log_pod, entry.log_container) == (self.pod_selector.value, self.container_selector.value):
+            self._seed_lines = entry.log_tail
+        return True
+
+    def did_mount(self):
+        self.running = True
+        self._flush_job = scheduler.add(
+            f"logs_tab.{self.namespace}/{self.resource_name}", self._flush, self._flush_interval,
+            jitter=0, min_gap=0, owner=self
+        )
+        # Opening the log request is a round trip, keep it off the UI thread
+        shared_executor.submit(self._start_stream)
+
+    def will_unmount(self):
+        self.running = False
+        scheduler.remove(self._flush_job)
+        # Not under _stream_lock, which a stream being opened holds for a round trip;
+        # _open_stream checks running again once its stream is stored
+        self._stop_stream()
+
+    def _load_pods(self, pods=None):
         selector_str = ""
-        if self.resource_type == "deployment":
-            dep = kube_service.get_deployment(self.resource_name, self.namespace)
+        if self.resource_type == "deployment" and pods is None:
+            dep = self.resource or kube_service.get_deployment(self.resource_name, self.namespace)
             if dep and dep.spec.selector.match_labels:
                 selector_str = ",".join([f"{k}={v}" for k, v in dep.spec.selector.match_labels.items()])
-        
-        if selector_str:
+
+        if pods is None and selector_str:
             pods = kube_service.list_pods(selector_str, self.namespace)
+        if pods is not None:
+            self._pods = {pod.metadata.name: pod for pod in pods}
             self.pod_selector.options = [ft.dropdown.Option(pod.metadata.name) for pod in pods]
-            if pods:
-                self.pod_selector.value = pods[0].metadata.name
-                self._load_logs(pods[0].metadata.name)
+            if len(pods) > 1:
+                self.pod_selector.options.insert(0, ft.dropdown.Option(ALL_PODS))
+            # A reload keeps the pod picked before if it is still there
+            value = self.pod_selector.value
+            if value not in self._pods and not (value == ALL_PODS and len(pods) > 1):
+                self.pod_selector.value = pods[0].metadata.name if pods else None
+                self._load_containers()
+
+    def _load_containers(self):
+        if self.pod_selector.value == ALL_PODS:
+            pods = list(self._pods.values())
+        else:
+            pods = [self._pods[self.pod_selector.value]] if self.pod_selector.value in self._pods else []
+        names = list(dict.fromkeys(c.name for pod in pods for c in pod.spec.containers))
+        self.container_selector.options = [ft.dropdown.Option(name) for name in names]
+        self.container_selector.value = names[0] if names else None
+        if self.pod_selector.value == ALL_PODS and len(names) > 1:
+            self.container_selector.options.insert(0, ft.dropdown.Option(ALL_CONTAINERS))
 
     def on_pod_change(self, e):
-        self._load_logs(self.pod_selector.value)
-        self.update()
+        self._load_containers()
+        self._start_stream()
+
+    def on_options_change(self, e):
+        self._start_stream()
+
+    def _start_stream(self):
+        with self._stream_lock:
+            self._open_stream()
+        frame_scheduler.request(self)
+
+    def _open_stream(self):
+        self._stop_stream()
+        self._pending.clear()
+        # Only the first stream uses the seed, its options are the defaults the tail was read with
+        seed, self._seed_lines = self._seed_lines, None
+        self._seeded = bool(seed)
+        with self._lines_lock:
+            self.lines.clear()
+            if seed:
+                self.lines.extend(seed)
+        self.logs_view.set_lines(self.lines, at_end=True)
+        pod_name = self.pod_selector.value
+        if not pod_name or not self.running:
+            self.status_text.value = "No pod selected." if not pod_name else ""
+            return
+        if pod_name == ALL_PODS:
+            self._start_aggregate()
+            return
+
+        try:
+            stream = kube_service.stream_pod_logs(
+                pod_name,
+                self.namespace,
+                container=self.container_selector.value,
+                follow=self.follow_switch.value,
+                tail_lines=TAIL_OPTIONS[self.tail_selector.value],
+                since_seconds=SINCE_OPTIONS[self.since_selector.value],
+                timestamps=self.timestamps_checkbox.value,
+            )
+        except ApiException as e:
+            print(f"Error streaming pod logs: {e}")
+            self.status_text.value = f"Error: {e.reason}"
+            return
+        self._stream = stream
+        if not self.running:
+            # Left while the request was being opened
+            self._stop_stream()
+            return
+        self.status_text.value = "Following..." if self.follow_switch.value else ""
+        threading.Thread(target=self._read_stream, args=(stream,), daemon=True).start()
+
+    def _start_aggregate(self):
+        container = self.container_selector.value
+        targets = [
+            (name, c.name)
+            for name, pod in self._pods.items()
+            for c in pod.spec.containers
+            if container in (ALL_CONTAINERS, c.name)
+        ]
+        aggregator = LogAggregator(
+            targets,
+            namespace=self.namespace,
+            follow=self.follow_switch.value,
+            tail_lines=TAIL_OPTIONS[self.tail_selector.value],
+            since_seconds=SINCE_OPTIONS[self.since_selector.value],
+        ).start()
+
+        show_timestamps = self.timestamps_checkbox.value
+        def format_line(entry):
+            timestamp, pod_name, container_name, text = entry
+            prefix = f"{timestamp} " if show_timestamps else ""
+            return f"{prefix}[{pod_name}/{container_name}] {text}"
+
+        self._stream = aggregator
+        self.status_text.value = f"Merging {len(targets) - aggregator.skipped} streams"
+        if aggregator.skipped:
+            self.status_text.value += f", {aggregator.skipped} left out (limit {aggregator.max_workers})"
+        threading.Thread(target=self._read_stream, args=(aggregator, format_line), daemon=True).start()
+
+    def _stop_stream(self):
+        stream, self._stream = self._stream, None
+        if stream:
+            stream.close()
+
+    def _read_stream(self, stream, format_line=None):
+        # Runs off the UI thread; lines are handed over in batches by _flush_loop.
+        # Waiting while the batch is full pushes back on the stream instead of dropping lines.
+        try:
+            for line in stream:
+                while len(self._pending) >= self._max_pending and stream is self._stream:
+                    time.sleep(self._flush_interval)
+                if stream is not self._stream:
+                    break
+                self._pending.append(format_line(line) if format_line else line)
+        except Exception as e:
+            print(f"Error reading pod logs: {e}")
+            if stream is self._stream:
+                self.status_text.value = f"Stream ended: {e}"
+                frame_scheduler.request(self)
+        else:
+            if stream is self._stream and self.follow_switch.value:
+                self.status_text.value = "Stream ended."
+                frame_scheduler.request(self)
 
-    def _load_logs(self, pod_name):
-        logs = kube_service.get_pod_logs(pod_name, self.namespace)
-        self.logs_view.value = f"```log\n{logs}\n```"
+    def _flush(self):
+        if not self._pending:
+            return
+        batch = []
+        while self._pending:
+            batch.append(self._pending.popleft())
+        with self._lines_lock:
+            if self._seeded:
+                # The stream's own tail replaces the prefetched one
+                self._seeded = False
+                self.lines.clear()
+            self.lines.extend(batch)
+        self.logs_view.lines_changed()
+        frame_scheduler.request(self)
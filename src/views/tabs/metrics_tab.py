@@ -0,0 +1,79 @@
+import flet as ft
+from src.services.frame_scheduler import frame_scheduler
+from src.services.metrics_store import metrics_store
+from src.services.quantity import format_cpu, format_memory
+from src.services.scheduler import scheduler
+from src.views.dashboard.cpu_memory_utilization import CpuMemoryUtilization
+
+class MetricsTab(ft.Container):
+    """Usage history of one workload, read from the shared metrics store."""
+
+    def __init__(self, resource_type, resource_name, namespace, resource=None):
+        super().__init__()
+        self.resource_type = resource_type
+        self.resource_name = resource_name
+        self.namespace = namespace
+        self.padding = 10
+        self.running = False
+
+        self.key = f"{namespace}/{resource_name}"
+        self.chart = CpuMemoryUtilization(
+            scope="workload",
+            key=self.key,
+            title=f"{resource_name} Utilization",
+            history_len=60,
+        )
+        self.stats_row = ft.Row(wrap=True, spacing=10, run_spacing=10)
+
+        self.content = ft.Column(
+            [
+                self.stats_row,
+                ft.Container(content=self.chart, height=300),
+            ],
+            scroll=ft.ScrollMode.AUTO,
+            expand=True
+        )
+
+    def load(self):
+        """Reads the history already in the metrics store, so the tab opens filled in."""
+        self.chart.update_data()
+        self._update_stats()
+
+    def did_mount(self):
+        self.running = True
+        self._job = scheduler.add(f"metrics_tab.{self.key}", self._refresh, 5, owner=self)
+
+    def will_unmount(self):
+        self.running = False
+        scheduler.remove(self._job)
+
+    def _refresh(self):
+        self.chart.update_data()
+        self._update_stats()
+        frame_scheduler.request(self)
+
+    def _update_stats(self):
+        series = metrics_store.series("workload", self.key)
+        stats = series.stats() if series else None
+        if not stats:
+            self.stats_row.controls = [ft.Text("No usage recorded for this workload yet.", italic=True)]
+            return
+
+        self.stats_row.controls = [
+            self._build_stat_chip(label, format_cpu(float(stats[stat][0])), format_memory(float(stats[stat][1])))
+            for label, stat in (("Min", "min"), ("Mean", "mean"), ("P95", "p95"), ("Max", "max"))
+        ]
+
+    def _build_stat_chip(self, label, cpu, mem):
+        return ft.Container(
+            content=ft.Column(
+                [
+                    ft.Text(label, size=10, color=ft.Colors.OUTLINE),
+                    ft.Text(f"CPU {cpu}  Mem {mem}", size=12, weight=ft.FontWeight.BOLD),
+                ],
+                spacing=0
+            ),
+            padding=ft.padding.all(8),
+            bgcolor=ft.Colors.SURFACE_CONTAINER_HIGHEST,
+            border_radius=8,
+        )
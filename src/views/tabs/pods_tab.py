@@ -1,13 +1,15 @@
 import flet as ft
 from src.services.kube_service import kube_service
+from src.services.prefetch import prefetcher
 import datetime
 
 class PodsTab(ft.Container):
-    def __init__(self, resource_type, resource_name, namespace):
+    def __init__(self, resource_type, resource_name, namespace, resource=None):
         super().__init__()
         self.resource_type = resource_type
         self.resource_name = resource_name
         self.namespace = namespace
+        self.resource = resource  # Already fetched object, saves load() a read
         self.padding = 10
         
         self.data_table = ft.DataTable(
@@ -27,13 +29,22 @@ class PodsTab(ft.Container):
             ],
             scroll=ft.ScrollMode.AUTO
         )
-        self._load_pods()
 
-    def _load_pods(self):
+    def load(self, prefetched=True):
+        """Fetches the pods unless they were prefetched; blocking, called off the UI thread before the tab is shown.
+
+        Returns True if it drew prefetched pods, which may be ttl seconds old; the
+        caller then loads the tab once more with prefetched=False.
+        """
+        entry = prefetcher.get(self.resource_type, self.resource_name, self.namespace) if prefetched else None
+        self._load_pods(entry.pods if entry else None)
+        return entry is not None
+
+    def _load_pods(self, pods=None):
         # 1. Get the resource to find selector
         selector_str = ""
-        if self.resource_type == "deployment":
-            dep = kube_service.get_deployment(self.resource_name, self.namespace)
+        if self.resource_type == "deployment" and pods is None:
+            dep = self.resource or kube_service.get_deployment(self.resource_name, self.namespace)
             if dep and dep.spec.selector.match_labels:
                 selector_str = ",".join([f"{k}={v}" for k, v in dep.spec.selector.match_labels.items()])
         elif self.resource_type == "cronjob":
@@ -47,8 +58,9 @@ class PodsTab(ft.Container):
             # Let's stick to Deployments for the robust implementation first, and maybe simple prefix for CronJob?
             pass
 
-        if selector_str:
+        if pods is None and selector_str:
             pods = kube_service.list_pods(selector_str, self.namespace)
+        if pods:
             self.data_table.rows = [
                 ft.DataRow(
                     cells=[
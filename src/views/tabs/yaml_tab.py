@@ -1,45 +1,49 @@
 import flet as ft
 from src.services.kube_service import kube_service
+from src.services.prefetch import prefetcher
+from src.views.tabs.line_viewer import LineViewer, highlight_yaml_line
 
 class YamlTab(ft.Container):
-    def __init__(self, resource_type, resource_name, namespace):
+    def __init__(self, resource_type, resource_name, namespace, resource=None):
         super().__init__()
         self.resource_type = resource_type
         self.resource_name = resource_name
         self.namespace = namespace
+        self.resource = resource  # Already fetched object, saves load() a read
         self.padding = 10
         
-        self.yaml_view = ft.Markdown(
-            "",
-            selectable=True,
-            extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
-            code_theme="atom-one-dark",
-        )
+        self.expand = True
+
+        self.yaml_view = LineViewer(highlighter=highlight_yaml_line)
         
         self.content = ft.Column(
             [
-                ft.Container(
-                    content=self.yaml_view,
-                    bgcolor=ft.Colors.BLACK,
-                    padding=10,
-                    border_radius=5,
-                    expand=True, # Allow scrolling
-                )
+                self.yaml_view
             ],
-            scroll=ft.ScrollMode.AUTO,
             expand=True
         )
-        self._load_yaml()
+
+    def load(self, prefetched=True):
+        """Fetches and serializes the object unless prefetched; blocking, called off the UI thread before the tab is shown.
+
+        Returns True if it drew prefetched YAML, see PodsTab.load.
+        """
+        entry = prefetcher.get(self.resource_type, self.resource_name, self.namespace) if prefetched else None
+        if entry:
+            self.yaml_view.set_lines(entry.yaml.splitlines())
+        else:
+            self._load_yaml()
+        return entry is not None
 
     def _load_yaml(self):
-        obj = None
-        if self.resource_type == "deployment":
+        obj = self.resource
+        if obj is None and self.resource_type == "deployment":
             obj = kube_service.get_deployment(self.resource_name, self.namespace)
-        elif self.resource_type == "cronjob":
+        elif obj is None and self.resource_type == "cronjob":
             obj = kube_service.get_cronjob(self.resource_name, self.namespace)
             
         if obj:
             yaml_str = kube_service.get_resource_yaml(obj)
-            self.yaml_view.value = f"```yaml\n{yaml_str}\n```"
+            self.yaml_view.set_lines(yaml_str.splitlines())
         else:
-            self.yaml_view.value = "**Error loading YAML**"
+            self.yaml_view.set_lines(["Error loading YAML"])
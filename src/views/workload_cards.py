@@ -0,0 +1,272 @@
+import collections
+
+import flet as ft
+from src.services.executor import shared_executor
+from src.services.kube_service import kube_service
+from src.services.prefetch import prefetcher
+
+
+# View-models of the controller cards: plain values only, so a refresh can tell
+# whether a card changed by comparing the new model with the one it shows.
+WorkloadModel = collections.namedtuple(
+    "WorkloadModel", ["kind", "name", "replicas", "available", "cpu", "memory", "pods"]
+)  # pods: ((uid, name, phase), ...)
+CronJobModel = collections.namedtuple(
+    "CronJobModel", ["name", "schedule", "suspend", "last_run", "cpu", "memory"]
+)
+
+
+def status_color(available, replicas):
+    if available == replicas:
+        return ft.Colors.GREEN
+    elif available > (replicas * 0.5):
+        return ft.Colors.YELLOW
+    return ft.Colors.RED
+
+
+def phase_color(phase):
+    if phase in ["Running", "Succeeded"]:
+        return ft.Colors.GREEN
+    elif phase == "Pending":
+        return ft.Colors.YELLOW
+    return ft.Colors.RED
+
+
+def build_resource_chip(label, value, icon):
+    """Returns (chip, text) so the value can be patched later."""
+    text = ft.Text(f"{label}: {value}", size=10, weight=ft.FontWeight.BOLD)
+    chip = ft.Container(
+        content=ft.Row(
+            [
+                ft.Icon(icon, size=12, color=ft.Colors.OUTLINE),
+                text,
+            ],
+            spacing=5,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER
+        ),
+        bgcolor=ft.Colors.SURFACE_CONTAINER_HIGHEST,
+        padding=ft.padding.symmetric(horizontal=8, vertical=4),
+        border_radius=4
+    )
+    return chip, text
+
+
+class KeyedGrid(ft.Container):
+    """GridView of cards keyed by object UID, patched in place instead of rebuilt.
+
+    reconcile() takes (key, model) pairs in display order. Cards whose model is
+    unchanged are left alone, changed ones get set_model(), and only new keys
+    build a card, so the controls Flet diffs on update() are the ones that
+    actually differ and the grid keeps its scroll position.
+    """
+
+    def __init__(self, make_card, empty_message, **grid_options):
+        super().__init__()
+        self.make_card = make_card
+        self.grid = ft.GridView(**grid_options)
+        self.empty_text = ft.Text(empty_message)
+        self.cards = {}  # key -> card, card.model is what it shows
+
+    def reconcile(self, items):
+        """Returns True if anything changed, i.e. update() has something to send."""
+        changed = False
+        cards = {}
+        for key, model in items:
+            card = self.cards.get(key)
+            if card is None:
+                card = self.make_card(model)
+                changed = True
+            elif card.model != model:
+                card.set_model(model)
+                changed = True
+            cards[key] = card
+        if changed or list(cards) != list(self.cards):
+            self.grid.controls = list(cards.values())
+            changed = True
+        self.cards = cards
+
+        content = self.grid if cards else self.empty_text
+        if self.content is not content:
+            self.content = content
+            changed = True
+        return changed
+
+
+class WorkloadCard(ft.Card):
+    """Deployment or StatefulSet card; deployments also get the action buttons."""
+
+    def __init__(self, view, model):
+        super().__init__(elevation=3)
+        self.view = view
+        self.model = None
+        self.pod_icons = {}  # pod uid -> Icon
+
+        self.name_text = ft.Text("", size=16, weight=ft.FontWeight.BOLD, overflow=ft.TextOverflow.ELLIPSIS, expand=True)
+        self.replicas_text = ft.Text("", color=ft.Colors.WHITE, weight=ft.FontWeight.BOLD, size=12)
+        self.replicas_badge = ft.Container(
+            content=self.replicas_text,
+            padding=ft.padding.symmetric(horizontal=8, vertical=4),
+            border_radius=12
+        )
+        cpu_chip, self.cpu_text = build_resource_chip("CPU", "", ft.Icons.SPEED)
+        mem_chip, self.mem_text = build_resource_chip("Mem", "", ft.Icons.MEMORY)
+        self.pods_row = ft.Row([], wrap=True, spacing=5, run_spacing=5)
+
+        is_deployment = model.kind == "deployment"
+        controls = [
+            ft.Row(
+                [
+                    # LAYERS for StatefulSet
+                    ft.Icon(ft.Icons.APPS if is_deployment else ft.Icons.LAYERS, size=24, color=ft.Colors.PRIMARY),
+                    self.name_text,
+                    self.replicas_badge,
+                ],
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+            ),
+            ft.Divider(height=10, thickness=1),
+            ft.Row([cpu_chip, mem_chip], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+            ft.Container(height=5),
+            ft.Text("Pods Status", size=12, weight=ft.FontWeight.BOLD),
+            self.pods_row,
+        ]
+        if is_deployment:
+            controls += [
+                ft.Container(expand=True),
+                ft.Divider(height=10, thickness=1),
+                ft.Row(
+                    [
+                        # Handlers read self.model, so they act on what the card shows now
+                        ft.IconButton(
+                            icon=ft.Icons.LINEAR_SCALE,
+                            tooltip="Scale",
+                            icon_color=ft.Colors.BLUE_200,
+                            on_click=lambda _: view._open_scale_dialog(self.model.name, self.model.replicas)
+                        ),
+                        ft.IconButton(
+                            icon=ft.Icons.RESTART_ALT,
+                            tooltip="Restart",
+                            icon_color=ft.Colors.ORANGE_300,
+                            on_click=lambda _: view._restart_deployment(self.model.name)
+                        ),
+                        ft.IconButton(
+                            icon=ft.Icons.EDIT,
+                            tooltip="Edit",
+                            icon_color=ft.Colors.BLUE_GREY_300,
+                            on_click=self._on_edit
+                        ),
+                        ft.IconButton(
+                            icon=ft.Icons.DELETE_OUTLINE,
+                            tooltip="Delete",
+                            icon_color=ft.Colors.RED_300,
+                            on_click=lambda _: view._confirm_delete_deployment(self.model.name)
+                        ),
+                    ],
+                    alignment=ft.MainAxisAlignment.SPACE_EVENLY
+                ),
+            ]
+
+        self.content = ft.Container(
+            content=ft.Column(controls),
+            padding=15,
+            on_click=lambda e: view._on_card_click(self.model.kind, self.model.name),
+            on_hover=self._on_hover,
+            border_radius=10,
+        )
+        self.set_model(model)
+
+    def _on_hover(self, e):
+        # Likely the next click, warm its detail view first
+        if e.data == "true":
+            prefetcher.hover(self.model.kind, self.model.name)
+
+    def _on_edit(self, e):
+        # Reading the deployment is a round trip, keep it off the UI thread
+        shared_executor.submit(self._open_edit_dialog, self.model.name)
+
+    def _open_edit_dialog(self, name):
+        deployment = kube_service.get_deployment(name)
+        page = self.view.page
+        if page is None:
+            return
+        if deployment is None:
+            # Not the Create dialog, the deployment may well still exist
+            page.snack_bar = ft.SnackBar(ft.Text(f"Could not load deployment {name}"))
+            page.snack_bar.open = True
+            page.update()
+            return
+        self.view._open_deployment_dialog(deployment)
+
+    def set_model(self, model):
+        previous = self.model
+        self.model = model
+        self.name_text.value = model.name
+        self.replicas_text.value = f"{model.available}/{model.replicas}"
+        self.replicas_badge.bgcolor = status_color(model.available, model.replicas)
+        self.cpu_text.value = f"CPU: {model.cpu}"
+        self.mem_text.value = f"Mem: {model.memory}"
+        if previous is None or previous.pods != model.pods:
+            self._set_pods(model.pods)
+
+    def _set_pods(self, pods):
+        icons = {}
+        for uid, name, phase in pods:
+            icon = self.pod_icons.get(uid)
+            if icon is None:
+                icon = ft.Icon(ft.Icons.CIRCLE, size=12)
+            icon.color = phase_color(phase)
+            icon.tooltip = f"{name}: {phase}"
+            icons[uid] = icon
+        self.pod_icons = icons
+        self.pods_row.controls = list(icons.values())
+
+
+class CronJobCard(ft.Card):
+    def __init__(self, view, model):
+        super().__init__(elevation=3)
+        self.model = None
+
+        self.name_text = ft.Text("", size=16, weight=ft.FontWeight.BOLD, overflow=ft.TextOverflow.ELLIPSIS, expand=True)
+        self.suspend_icon = ft.Icon(size=20)
+        self.schedule_text = ft.Text("", size=12)
+        self.last_run_text = ft.Text("", size=12)
+        cpu_chip, self.cpu_text = build_resource_chip("CPU", "", ft.Icons.SPEED)
+        mem_chip, self.mem_text = build_resource_chip("Mem", "", ft.Icons.MEMORY)
+
+        self.content = ft.Container(
+            content=ft.Column(
+                [
+                    ft.Row(
+                        [
+                            ft.Icon(ft.Icons.SCHEDULE, size=24, color=ft.Colors.PRIMARY),
+                            self.name_text,
+                            self.suspend_icon,
+                        ],
+                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+                    ),
+                    ft.Divider(height=10, thickness=1),
+                    self.schedule_text,
+                    self.last_run_text,
+                    ft.Container(height=5),
+                    ft.Row([cpu_chip, mem_chip], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                ],
+            ),
+            padding=15,
+            on_click=lambda e: view._on_card_click("cronjob", self.model.name),
+            on_hover=self._on_hover,
+            border_radius=10,
+        )
+        self.set_model(model)
+
+    def _on_hover(self, e):
+        if e.data == "true":
+            prefetcher.hover("cronjob", self.model.name)
+
+    def set_model(self, model):
+        self.model = model
+        self.name_text.value = model.name
+        self.suspend_icon.name = ft.Icons.PAUSE_CIRCLE if model.suspend else ft.Icons.PLAY_CIRCLE
+        self.suspend_icon.color = ft.Colors.GREY if model.suspend else ft.Colors.GREEN
+        self.schedule_text.value = f"Schedule: {model.schedule}"
+        self.last_run_text.value = f"Last Run: {model.last_run}"
+        self.cpu_text.value = f"CPU: {model.cpu}"
+        self.mem_text.value = f"Mem: {model.memory}"
@@ -0,0 +1,39 @@
+import time
+
+from src.services.log_aggregator import LogAggregator, _DONE
+
+
+def _line(second):
+    return f"2024-01-01T00:00:{second:02d}.000000000Z"
+
+
+def test_quiet_source_does_not_pace_a_busy_one():
+    # Not started: the queues are fed directly, as the reader threads would
+    aggregator = LogAggregator([("busy", "app"), ("quiet", "app")], merge_delay=0.2)
+    for i in range(50):
+        timestamp = _line(i)
+        aggregator._put(0, (timestamp, timestamp, "busy", "app", f"line {i}"))
+
+    started = time.monotonic()
+    lines = []
+    for item in aggregator:
+        lines.append(item)
+        if len(lines) == 50:
+            break
+    elapsed = time.monotonic() - started
+    aggregator.close()
+
+    assert [text for _, _, _, text in lines] == [f"line {i}" for i in range(50)]
+    # One merge_delay for the quiet source, not one per line
+    assert elapsed < 1.0
+
+
+def test_lines_are_merged_by_timestamp():
+    aggregator = LogAggregator([("a", "app"), ("b", "app")], merge_delay=0.2)
+    for index, pod, seconds in ((0, "a", (1, 3, 5)), (1, "b", (2, 4))):
+        for second in seconds:
+            timestamp = _line(second)
+            aggregator._put(index, (timestamp, timestamp, pod, "app", str(second)))
+        aggregator._put(index, _DONE)
+
+    assert [text for _, _, _, text in aggregator] == ["1", "2", "3", "4", "5"]